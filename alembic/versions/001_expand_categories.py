@@ -21,7 +21,7 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
-# ── Enum definitions (raw SQL avoids async lifecycle bugs) ───────────
+# ── Enum definitions ─────────────────────────────────────────────────
 
 _PLATFORM_VALUES = ("github", "gitlab", "azure_devops")
 _AUTH_TYPE_VALUES = ("token", "oauth", "pat")
@@ -36,38 +36,51 @@ _CHECK_STATUS_VALUES = ("passed", "failed", "warning", "not_applicable", "error"
 _SCAN_STATUS_VALUES = ("pending", "scanning", "analyzing", "generating_report", "completed", "failed")
 _REPORT_STATUS_VALUES = ("pending", "generating", "completed", "failed")
 
+# Column types shared by upgrade() and downgrade().  create_type=False stops
+# create_table from emitting a second CREATE TYPE for each enum column.
+_PLATFORM_ENUM = PG_ENUM(*_PLATFORM_VALUES, name="platform", create_type=False)
+_AUTHTYPE_ENUM = PG_ENUM(*_AUTH_TYPE_VALUES, name="authtype", create_type=False)
+_CATEGORY_ENUM = PG_ENUM(*_CATEGORY_VALUES, name="category", create_type=False)
+_SEVERITY_ENUM = PG_ENUM(*_SEVERITY_VALUES, name="severity", create_type=False)
+_CHECKSTATUS_ENUM = PG_ENUM(*_CHECK_STATUS_VALUES, name="checkstatus", create_type=False)
+_SCANSTATUS_ENUM = PG_ENUM(*_SCAN_STATUS_VALUES, name="scanstatus", create_type=False)
+_REPORTSTATUS_ENUM = PG_ENUM(*_REPORT_STATUS_VALUES, name="reportstatus", create_type=False)
+_ENUM_TYPES = (
+    _PLATFORM_ENUM,
+    _AUTHTYPE_ENUM,
+    _CATEGORY_ENUM,
+    _SEVERITY_ENUM,
+    _CHECKSTATUS_ENUM,
+    _SCANSTATUS_ENUM,
+    _REPORTSTATUS_ENUM,
+)
 
-def _create_enum_sql(name: str, values: tuple[str, ...]) -> str:
-    vals = ", ".join(f"'{v}'" for v in values)
-    return f"CREATE TYPE {name} AS ENUM ({vals})"
+# (index name, table, column, unique) — built CONCURRENTLY after the tables
+# exist so replaying onto a populated clone never blocks writes.
+_INDEXES = (
+    ("ix_customers_slug", "customers", "slug", True),
+    ("ix_platform_connections_customer_id", "platform_connections", "customer_id", False),
+    ("ix_scans_customer_id", "scans", "customer_id", False),
+    ("ix_scan_repos_scan_id", "scan_repos", "scan_id", False),
+    ("ix_findings_scan_id", "findings", "scan_id", False),
+    ("ix_findings_scan_repo_id", "findings", "scan_repo_id", False),
+    ("ix_scan_scores_scan_id", "scan_scores", "scan_id", False),
+)
 
 
 def upgrade() -> None:
-    # Create enum types via raw SQL to avoid SQLAlchemy async lifecycle issues
+    # checkfirst makes reruns after a partial failure skip existing types;
+    # the dialect quotes every label, so no DDL is built from f-strings.
     conn = op.get_bind()
-    conn.execute(sa.text(_create_enum_sql("platform", _PLATFORM_VALUES)))
-    conn.execute(sa.text(_create_enum_sql("authtype", _AUTH_TYPE_VALUES)))
-    conn.execute(sa.text(_create_enum_sql("category", _CATEGORY_VALUES)))
-    conn.execute(sa.text(_create_enum_sql("severity", _SEVERITY_VALUES)))
-    conn.execute(sa.text(_create_enum_sql("checkstatus", _CHECK_STATUS_VALUES)))
-    conn.execute(sa.text(_create_enum_sql("scanstatus", _SCAN_STATUS_VALUES)))
-    conn.execute(sa.text(_create_enum_sql("reportstatus", _REPORT_STATUS_VALUES)))
-
-    # Reusable column-type references (create_type=False: already created above)
-    platform_col = PG_ENUM(*_PLATFORM_VALUES, name="platform", create_type=False)
-    authtype_col = PG_ENUM(*_AUTH_TYPE_VALUES, name="authtype", create_type=False)
-    category_col = PG_ENUM(*_CATEGORY_VALUES, name="category", create_type=False)
-    severity_col = PG_ENUM(*_SEVERITY_VALUES, name="severity", create_type=False)
-    checkstatus_col = PG_ENUM(*_CHECK_STATUS_VALUES, name="checkstatus", create_type=False)
-    scanstatus_col = PG_ENUM(*_SCAN_STATUS_VALUES, name="scanstatus", create_type=False)
-    reportstatus_col = PG_ENUM(*_REPORT_STATUS_VALUES, name="reportstatus", create_type=False)
+    for enum_type in _ENUM_TYPES:
+        enum_type.create(conn, checkfirst=True)
 
     # customers
     op.create_table(
         "customers",
         sa.Column("id", UUID(as_uuid=True), primary_key=True),
         sa.Column("name", sa.String, nullable=False),
-        sa.Column("slug", sa.String, nullable=False, unique=True, index=True),
+        sa.Column("slug", sa.String, nullable=False),
         sa.Column("contact_email", sa.String, nullable=True),
         sa.Column("notes", sa.Text, nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
@@ -78,11 +91,11 @@ def upgrade() -> None:
     op.create_table(
         "platform_connections",
         sa.Column("id", UUID(as_uuid=True), primary_key=True),
-        sa.Column("customer_id", UUID(as_uuid=True), sa.ForeignKey("customers.id", ondelete="CASCADE"), nullable=False, index=True),
-        sa.Column("platform", platform_col, nullable=False),
+        sa.Column("customer_id", UUID(as_uuid=True), sa.ForeignKey("customers.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("platform", _PLATFORM_ENUM, nullable=False),
         sa.Column("display_name", sa.String, nullable=False),
         sa.Column("base_url", sa.String, nullable=True),
-        sa.Column("auth_type", authtype_col, nullable=False),
+        sa.Column("auth_type", _AUTHTYPE_ENUM, nullable=False),
         sa.Column("credentials_encrypted", sa.LargeBinary, nullable=False),
         sa.Column("org_or_group", sa.String, nullable=False),
         sa.Column("is_active", sa.Boolean, default=True),
@@ -95,9 +108,9 @@ def upgrade() -> None:
     op.create_table(
         "scans",
         sa.Column("id", UUID(as_uuid=True), primary_key=True),
-        sa.Column("customer_id", UUID(as_uuid=True), sa.ForeignKey("customers.id", ondelete="CASCADE"), nullable=False, index=True),
+        sa.Column("customer_id", UUID(as_uuid=True), sa.ForeignKey("customers.id", ondelete="CASCADE"), nullable=False),
         sa.Column("connection_id", UUID(as_uuid=True), sa.ForeignKey("platform_connections.id", ondelete="CASCADE"), nullable=False),
-        sa.Column("status", scanstatus_col, nullable=False),
+        sa.Column("status", _SCANSTATUS_ENUM, nullable=False),
         sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("total_repos", sa.Integer, default=0),
@@ -111,7 +124,7 @@ def upgrade() -> None:
     op.create_table(
         "scan_repos",
         sa.Column("id", UUID(as_uuid=True), primary_key=True),
-        sa.Column("scan_id", UUID(as_uuid=True), sa.ForeignKey("scans.id", ondelete="CASCADE"), nullable=False, index=True),
+        sa.Column("scan_id", UUID(as_uuid=True), sa.ForeignKey("scans.id", ondelete="CASCADE"), nullable=False),
         sa.Column("repo_external_id", sa.String, nullable=False),
         sa.Column("repo_name", sa.String, nullable=False),
         sa.Column("repo_url", sa.String, nullable=False),
@@ -125,13 +138,13 @@ def upgrade() -> None:
     op.create_table(
         "findings",
         sa.Column("id", UUID(as_uuid=True), primary_key=True),
-        sa.Column("scan_id", UUID(as_uuid=True), sa.ForeignKey("scans.id", ondelete="CASCADE"), nullable=False, index=True),
-        sa.Column("scan_repo_id", UUID(as_uuid=True), sa.ForeignKey("scan_repos.id", ondelete="CASCADE"), nullable=True, index=True),
-        sa.Column("category", category_col, nullable=False),
+        sa.Column("scan_id", UUID(as_uuid=True), sa.ForeignKey("scans.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("scan_repo_id", UUID(as_uuid=True), sa.ForeignKey("scan_repos.id", ondelete="CASCADE"), nullable=True),
+        sa.Column("category", _CATEGORY_ENUM, nullable=False),
         sa.Column("check_id", sa.String, nullable=False),
         sa.Column("check_name", sa.String, nullable=False),
-        sa.Column("severity", severity_col, nullable=False),
-        sa.Column("status", checkstatus_col, nullable=False),
+        sa.Column("severity", _SEVERITY_ENUM, nullable=False),
+        sa.Column("status", _CHECKSTATUS_ENUM, nullable=False),
         sa.Column("detail", sa.Text, nullable=True),
         sa.Column("evidence", JSON, nullable=True),
         sa.Column("weight", sa.Float, nullable=False),
@@ -144,8 +157,8 @@ def upgrade() -> None:
     op.create_table(
         "scan_scores",
         sa.Column("id", UUID(as_uuid=True), primary_key=True),
-        sa.Column("scan_id", UUID(as_uuid=True), sa.ForeignKey("scans.id", ondelete="CASCADE"), nullable=False, index=True),
-        sa.Column("category", category_col, nullable=False),
+        sa.Column("scan_id", UUID(as_uuid=True), sa.ForeignKey("scans.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("category", _CATEGORY_ENUM, nullable=False),
         sa.Column("score", sa.Float, nullable=False),
         sa.Column("max_score", sa.Float, nullable=False),
         sa.Column("weight", sa.Float, nullable=False),
@@ -185,13 +198,29 @@ def upgrade() -> None:
         sa.Column("overall_score", sa.Float, nullable=True),
         sa.Column("dora_level", sa.String, nullable=True),
         sa.Column("pdf_path", sa.String, nullable=True),
-        sa.Column("status", reportstatus_col, nullable=False),
+        sa.Column("status", _REPORTSTATUS_ENUM, nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now()),
     )
 
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, column, unique in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=unique,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
 
 def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _column, _unique in _INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
     op.drop_table("reports")
     op.drop_table("report_templates")
     op.drop_table("scan_scores")
@@ -203,5 +232,5 @@ def downgrade() -> None:
 
     # Drop enum types
     conn = op.get_bind()
-    for name in ("reportstatus", "scanstatus", "checkstatus", "severity", "category", "authtype", "platform"):
-        conn.execute(sa.text(f"DROP TYPE IF EXISTS {name}"))
+    for enum_type in reversed(_ENUM_TYPES):
+        enum_type.drop(conn, checkfirst=True)
@@ -6,6 +6,9 @@ Create Date: 2026-03-03
 """
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+
 import sqlalchemy as sa
 from alembic import op
 from sqlalchemy.dialects.postgresql import JSON, UUID
@@ -15,6 +18,55 @@ down_revision = "001_expand_categories"
 branch_labels = None
 depends_on = None
 
+# ``scans`` is live during deploys: ALTER TABLE waits for ACCESS EXCLUSIVE
+# behind any long-running reader and blocks every new query while queued.
+# A short lock_timeout makes the migration give up and retry instead.
+_LOCK_TIMEOUT = "2s"
+_STATEMENT_TIMEOUT = "5s"
+_LOCK_ATTEMPTS = 3
+_LOCK_ERROR_CODES = ("55P03", "57014")  # lock_not_available, query_canceled
+
+
+def _with_lock_timeout(operation: Callable[[], None]) -> None:
+    """Run *operation* under short lock/statement timeouts, retrying on timeout.
+
+    Each attempt runs in a savepoint so a timed-out ALTER does not abort the
+    surrounding migration transaction; rolling the savepoint back also drops
+    the locks it took.  Backoff doubles between attempts.
+    """
+    set_timeouts = (
+        sa.text(f"SET LOCAL lock_timeout = '{_LOCK_TIMEOUT}'"),
+        sa.text(f"SET LOCAL statement_timeout = '{_STATEMENT_TIMEOUT}'"),
+    )
+    reset_timeouts = (
+        sa.text("SET LOCAL lock_timeout = DEFAULT"),
+        sa.text("SET LOCAL statement_timeout = DEFAULT"),
+    )
+
+    if op.get_context().as_sql:
+        for stmt in set_timeouts:
+            op.execute(stmt)
+        operation()
+        for stmt in reset_timeouts:
+            op.execute(stmt)
+        return
+
+    conn = op.get_bind()
+    for attempt in range(1, _LOCK_ATTEMPTS + 1):
+        try:
+            with conn.begin_nested():
+                for stmt in set_timeouts:
+                    conn.execute(stmt)
+                operation()
+                for stmt in reset_timeouts:
+                    conn.execute(stmt)
+            return
+        except sa.exc.DBAPIError as exc:
+            pgcode = getattr(exc.orig, "pgcode", None)
+            if pgcode not in _LOCK_ERROR_CODES or attempt == _LOCK_ATTEMPTS:
+                raise
+            time.sleep(2**attempt)
+
 
 def upgrade() -> None:
     op.create_table(
@@ -45,18 +97,36 @@ def upgrade() -> None:
         ),
     )
 
-    op.add_column(
-        "scans",
-        sa.Column(
-            "profile_id",
-            UUID(as_uuid=True),
-            sa.ForeignKey("scan_profiles.id", ondelete="SET NULL"),
-            nullable=True,
-            index=True,
-        ),
-    )
+    def add_profile_fk() -> None:
+        op.add_column("scans", sa.Column("profile_id", UUID(as_uuid=True), nullable=True))
+        op.create_foreign_key(
+            "scans_profile_id_fkey",
+            "scans",
+            "scan_profiles",
+            ["profile_id"],
+            ["id"],
+            ondelete="SET NULL",
+            postgresql_not_valid=True,
+        )
+
+    # Both ALTERs share one savepoint so a timed-out attempt releases its
+    # lock on ``scans`` before the backoff sleep.
+    _with_lock_timeout(add_profile_fk)
+
+    # The block commits the ALTERs first; VALIDATE and CREATE INDEX
+    # CONCURRENTLY then run in their own transactions, without ACCESS
+    # EXCLUSIVE on ``scans``, so writes continue while they scan the table.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE scans VALIDATE CONSTRAINT scans_profile_id_fkey")
+        op.create_index(
+            "ix_scans_profile_id",
+            "scans",
+            ["profile_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_column("scans", "profile_id")
+    _with_lock_timeout(lambda: op.drop_column("scans", "profile_id"))
     op.drop_table("scan_profiles")
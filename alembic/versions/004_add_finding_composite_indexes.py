@@ -0,0 +1,49 @@
+"""Add composite indexes on findings for per-scan filtering and aggregation.
+
+Revision ID: 004_add_finding_composite_indexes
+Revises: 003_add_export_paths
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "004_add_finding_composite_indexes"
+down_revision = "003_add_export_paths"
+branch_labels = None
+depends_on = None
+
+# (index name, columns, extra create_index kwargs) — built CONCURRENTLY so
+# the migration never blocks scans writing findings.
+_INDEXES = (
+    ("ix_findings_scan_category", ["scan_id", "category"], {"postgresql_include": ["status"]}),
+    ("ix_findings_scan_status", ["scan_id", "status"], {}),
+    (
+        "ix_findings_scan_repo_cat",
+        ["scan_repo_id", "category"],
+        {"postgresql_where": sa.text("scan_repo_id IS NOT NULL")},
+    ),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, columns, kwargs in _INDEXES:
+            op.create_index(
+                name,
+                "findings",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kwargs,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns, _kwargs in _INDEXES:
+            op.drop_index(name, table_name="findings", postgresql_concurrently=True, if_exists=True)
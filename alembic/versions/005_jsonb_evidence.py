@@ -0,0 +1,69 @@
+"""Store findings.evidence and reports.ai_recommendations as JSONB.
+
+Adds a GIN index on ``findings.evidence`` for containment and key-existence
+filters.
+
+Revision ID: 005_jsonb_evidence
+Revises: 004_add_finding_composite_indexes
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.dialects.postgresql import JSON, JSONB
+
+from alembic import op
+
+revision = "005_jsonb_evidence"
+down_revision = "004_add_finding_composite_indexes"
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs converted between JSON and JSONB.
+_COLUMNS = (
+    ("findings", "evidence"),
+    ("reports", "ai_recommendations"),
+)
+
+
+def upgrade() -> None:
+    # Changing the type rewrites each table under ACCESS EXCLUSIVE; every
+    # stored document is re-encoded once here instead of parsed on every read.
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=JSONB,
+            existing_type=JSON,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_findings_evidence_gin",
+            "findings",
+            ["evidence"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_findings_evidence_gin",
+            table_name="findings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=JSON,
+            existing_type=JSONB,
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,41 @@
+"""Add (customer_id, created_at) indexes for the scan and report lists.
+
+Revision ID: 006_add_customer_listing_indexes
+Revises: 005_jsonb_evidence
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "006_add_customer_listing_indexes"
+down_revision = "005_jsonb_evidence"
+branch_labels = None
+depends_on = None
+
+# (index name, table) — each on (customer_id, created_at), built CONCURRENTLY
+# so the migration never blocks writes.
+_INDEXES = (
+    ("ix_scans_customer_created", "scans"),
+    ("ix_reports_customer_created", "reports"),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                ["customer_id", "created_at"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,47 @@
+"""Store scans.scan_config and scan_repos.raw_data as JSONB.
+
+Revision ID: 007_jsonb_scan_data
+Revises: 006_add_customer_listing_indexes
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.dialects.postgresql import JSON, JSONB
+
+from alembic import op
+
+revision = "007_jsonb_scan_data"
+down_revision = "006_add_customer_listing_indexes"
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs converted between JSON and JSONB.
+_COLUMNS = (
+    ("scans", "scan_config"),
+    ("scan_repos", "raw_data"),
+)
+
+
+def upgrade() -> None:
+    # Changing the type rewrites each table under ACCESS EXCLUSIVE; every
+    # stored document is re-encoded once here instead of parsed on every read.
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=JSONB,
+            existing_type=JSON,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=JSON,
+            existing_type=JSONB,
+            postgresql_using=f"{column}::json",
+        )
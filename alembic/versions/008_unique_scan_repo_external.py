@@ -0,0 +1,61 @@
+"""Make (scan_id, repo_external_id) unique on scan_repos.
+
+Revision ID: 008_unique_scan_repo_external
+Revises: 007_jsonb_scan_data
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "008_unique_scan_repo_external"
+down_revision = "007_jsonb_scan_data"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A provider that paged the same repository twice left duplicate rows;
+    # keep the earliest of each so the unique index can be built.  Findings
+    # of the dropped duplicates go with them via ON DELETE CASCADE.
+    op.execute(
+        "DELETE FROM scan_repos AS dup USING scan_repos AS kept "
+        "WHERE dup.scan_id = kept.scan_id "
+        "AND dup.repo_external_id = kept.repo_external_id "
+        "AND (dup.created_at, dup.id) > (kept.created_at, kept.id)"
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_scan_repos_scan_external",
+            "scan_repos",
+            ["scan_id", "repo_external_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Covered by the leading column of the unique index.
+        op.drop_index(
+            "ix_scan_repos_scan_id",
+            table_name="scan_repos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_scan_repos_scan_id",
+            "scan_repos",
+            ["scan_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_scan_repos_scan_external",
+            table_name="scan_repos",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -7,24 +7,34 @@ from __future__ import annotations
 1. Accept scan results and category scores from the scanner pipeline.
 2. Calculate benchmark alignment (DORA, OpenSSF, SLSA, CIS).
 3. Hydrate the user-prompt template with all relevant data.
-4. Invoke the :class:`~backend.analysis.client.AnalysisClient`.
+4. Invoke the :class:`~backend.analysis.client.AnalysisClient`, requesting
+   structured output matching the
+   :class:`~backend.analysis.schemas.AnalysisResult` schema.
 5. Parse and validate the JSON response into an
    :class:`~backend.analysis.schemas.AnalysisResult`.
 6. If any step fails, produce a graceful fallback result so the report
    pipeline can continue rather than crashing.
 
-A module-level singleton :data:`analyzer` is created at import time using
-the :data:`~backend.analysis.client.analysis_client` singleton.
+The process-wide analyzer is returned by :func:`get_analyzer`, built on
+first use around :func:`~backend.analysis.client.get_analysis_client`;
+``analyzer`` remains importable as an alias for it.
 """
 
-import json
+import asyncio
+import functools
+import heapq
+import io
 import logging
-from collections import defaultdict
+import re
+import string
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 from pydantic import ValidationError
 
-from backend.analysis.client import AnalysisClient, AnalysisClientError, analysis_client
+from backend.analysis.cache import SemanticCache
+from backend.analysis.client import AnalysisClient, AnalysisClientError, get_analysis_client
 from backend.analysis.platform_context import get_display_name, get_platform_context
 from backend.analysis.prompts import PLATFORM_CONTEXT_TEMPLATE, SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 from backend.analysis.schemas import (
@@ -34,9 +44,10 @@ from backend.analysis.schemas import (
     Recommendation,
 )
 from backend.benchmarks.cis import calculate_cis_compliance
-from backend.benchmarks.dora import DORA_LEVELS, classify_dora_level
+from backend.benchmarks.dora import DORA_LEVELS, DoraLevel, classify_dora_level
 from backend.benchmarks.openssf import calculate_openssf_alignment
-from backend.benchmarks.slsa import SLSA_LEVELS, calculate_slsa_level
+from backend.benchmarks.slsa import SLSA_LEVELS, SlsaLevel, calculate_slsa_level
+from backend.config import settings
 from backend.models.enums import Category, CheckStatus, Platform, Severity
 from backend.scanners.base import CheckResult
 from backend.scanners.orchestrator import CategoryScore
@@ -44,16 +55,269 @@ from backend.scanners.orchestrator import CategoryScore
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Severity ordering for display
+# Severity / category ordering for display
 # ---------------------------------------------------------------------------
 
-_SEVERITY_ORDER: list[Severity] = [
+# Plain tuples: iterating an Enum class goes through EnumMeta.__iter__ on
+# every loop, which the formatters below would otherwise pay per call.
+_SEVERITY_ORDER: tuple[Severity, ...] = (
     Severity.critical,
     Severity.high,
     Severity.medium,
     Severity.low,
     Severity.info,
-]
+)
+_CATEGORY_ORDER: tuple[Category, ...] = tuple(Category)
+
+# Statuses listed in the "failed and warning checks" prompt section.
+_NON_PASS_STATUSES: frozenset[CheckStatus] = frozenset(
+    (CheckStatus.failed, CheckStatus.warning, CheckStatus.error)
+)
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Compile a :meth:`str.format` template into an equivalent f-string function.
+
+    ``str.format`` re-tokenises the template on every call; generating the
+    renderer once at import turns each render into a single f-string
+    evaluation.  Only plain identifier fields are supported, which is all
+    :data:`~backend.analysis.prompts.USER_PROMPT_TEMPLATE` uses.
+
+    Args:
+        template: A ``str.format``-style template.
+
+    Returns:
+        A function taking every template field as a keyword-only argument and
+        returning the rendered string.
+
+    Raises:
+        ValueError: If the template contains an indexed or dotted field.
+    """
+    fields: list[str] = []
+    parts: list[str] = []
+    for literal, name, spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if name is None:
+            continue
+        if not name.isidentifier():
+            raise ValueError(f"Unsupported template field: {name!r}")
+        if name not in fields:
+            fields.append(name)
+        parts.append(
+            "{" + name + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}"
+        )
+
+    source = f"def render(*, {', '.join(fields)}):\n    return f{''.join(parts)!r}\n"
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)
+    render: Callable[..., str] = namespace["render"]
+    return render
+
+
+_USER_PROMPT_RENDER: Callable[..., str] = _compile_template(USER_PROMPT_TEMPLATE)
+
+# Matches a response wrapped in a markdown code fence (optional language tag).
+_FENCE_RE = re.compile(r"\A\s*```[^\n]*\n(.*?)\n?```\s*\Z", re.DOTALL)
+
+# Prompt fields carrying scan data, embedded for semantic cache lookups.
+_SCAN_DATA_FIELDS: tuple[str, ...] = (
+    "total_repos",
+    "overall_score",
+    "category_scores_table",
+    "failed_checks_summary",
+    "passed_checks_summary",
+    "benchmark_data",
+)
+
+# Error note used for the fallback when no API key is configured.
+_CLIENT_UNAVAILABLE_MESSAGE = "Anthropic API key is not configured."
+
+# ---------------------------------------------------------------------------
+# Result bucketing
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _ResultBuckets:
+    """Scan results pre-grouped in a single pass for the prompt formatters.
+
+    Attributes:
+        passed_ids:         Check IDs that produced a ``passed`` result.
+        repos:              Distinct ``evidence["repo"]`` values seen.
+        failed_by_severity: Failed, warning, and errored results keyed by
+                            check severity.
+        passed_by_category: Passed results keyed by check category.
+        passed_count:       Total number of passed results.
+    """
+
+    passed_ids: set[str] = field(default_factory=set)
+    repos: set[Any] = field(default_factory=set)
+    # Pre-seeded with every key so appends never go through ``__missing__``.
+    failed_by_severity: dict[Severity, list[CheckResult]] = field(
+        default_factory=lambda: {severity: [] for severity in _SEVERITY_ORDER}
+    )
+    passed_by_category: dict[Category, list[CheckResult]] = field(
+        default_factory=lambda: {cat: [] for cat in _CATEGORY_ORDER}
+    )
+    passed_count: int = 0
+
+
+def _bucket_results(results: list[CheckResult]) -> _ResultBuckets:
+    """Classify *results* in one traversal instead of one scan per consumer."""
+    buckets = _ResultBuckets()
+    add_repo = buckets.repos.add
+    add_passed_id = buckets.passed_ids.add
+    passed_by_category = buckets.passed_by_category
+    failed_by_severity = buckets.failed_by_severity
+    passed = CheckStatus.passed
+    passed_count = 0
+    for result in results:
+        evidence = result.evidence
+        if evidence and "repo" in evidence:
+            add_repo(evidence["repo"])
+        check = result.check
+        status = result.status
+        if status is passed:
+            add_passed_id(check.check_id)
+            passed_by_category[check.category].append(result)
+            passed_count += 1
+        elif status in _NON_PASS_STATUSES:
+            failed_by_severity[check.severity].append(result)
+    buckets.passed_count = passed_count
+    return buckets
+
+
+@dataclass
+class ScanAnalysisRequest:
+    """Inputs for analysing one scan, as accepted by
+    :meth:`DevOpsAnalyzer.analyze_scans`.
+
+    Attributes mirror the arguments of :meth:`DevOpsAnalyzer.analyze_scan`.
+    """
+
+    org_name: str
+    scan_results: list[CheckResult]
+    category_scores: dict[Category, CategoryScore]
+    overall_score: float
+    platform: Platform = Platform.github
+
+
+@dataclass
+class _PreparedAnalysis:
+    """A request with its results bucketed and benchmarks computed.
+
+    Everything both the prompt builder and the fallback path need, so each
+    is computed once per request.
+    """
+
+    request: ScanAnalysisRequest
+    buckets: _ResultBuckets
+    dora_level: str
+    dora_data: DoraLevel
+    openssf_alignment: dict[str, bool]
+    slsa_level: int
+    slsa_data: SlsaLevel | None
+    cis_compliance: dict[str, dict[str, Any]]
+    openssf_passed_count: int
+    cis_compliant: int
+
+
+# ---------------------------------------------------------------------------
+# Prompt formatting
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=32)
+def _format_benchmark_data(
+    dora_level: str,
+    openssf: tuple[tuple[str, bool], ...],
+    openssf_passed_count: int,
+    slsa_level: int,
+    cis: tuple[tuple[str, tuple[tuple[str, Any], ...]], ...],
+    cis_compliant: int,
+) -> str:
+    """Render all benchmark framework results as formatted plain text.
+
+    Benchmark inputs repeat across scans (a handful of DORA/SLSA levels and
+    pass/fail combinations), so the rendered block is memoised.  Mappings
+    are therefore passed as ``tuple(mapping.items())`` to stay hashable;
+    item order is preserved in the output.
+
+    Args:
+        dora_level:  The DORA performance level string (e.g. ``"high"``).
+        openssf:     OpenSSF ``(category, satisfied)`` pairs.
+        openssf_passed_count: Number of satisfied OpenSSF categories.
+        slsa_level:  Integer SLSA level achieved (0–3).
+        cis:         CIS ``(domain_id, tuple(breakdown.items()))`` pairs.
+        cis_compliant: Number of fully compliant CIS domains.
+
+    Returns:
+        A multi-line string covering DORA, OpenSSF, SLSA, and CIS results.
+    """
+    # ---- DORA -------------------------------------------------------
+    dora_data = DORA_LEVELS[dora_level]
+    lines: list[str] = [
+        f"""\
+### DORA Metrics
+
+  Performance level : {dora_level.upper()}
+  Deployment freq.  : {dora_data.deployment_frequency}
+  Lead time         : {dora_data.lead_time}
+  Change failure    : {dora_data.change_failure_rate}
+  MTTR              : {dora_data.mttr}
+  Score threshold   : >= {dora_data.score_threshold}"""
+    ]
+
+    # ---- OpenSSF ----------------------------------------------------
+    openssf_passed = [cat for cat, ok in openssf if ok]
+    openssf_failed = [cat for cat, ok in openssf if not ok]
+    lines.append(
+        f"""
+### OpenSSF Scorecard Alignment
+
+  Satisfied categories ({openssf_passed_count}/{len(openssf)}):"""
+    )
+    lines.extend([f"    [PASS] {cat}" for cat in openssf_passed])
+    if openssf_failed:
+        lines.append(f"\n  Unsatisfied categories ({len(openssf_failed)}):")
+        lines.extend([f"    [FAIL] {cat}" for cat in openssf_failed])
+
+    # ---- SLSA -------------------------------------------------------
+    if slsa_level > 0:
+        slsa_data = SLSA_LEVELS[slsa_level]
+        slsa_detail = (
+            f"  Level name    : {slsa_data.name}\n"
+            f"  Description   : {slsa_data.description}"
+        )
+    else:
+        slsa_detail = "  No SLSA level requirements currently satisfied."
+    lines.append(
+        f"""
+### SLSA Build Level
+
+  Achieved level: {slsa_level}
+{slsa_detail}"""
+    )
+
+    # ---- CIS --------------------------------------------------------
+    lines.append(
+        f"""
+### CIS Software Supply Chain Security
+
+  Compliant domains: {cis_compliant}/{len(cis)}
+"""
+    )
+    for domain_id, fields in cis:
+        d = dict(fields)
+        lines.append(
+            f"  [{'COMPLIANT' if d.get('compliant') else 'PARTIAL':<9}] "
+            f"{d.get('description', domain_id):<35} "
+            f"{d.get('passed', 0)}/{d.get('total', 0)} checks "
+            f"({d.get('percentage', 0):.0f}%)"
+        )
+
+    return "\n".join(lines)
+
 
 # ---------------------------------------------------------------------------
 # Analyzer
@@ -65,8 +329,8 @@ class DevOpsAnalyzer:
 
     Args:
         client: The :class:`~backend.analysis.client.AnalysisClient` to use
-                for model calls.  Defaults to the module-level singleton when
-                constructing :data:`analyzer`.
+                for model calls; :func:`get_analyzer` passes the process-wide
+                client.
 
     Example::
 
@@ -78,8 +342,13 @@ class DevOpsAnalyzer:
         )
     """
 
-    def __init__(self, client: AnalysisClient) -> None:
+    def __init__(
+        self,
+        client: AnalysisClient,
+        semantic_cache: SemanticCache | None = None,
+    ) -> None:
         self._client: AnalysisClient = client
+        self._semantic_cache = semantic_cache
 
     # ------------------------------------------------------------------
     # Public API
@@ -99,13 +368,13 @@ class DevOpsAnalyzer:
 
         1. Extract the set of passed check IDs from *scan_results*.
         2. Compute DORA, OpenSSF, SLSA, and CIS benchmark data.
-        3. Build the user prompt from the template.
-        4. Inject the :class:`~backend.analysis.schemas.AnalysisResult` JSON
-           schema into the prompt so the model knows the required output shape.
-        5. Call the AI client.
-        6. Strip any markdown fences and attempt JSON parsing + Pydantic
-           validation.
-        7. Return the validated :class:`~backend.analysis.schemas.AnalysisResult`
+        3. Build the user prompt from the template (skipped, returning the
+           fallback result, when the client is unavailable).
+        4. Call the AI client, forcing the response through a tool whose
+           input schema is the :class:`~backend.analysis.schemas.AnalysisResult`
+           JSON schema.
+        5. Parse and validate the returned JSON with Pydantic.
+        6. Return the validated :class:`~backend.analysis.schemas.AnalysisResult`
            or a fallback result if any step fails.
 
         Args:
@@ -120,33 +389,194 @@ class DevOpsAnalyzer:
             A fully populated :class:`~backend.analysis.schemas.AnalysisResult`.
             Never raises — on failure a fallback result is returned.
         """
-        # Step 1: Derive passed check IDs.
-        passed_ids: set[str] = {
-            r.check.check_id for r in scan_results if r.status is CheckStatus.passed
-        }
+        # Steps 1 & 2: Classify results and compute benchmark alignment.
+        prepared = self._prepare(
+            ScanAnalysisRequest(
+                org_name=org_name,
+                scan_results=scan_results,
+                category_scores=category_scores,
+                overall_score=overall_score,
+                platform=platform,
+            )
+        )
 
-        # Step 2: Compute benchmark alignment.
-        dora_level: str = classify_dora_level(overall_score)
+        # Skip prompt construction entirely when the client cannot be called.
+        if not self._client.available:
+            logger.warning(
+                "DevOpsAnalyzer.analyze_scan: AI client unavailable.  Returning fallback result."
+            )
+            return self._fallback(prepared, _CLIENT_UNAVAILABLE_MESSAGE)
+
+        # Step 3: Hydrate the user prompt.  Rendering is pure CPU work,
+        # so run it off the event loop to let concurrent analyses overlap it
+        # with their own network waits.
+        semantic_key: tuple[str, str] | None = None
+        if self._semantic_cache is None:
+            user_prompt = await asyncio.to_thread(self._build_prompt, prepared)
+        else:
+            fields = await asyncio.to_thread(self._prompt_fields, prepared)
+            # Only the scan data varies between prompts for the same org; the
+            # shared template text would otherwise swamp the similarity score.
+            semantic_key = (
+                f"{platform.value}\0{org_name}",
+                "\n".join(str(fields[name]) for name in _SCAN_DATA_FIELDS),
+            )
+            cached: AnalysisResult | None = self._semantic_cache.get(*semantic_key)
+            if cached is not None:
+                logger.info(
+                    "DevOpsAnalyzer.analyze_scan: reusing analysis of near-identical "
+                    "scan data for '%s'.",
+                    org_name,
+                )
+                return cached
+            user_prompt = _USER_PROMPT_RENDER(**fields)
+
+        # Step 4: Call the AI client.
+        try:
+            raw_response: str = await self._client.analyze(
+                prompt=user_prompt,
+                system=SYSTEM_PROMPT,
+                output_schema=AnalysisResult,
+            )
+        except AnalysisClientError as exc:
+            logger.warning(
+                "DevOpsAnalyzer.analyze_scan: AI call failed — %s.  Returning fallback result.",
+                exc,
+            )
+            return self._fallback(prepared, str(exc))
+
+        # Steps 5 & 6: Parse and validate.
+        return self._finish(prepared, raw_response, semantic_key)
+
+    async def analyze_scans(
+        self,
+        requests: list[ScanAnalysisRequest],
+        use_batch_api: bool = True,
+    ) -> list[AnalysisResult]:
+        """Analyse several scans, by default with a single batched submission.
+
+        Each request goes through the same pipeline as :meth:`analyze_scan`.
+        With *use_batch_api*, all prompts are submitted together via
+        :meth:`~backend.analysis.client.AnalysisClient.analyze_batch`, which
+        halves token cost but is processed asynchronously by the API, so it
+        suits bulk or scheduled runs.  Otherwise the requests run as
+        concurrent :meth:`analyze_scan` calls for interactive use.
+
+        Args:
+            requests:      The scans to analyse.
+            use_batch_api: Submit through the Message Batches API.
+
+        Returns:
+            One :class:`~backend.analysis.schemas.AnalysisResult` per request,
+            in the same order.  Never raises — any request whose model call or
+            parsing fails gets a fallback result.
+        """
+        if not use_batch_api:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.analyze_scan(
+                            org_name=r.org_name,
+                            scan_results=r.scan_results,
+                            category_scores=r.category_scores,
+                            overall_score=r.overall_score,
+                            platform=r.platform,
+                        )
+                        for r in requests
+                    )
+                )
+            )
+
+        prepared = [self._prepare(request) for request in requests]
+        if not prepared:
+            return []
+
+        if not self._client.available:
+            logger.warning(
+                "DevOpsAnalyzer.analyze_scans: AI client unavailable.  Returning fallback results."
+            )
+            return [self._fallback(p, _CLIENT_UNAVAILABLE_MESSAGE) for p in prepared]
+
+        prompts = await asyncio.gather(
+            *(asyncio.to_thread(self._build_prompt, p) for p in prepared)
+        )
+        try:
+            responses = await self._client.analyze_batch(
+                prompts=prompts, system=SYSTEM_PROMPT, output_schema=AnalysisResult
+            )
+        except AnalysisClientError as exc:
+            logger.warning(
+                "DevOpsAnalyzer.analyze_scans: batch call failed — %s.  Returning fallback results.",
+                exc,
+            )
+            return [self._fallback(p, str(exc)) for p in prepared]
+
+        results: list[AnalysisResult] = []
+        for p, response in zip(prepared, responses, strict=True):
+            if isinstance(response, AnalysisClientError):
+                logger.warning(
+                    "DevOpsAnalyzer.analyze_scans: AI call for '%s' failed — %s.  "
+                    "Returning fallback result.",
+                    p.request.org_name,
+                    response,
+                )
+                results.append(self._fallback(p, str(response)))
+            else:
+                results.append(self._finish(p, response))
+        return results
+
+    # ------------------------------------------------------------------
+    # Pipeline stages
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _prepare(request: ScanAnalysisRequest) -> _PreparedAnalysis:
+        """Bucket *request*'s results and compute its benchmark alignment."""
+        buckets = _bucket_results(request.scan_results)
+        passed_ids = buckets.passed_ids
+
+        dora_level: str = classify_dora_level(request.overall_score)
         openssf_alignment: dict[str, bool] = calculate_openssf_alignment(passed_ids)
         slsa_level: int = calculate_slsa_level(passed_ids)
         cis_compliance: dict[str, dict[str, Any]] = calculate_cis_compliance(passed_ids)
-
-        # Step 3 & 4: Hydrate the user prompt.
-        total_repos: int = len(
-            {r.evidence.get("repo") for r in scan_results if r.evidence and "repo" in r.evidence}
+        return _PreparedAnalysis(
+            request=request,
+            buckets=buckets,
+            dora_level=dora_level,
+            dora_data=DORA_LEVELS[dora_level],
+            openssf_alignment=openssf_alignment,
+            slsa_level=slsa_level,
+            slsa_data=SLSA_LEVELS.get(slsa_level),
+            cis_compliance=cis_compliance,
+            # Shared by the prompt formatter and the fallback path.
+            openssf_passed_count=sum(openssf_alignment.values()),
+            cis_compliant=len([d for d in cis_compliance.values() if d["compliant"]]),
         )
+
+    def _build_prompt(self, prepared: _PreparedAnalysis) -> str:
+        """Hydrate the user-prompt template for one prepared scan."""
+        return _USER_PROMPT_RENDER(**self._prompt_fields(prepared))
+
+    def _prompt_fields(self, prepared: _PreparedAnalysis) -> dict[str, Any]:
+        """Render every user-prompt template field for one prepared scan.
+
+        Pure and free of shared mutable state, so it is safe to run in a
+        worker thread.
+        """
+        request = prepared.request
+        buckets = prepared.buckets
+
+        total_repos: int = len(buckets.repos)
         # Use a safe fallback for total_repos when evidence doesn't carry repo keys.
         if total_repos == 0:
             total_repos = max(
                 1,
-                len(scan_results)
-                // max(1, sum(cs.finding_count for cs in category_scores.values()) or 1),
+                len(request.scan_results)
+                // max(1, sum(cs.finding_count for cs in request.category_scores.values()) or 1),
             )
 
-        json_schema: str = json.dumps(AnalysisResult.model_json_schema(), indent=2)
-
         # Build platform-specific context block for the prompt.
-        ctx = get_platform_context(platform)
+        ctx = get_platform_context(request.platform)
         platform_context_block: str = PLATFORM_CONTEXT_TEMPLATE.format(
             **ctx,
             best_practices_list="\n".join(
@@ -154,76 +584,80 @@ class DevOpsAnalyzer:
             ),
         )
 
-        user_prompt: str = USER_PROMPT_TEMPLATE.format(
-            org_name=org_name,
+        return dict(
+            org_name=request.org_name,
             total_repos=total_repos,
-            overall_score=f"{overall_score:.2f}",
+            overall_score=f"{request.overall_score:.2f}",
             platform_context=platform_context_block,
-            category_scores_table=self._format_category_scores(category_scores),
-            failed_checks_summary=self._format_failed_checks(scan_results),
-            passed_checks_summary=self._format_passed_checks(scan_results),
-            benchmark_data=self._format_benchmark_data(
-                dora_level=dora_level,
-                openssf=openssf_alignment,
-                slsa_level=slsa_level,
-                cis=cis_compliance,
+            category_scores_table=self._format_category_scores(request.category_scores),
+            failed_checks_summary=self._format_failed_checks(buckets.failed_by_severity),
+            passed_checks_summary=self._format_passed_checks(
+                buckets.passed_by_category, buckets.passed_count
+            ),
+            benchmark_data=_format_benchmark_data(
+                dora_level=prepared.dora_level,
+                openssf=tuple(prepared.openssf_alignment.items()),
+                openssf_passed_count=prepared.openssf_passed_count,
+                slsa_level=prepared.slsa_level,
+                cis=tuple(
+                    (domain_id, tuple(d.items()))
+                    for domain_id, d in prepared.cis_compliance.items()
+                ),
+                cis_compliant=prepared.cis_compliant,
             ),
-            json_schema=json_schema,
         )
 
-        # Step 5: Call the AI client.
-        try:
-            raw_response: str = await self._client.analyze(
-                prompt=user_prompt,
-                system=SYSTEM_PROMPT,
-            )
-        except AnalysisClientError as exc:
-            logger.warning(
-                "DevOpsAnalyzer.analyze_scan: AI call failed — %s.  Returning fallback result.",
-                exc,
-            )
-            return self._create_fallback_result(
-                org_name=org_name,
-                overall_score=overall_score,
-                category_scores=category_scores,
-                dora_level=dora_level,
-                openssf=openssf_alignment,
-                slsa_level=slsa_level,
-                cis=cis_compliance,
-                error_message=str(exc),
-                platform=platform,
-            )
+    def _finish(
+        self,
+        prepared: _PreparedAnalysis,
+        raw_response: str,
+        semantic_key: tuple[str, str] | None = None,
+    ) -> AnalysisResult:
+        """Parse *raw_response*, falling back when it fails validation.
 
-        # Step 6: Parse and validate.
+        A successfully parsed result is stored in the semantic cache under
+        *semantic_key* when one is given.
+        """
         try:
             result: AnalysisResult = self._parse_response(raw_response)
-        except (ValueError, ValidationError) as exc:
+        except ValidationError as exc:
             logger.warning(
                 "DevOpsAnalyzer.analyze_scan: response parsing failed — %s.  "
                 "Returning fallback result.",
                 exc,
             )
-            return self._create_fallback_result(
-                org_name=org_name,
-                overall_score=overall_score,
-                category_scores=category_scores,
-                dora_level=dora_level,
-                openssf=openssf_alignment,
-                slsa_level=slsa_level,
-                cis=cis_compliance,
-                error_message=str(exc),
-                platform=platform,
-            )
+            return self._fallback(prepared, str(exc))
 
         logger.info(
             "DevOpsAnalyzer.analyze_scan: analysis complete for '%s' "
             "(%d recommendations, %d narratives).",
-            org_name,
+            prepared.request.org_name,
             len(result.recommendations),
             len(result.category_narratives),
         )
+        if semantic_key is not None and self._semantic_cache is not None:
+            self._semantic_cache.set(*semantic_key, result)
         return result
 
+    def _fallback(self, prepared: _PreparedAnalysis, error_message: str) -> AnalysisResult:
+        """Build the fallback result for *prepared* with *error_message*."""
+        request = prepared.request
+        return self._create_fallback_result(
+            org_name=request.org_name,
+            overall_score=request.overall_score,
+            category_scores=request.category_scores,
+            dora_level=prepared.dora_level,
+            dora_data=prepared.dora_data,
+            openssf=prepared.openssf_alignment,
+            openssf_passed_count=prepared.openssf_passed_count,
+            slsa_level=prepared.slsa_level,
+            slsa_data=prepared.slsa_data,
+            cis=prepared.cis_compliance,
+            cis_compliant=prepared.cis_compliant,
+            error_message=error_message,
+            platform=request.platform,
+        )
+
     # ------------------------------------------------------------------
     # Formatting helpers
     # ------------------------------------------------------------------
@@ -245,7 +679,7 @@ class DevOpsAnalyzer:
         separator = "-" * len(header)
         rows: list[str] = [header, separator]
 
-        for cat in Category:
+        for cat in _CATEGORY_ORDER:
             if cat not in scores:
                 continue
             cs = scores[cat]
@@ -256,146 +690,74 @@ class DevOpsAnalyzer:
 
         return "\n".join(rows)
 
-    def _format_failed_checks(self, results: list[CheckResult]) -> str:
+    def _format_failed_checks(self, grouped: dict[Severity, list[CheckResult]]) -> str:
         """Render failed and warning checks grouped by severity.
 
         Args:
-            results: All :class:`~backend.scanners.base.CheckResult` objects.
+            grouped: Failed, warning, and errored results keyed by severity,
+                     as produced by :func:`_bucket_results`.
 
         Returns:
             A multi-line string listing each failing/warning check under its
             severity heading, including the check ID, name, category, and
             detail message.
         """
-        # Group by severity — only failed, warning, error statuses.
-        grouped: dict[Severity, list[CheckResult]] = defaultdict(list)
-        for result in results:
-            if result.status in (
-                CheckStatus.failed,
-                CheckStatus.warning,
-                CheckStatus.error,
-            ):
-                grouped[result.check.severity].append(result)
-
-        if not grouped:
+        if not any(grouped.values()):
             return "No failed or warning checks."
 
         lines: list[str] = []
         for severity in _SEVERITY_ORDER:
-            items = grouped.get(severity)
+            items = grouped[severity]
             if not items:
                 continue
             lines.append(f"\n### {severity.value.upper()} ({len(items)} checks)\n")
             for r in items:
+                check = r.check
                 status_tag = f"[{r.status.value}]"
                 lines.append(
-                    f"  {status_tag:<10} {r.check.check_id:<12} "
-                    f"{r.check.check_name} ({r.check.category.value})"
+                    f"  {status_tag:<10} {check.check_id:<12} "
+                    f"{check.check_name} ({check.category.value})"
                 )
                 if r.detail:
                     lines.append(f"             Detail: {r.detail}")
 
         return "\n".join(lines)
 
-    def _format_passed_checks(self, results: list[CheckResult]) -> str:
+    def _format_passed_checks(
+        self,
+        grouped: dict[Category, list[CheckResult]],
+        total: int,
+    ) -> str:
         """Render all passed checks as a plain-text list.
 
         Args:
-            results: All :class:`~backend.scanners.base.CheckResult` objects.
+            grouped: Passed results keyed by category, as produced by
+                     :func:`_bucket_results`.
+            total:   Total number of passed results.
 
         Returns:
             A multi-line string listing each passed check with its ID, name,
             and category.
         """
-        passed = [r for r in results if r.status is CheckStatus.passed]
-
-        if not passed:
+        if not total:
             return "No checks passed."
 
-        # Group by category for readability.
-        grouped: dict[Category, list[CheckResult]] = defaultdict(list)
-        for r in passed:
-            grouped[r.check.category].append(r)
-
-        lines: list[str] = [f"Total passed: {len(passed)}\n"]
-        for cat in Category:
-            items = grouped.get(cat)
+        # This listing grows with every passed check, so write fragments
+        # straight into a buffer (each one newline-prefixed) instead of
+        # collecting per-line strings for a final join.
+        buf = io.StringIO()
+        write = buf.write
+        write(f"Total passed: {total}\n")
+        for cat in _CATEGORY_ORDER:
+            items = grouped[cat]
             if not items:
                 continue
-            lines.append(f"\n### {cat.value.upper()} ({len(items)} passed)\n")
+            write(f"\n\n### {cat.value.upper()} ({len(items)} passed)\n")
             for r in items:
-                lines.append(f"  [PASS]     {r.check.check_id:<12} {r.check.check_name}")
-
-        return "\n".join(lines)
+                check = r.check
+                write(f"\n  [PASS]     {check.check_id:<12} {check.check_name}")
 
-    def _format_benchmark_data(
-        self,
-        dora_level: str,
-        openssf: dict[str, bool],
-        slsa_level: int,
-        cis: dict[str, dict[str, Any]],
-    ) -> str:
-        """Render all benchmark framework results as formatted plain text.
-
-        Args:
-            dora_level:  The DORA performance level string (e.g. ``"high"``).
-            openssf:     OpenSSF category-to-boolean alignment mapping.
-            slsa_level:  Integer SLSA level achieved (0–3).
-            cis:         CIS domain compliance breakdown.
-
-        Returns:
-            A multi-line string covering DORA, OpenSSF, SLSA, and CIS results.
-        """
-        lines: list[str] = []
-
-        # ---- DORA -------------------------------------------------------
-        dora_data = DORA_LEVELS.get(dora_level, {})
-        lines.append("### DORA Metrics\n")
-        lines.append(f"  Performance level : {dora_level.upper()}")
-        lines.append(f"  Deployment freq.  : {dora_data.get('deployment_frequency', 'N/A')}")
-        lines.append(f"  Lead time         : {dora_data.get('lead_time', 'N/A')}")
-        lines.append(f"  Change failure    : {dora_data.get('change_failure_rate', 'N/A')}")
-        lines.append(f"  MTTR              : {dora_data.get('mttr', 'N/A')}")
-        lines.append(f"  Score threshold   : >= {dora_data.get('score_threshold', 'N/A')}")
-
-        # ---- OpenSSF ----------------------------------------------------
-        openssf_passed = [cat for cat, ok in openssf.items() if ok]
-        openssf_failed = [cat for cat, ok in openssf.items() if not ok]
-        lines.append("\n### OpenSSF Scorecard Alignment\n")
-        lines.append(f"  Satisfied categories ({len(openssf_passed)}/{len(openssf)}):")
-        for cat in openssf_passed:
-            lines.append(f"    [PASS] {cat}")
-        if openssf_failed:
-            lines.append(f"\n  Unsatisfied categories ({len(openssf_failed)}):")
-            for cat in openssf_failed:
-                lines.append(f"    [FAIL] {cat}")
-
-        # ---- SLSA -------------------------------------------------------
-        lines.append("\n### SLSA Build Level\n")
-        lines.append(f"  Achieved level: {slsa_level}")
-        if slsa_level > 0:
-            slsa_data = SLSA_LEVELS.get(slsa_level, {})
-            lines.append(f"  Level name    : {slsa_data.get('name', 'N/A')}")
-            lines.append(f"  Description   : {slsa_data.get('description', 'N/A')}")
-        else:
-            lines.append("  No SLSA level requirements currently satisfied.")
-
-        # ---- CIS --------------------------------------------------------
-        lines.append("\n### CIS Software Supply Chain Security\n")
-        total_domains = len(cis)
-        compliant_domains = sum(1 for d in cis.values() if d.get("compliant"))
-        lines.append(f"  Compliant domains: {compliant_domains}/{total_domains}\n")
-        for domain_id, domain_data in cis.items():
-            status = "COMPLIANT" if domain_data.get("compliant") else "PARTIAL"
-            pct = domain_data.get("percentage", 0)
-            passed_count = domain_data.get("passed", 0)
-            total_count = domain_data.get("total", 0)
-            desc = domain_data.get("description", domain_id)
-            lines.append(
-                f"  [{status:<9}] {desc:<35} {passed_count}/{total_count} checks ({pct:.0f}%)"
-            )
-
-        return "\n".join(lines)
+        return buf.getvalue()
 
     # ------------------------------------------------------------------
     # Response parsing
@@ -404,9 +766,9 @@ class DevOpsAnalyzer:
     def _parse_response(self, raw: str) -> AnalysisResult:
         """Parse the raw AI text response into an :class:`AnalysisResult`.
 
-        The method strips any leading/trailing markdown code fences before
-        attempting JSON parsing.  The parsed dict is then passed through
-        Pydantic validation.
+        The method strips any leading/trailing markdown code fences, then
+        decodes and validates the JSON in a single pydantic-core pass without
+        building an intermediate ``dict``.
 
         Args:
             raw: The raw string returned by the model.
@@ -415,23 +777,13 @@ class DevOpsAnalyzer:
             A validated :class:`~backend.analysis.schemas.AnalysisResult`.
 
         Raises:
-            ValueError: If the text cannot be decoded as JSON.
-            :class:`pydantic.ValidationError`: If the JSON does not conform to
-                the :class:`~backend.analysis.schemas.AnalysisResult` schema.
+            :class:`pydantic.ValidationError`: If the text is not valid JSON or
+                does not conform to the
+                :class:`~backend.analysis.schemas.AnalysisResult` schema.
         """
-        text = raw.strip()
-
-        # Strip markdown code fences if present.
-        if text.startswith("```"):
-            # Remove the opening fence (and optional language tag).
-            text = text.split("\n", 1)[-1]
-        if text.endswith("```"):
-            text = text.rsplit("```", 1)[0]
-
-        text = text.strip()
-
-        data: Any = json.loads(text)
-        return AnalysisResult.model_validate(data)
+        match = _FENCE_RE.match(raw)
+        text = match.group(1) if match else raw.strip()
+        return AnalysisResult.model_validate_json(text)
 
     # ------------------------------------------------------------------
     # Fallback result
@@ -443,9 +795,13 @@ class DevOpsAnalyzer:
         overall_score: float,
         category_scores: dict[Category, CategoryScore],
         dora_level: str,
+        dora_data: DoraLevel,
         openssf: dict[str, bool],
+        openssf_passed_count: int,
         slsa_level: int,
+        slsa_data: SlsaLevel | None,
         cis: dict[str, dict[str, Any]],
+        cis_compliant: int,
         error_message: str = "",
         platform: Platform = Platform.github,
     ) -> AnalysisResult:
@@ -454,16 +810,22 @@ class DevOpsAnalyzer:
         This fallback ensures the report generation pipeline always receives a
         valid result object regardless of AI availability.  The content is
         derived solely from the structured scan data and benchmark calculations
-        — no AI content is included.
+        — no AI content is included.  Because every value is generated here,
+        the models are built with ``model_construct`` to skip validation.
 
         Args:
             org_name:       Organisation display name.
             overall_score:  Weighted overall score.
             category_scores: Per-category scoring data.
             dora_level:     DORA performance level string.
+            dora_data:      The resolved ``DORA_LEVELS`` entry for *dora_level*.
             openssf:        OpenSSF category alignment mapping.
+            openssf_passed_count: Number of satisfied OpenSSF categories.
             slsa_level:     Integer SLSA level.
+            slsa_data:      The resolved ``SLSA_LEVELS`` entry for *slsa_level*
+                            (``None`` for level 0).
             cis:            CIS domain compliance data.
+            cis_compliant:  Number of fully compliant CIS domains.
             error_message:  Description of the failure that triggered fallback.
 
         Returns:
@@ -474,16 +836,21 @@ class DevOpsAnalyzer:
             org_name,
         )
 
+        # Categories with applicable checks, in display order; shared by the
+        # narratives and the risk highlights.
+        active: list[tuple[Category, CategoryScore]] = [
+            (cat, cs)
+            for cat in _CATEGORY_ORDER
+            if (cs := category_scores.get(cat)) is not None and cs.max_score > 0.0
+        ]
+
         # Build category narratives from numeric data only.
         narratives: list[CategoryNarrative] = []
-        for cat in Category:
-            cs = category_scores.get(cat)
-            if cs is None or cs.max_score == 0.0:
-                continue
+        for cat, cs in active:
             pct = cs.percentage
             status_word = "strong" if pct >= 75 else "moderate" if pct >= 50 else "weak"
             narratives.append(
-                CategoryNarrative(
+                CategoryNarrative.model_construct(
                     category=cat.value,
                     score_percentage=round(pct, 2),
                     summary=(
@@ -506,15 +873,11 @@ class DevOpsAnalyzer:
             )
 
         # Build benchmark comparisons.
-        openssf_passed_count = sum(1 for v in openssf.values() if v)
         openssf_total = len(openssf)
-        dora_data = DORA_LEVELS.get(dora_level, {})
-
-        cis_compliant = sum(1 for d in cis.values() if d.get("compliant"))
         cis_total = len(cis)
 
         benchmark_comparisons: list[BenchmarkComparison] = [
-            BenchmarkComparison(
+            BenchmarkComparison.model_construct(
                 framework="DORA",
                 level_or_status=dora_level.upper(),
                 summary=(
@@ -524,14 +887,14 @@ class DevOpsAnalyzer:
                 ),
                 details={
                     "level": dora_level,
-                    "deployment_frequency": dora_data.get("deployment_frequency", ""),
-                    "lead_time": dora_data.get("lead_time", ""),
-                    "change_failure_rate": dora_data.get("change_failure_rate", ""),
-                    "mttr": dora_data.get("mttr", ""),
-                    "score_threshold": dora_data.get("score_threshold", 0),
+                    "deployment_frequency": dora_data.deployment_frequency,
+                    "lead_time": dora_data.lead_time,
+                    "change_failure_rate": dora_data.change_failure_rate,
+                    "mttr": dora_data.mttr,
+                    "score_threshold": dora_data.score_threshold,
                 },
             ),
-            BenchmarkComparison(
+            BenchmarkComparison.model_construct(
                 framework="OpenSSF",
                 level_or_status=f"{openssf_passed_count}/{openssf_total} categories satisfied",
                 summary=(
@@ -540,27 +903,24 @@ class DevOpsAnalyzer:
                 ),
                 details={cat: ok for cat, ok in openssf.items()},
             ),
-            BenchmarkComparison(
+            BenchmarkComparison.model_construct(
                 framework="SLSA",
                 level_or_status=f"Level {slsa_level}",
                 summary=(
                     f"{org_name} achieves SLSA Build Level {slsa_level} "
                     + (
-                        f"({SLSA_LEVELS[slsa_level]['name']} — "
-                        f"{SLSA_LEVELS[slsa_level]['description']})."
-                        if slsa_level > 0
+                        f"({slsa_data.name} — {slsa_data.description})."
+                        if slsa_data is not None
                         else "(no SLSA requirements currently satisfied)."
                     )
                 ),
                 details={
                     "level": slsa_level,
-                    "name": SLSA_LEVELS[slsa_level]["name"] if slsa_level > 0 else "None",
-                    "description": (
-                        SLSA_LEVELS[slsa_level]["description"] if slsa_level > 0 else ""
-                    ),
+                    "name": slsa_data.name if slsa_data is not None else "None",
+                    "description": slsa_data.description if slsa_data is not None else "",
                 },
             ),
-            BenchmarkComparison(
+            BenchmarkComparison.model_construct(
                 framework="CIS",
                 level_or_status=f"{cis_compliant}/{cis_total} domains compliant",
                 summary=(
@@ -581,14 +941,13 @@ class DevOpsAnalyzer:
         ]
 
         # Identify the lowest-scoring categories as risk highlights.
-        sorted_cats = sorted(
-            [cs for cs in category_scores.values() if cs.max_score > 0],
-            key=lambda cs: cs.percentage,
-        )
+        low_cats = [
+            cs for _, cs in heapq.nsmallest(5, active, key=lambda pair: pair[1].percentage)
+        ]
         risk_highlights: list[str] = [
             f"Low {cs.category.value} posture — score {cs.percentage:.1f}% "
             f"with {cs.fail_count} failed checks."
-            for cs in sorted_cats[:5]
+            for cs in low_cats
             if cs.percentage < 70
         ] or [
             f"Overall score of {overall_score:.2f}/100 indicates room for "
@@ -606,7 +965,7 @@ class DevOpsAnalyzer:
 
         platform_name = get_display_name(platform)
 
-        return AnalysisResult(
+        return AnalysisResult.model_construct(
             executive_summary=(
                 f"{org_name} DevOps Assessment Summary ({platform_name})\n\n"
                 f"The automated {platform_name} assessment of {org_name} produced "
@@ -623,7 +982,7 @@ class DevOpsAnalyzer:
             ),
             category_narratives=narratives,
             recommendations=[
-                Recommendation(
+                Recommendation.model_construct(
                     priority=1,
                     title="Review and address all failed checks",
                     description=(
@@ -653,4 +1012,26 @@ class DevOpsAnalyzer:
 # Module-level singleton
 # ---------------------------------------------------------------------------
 
-analyzer: DevOpsAnalyzer = DevOpsAnalyzer(client=analysis_client)
+
+@functools.cache
+def get_analyzer() -> DevOpsAnalyzer:
+    """Return the process-wide :class:`DevOpsAnalyzer`, creating it on first use."""
+    return DevOpsAnalyzer(
+        client=get_analysis_client(),
+        semantic_cache=(
+            SemanticCache(
+                threshold=settings.ANALYSIS_SEMANTIC_CACHE_THRESHOLD,
+                maxsize=settings.ANALYSIS_CACHE_SIZE,
+                ttl=settings.ANALYSIS_CACHE_TTL,
+            )
+            if settings.ANALYSIS_CACHE_TTL > 0 and settings.ANALYSIS_SEMANTIC_CACHE_THRESHOLD > 0
+            else None
+        ),
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve the ``analyzer`` alias lazily (PEP 562).
+    if name == "analyzer":
+        return get_analyzer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+"""In-process response cache for :class:`~backend.analysis.client.AnalysisClient`.
+
+Re-running an assessment against an unchanged organisation produces a
+byte-identical prompt, and answering it again costs a full model round-trip.
+:class:`ResponseCache` keeps recent responses keyed by a SHA-256 digest of the
+model, system prompt, and user prompt, bounded both by entry count (least
+recently used entries are evicted first) and by age.
+
+:class:`SemanticCache` is used one level up by
+:class:`~backend.analysis.analyzer.DevOpsAnalyzer` to reuse a whole analysis
+when a rescan's data is merely near-identical to a previous one.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Word tokens used to embed prompts for :class:`SemanticCache`.
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class ResponseCache:
+    """A size- and TTL-bounded LRU mapping of prompt digests to response text.
+
+    Args:
+        maxsize: Maximum number of responses retained.
+        ttl:     Seconds a response stays valid after it is stored.
+        clock:   Monotonic time source; injectable for tests.
+
+    Example::
+
+        cache = ResponseCache(maxsize=500, ttl=3600)
+        key = ResponseCache.make_key(model, system, prompt)
+        if (text := cache.get(key)) is None:
+            text = await call_model(...)
+            cache.set(key, text)
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, system: str, prompt: str) -> str:
+        """Return the cache key for one ``(model, system, prompt)`` request."""
+        return hashlib.sha256(f"{model}\0{system}\0{prompt}".encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for *key*, or ``None`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, text = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                logger.debug("ResponseCache: hit (%d hits, %d misses).", self.hits, self.misses)
+                return text
+            del self._entries[key]
+
+        self.misses += 1
+        logger.debug("ResponseCache: miss (%d hits, %d misses).", self.hits, self.misses)
+        return None
+
+    def set(self, key: str, text: str) -> None:
+        """Store *text* under *key*, evicting the least recently used entry if full."""
+        self._entries[key] = (self._clock() + self._ttl, text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticCache:
+    """Nearest-neighbour cache for values derived from near-identical text.
+
+    Successive scans of an unchanged organisation often produce scan data
+    that differs only in a few numbers.  Each stored text is embedded as a
+    normalised hashed term-frequency vector; a lookup returns the value whose
+    text has the highest cosine similarity within the same *scope*, provided
+    it reaches *threshold*.
+
+    Callers should embed only the varying content (boilerplate shared by
+    every entry inflates similarity) and scope entries so that unrelated
+    subjects can never match each other.
+
+    Args:
+        threshold:  Minimum cosine similarity in ``(0, 1]`` for a hit.
+        maxsize:    Maximum number of values retained.
+        ttl:        Seconds a value stays valid after it is stored.
+        dimensions: Number of hash buckets in each embedding.
+        clock:      Monotonic time source; injectable for tests.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        maxsize: int,
+        ttl: float,
+        dimensions: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = threshold
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._dimensions = dimensions
+        self._clock = clock
+        # Keyed by (scope, text) so re-storing the same text replaces it.
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[int, float], Any]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def _embed(self, text: str) -> dict[int, float]:
+        """Return the L2-normalised sparse hashed term-frequency vector of *text*."""
+        counts: dict[int, float] = {}
+        for token in _TOKEN_RE.findall(text.lower()):
+            bucket = zlib.crc32(token.encode()) % self._dimensions
+            counts[bucket] = counts.get(bucket, 0.0) + 1.0
+        norm = math.sqrt(sum(v * v for v in counts.values()))
+        return {k: v / norm for k, v in counts.items()} if norm else {}
+
+    def get(self, scope: str, text: str) -> Any | None:
+        """Return the value stored for the most similar text in *scope*, or ``None``."""
+        now = self._clock()
+        query = self._embed(text)
+        best_key: tuple[str, str] | None = None
+        best_score = self._threshold
+        for key, (expires_at, vector, _value) in list(self._entries.items()):
+            if expires_at <= now:
+                del self._entries[key]
+                continue
+            if key[0] != scope:
+                continue
+            score = sum(weight * vector.get(bucket, 0.0) for bucket, weight in query.items())
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(best_key)
+        self.hits += 1
+        logger.debug("SemanticCache: hit at similarity %.3f.", best_score)
+        return self._entries[best_key][2]
+
+    def set(self, scope: str, text: str, value: Any) -> None:
+        """Store *value* for *text* in *scope*, evicting the LRU entry if full."""
+        key = (scope, text)
+        self._entries[key] = (self._clock() + self._ttl, self._embed(text), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
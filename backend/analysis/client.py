@@ -3,20 +3,34 @@ from __future__ import annotations
 """Thin async wrapper around the Anthropic Messages API.
 
 :class:`AnalysisClient` owns a single :class:`anthropic.AsyncAnthropic`
-instance and exposes a single coroutine — :meth:`AnalysisClient.analyze` —
-that sends a prompt to the model and returns the raw text response.
-
-A module-level singleton :data:`analysis_client` is created at import time
-using :data:`~backend.config.settings`.  When ``ANTHROPIC_API_KEY`` is not
-configured the singleton is still constructed but any call to
+instance and exposes :meth:`AnalysisClient.analyze`, which sends a prompt to
+the model and returns the response text, plus
+:meth:`AnalysisClient.analyze_stream` to consume the text as it is generated
+and :meth:`AnalysisClient.analyze_batch` for bulk runs.  Both can force a
+structured response through tool use by passing an ``output_schema``.
+
+The process-wide client is returned by :func:`get_analysis_client` and built
+from :data:`~backend.config.settings` on first use, so importing this module
+costs no SDK or HTTP setup; ``analysis_client`` remains importable as an alias
+for it.  When ``ANTHROPIC_API_KEY`` is not configured the client is still
+constructed but any call to
 :meth:`~AnalysisClient.analyze` will raise :class:`AnalysisClientError` with
 a descriptive message rather than an obscure Anthropic SDK error.
 """
 
+import asyncio
+import functools
 import logging
+import sys
+from collections.abc import AsyncIterator
+from typing import Any
 
 import anthropic
+import httpx
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
 
+from backend.analysis.cache import ResponseCache
 from backend.config import settings
 
 logger = logging.getLogger(__name__)
@@ -26,7 +40,19 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 _MODEL: str = "claude-opus-4-6"
+# Default output cap; override per client with ``max_tokens``.
 _MAX_TOKENS: int = 8192
+# Tool the model is forced to call when a structured response is requested.
+# The prompts in backend.analysis.prompts refer to it by name.
+_OUTPUT_TOOL_NAME: str = "record_analysis"
+
+# Batch status polling backs off exponentially between these bounds (seconds).
+_BATCH_POLL_INITIAL: float = 5.0
+_BATCH_POLL_MAX: float = 60.0
+
+# Connection pool shared by every AnalysisClient; see _shared_http_client().
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_http_client: httpx.AsyncClient | None = None
 
 # ---------------------------------------------------------------------------
 # Custom exception
@@ -51,6 +77,17 @@ class AnalysisClient:
                  but will cause :meth:`analyze` to raise
                  :class:`AnalysisClientError` immediately rather than
                  forwarding the request to the API.
+        cache:   Optional :class:`~backend.analysis.cache.ResponseCache`.
+                 When given, identical ``(system, prompt)`` requests are
+                 answered from it instead of calling the API again.
+        max_retries: How many times the SDK retries a request that failed
+                 with a rate limit (429), an overloaded or server error
+                 (5xx), or a connection error.  Retries back off
+                 exponentially with jitter and honour ``retry-after``;
+                 other 4xx errors are never retried.
+        max_tokens: Output-token cap for each request.  Responses that hit it
+                 are logged as truncated, and every response logs its token
+                 usage so the cap can be tuned to observed sizes.
 
     Example::
 
@@ -58,10 +95,23 @@ class AnalysisClient:
         text = await client.analyze(prompt="...", system="...")
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        cache: ResponseCache | None = None,
+        max_retries: int = anthropic.DEFAULT_MAX_RETRIES,
+        max_tokens: int = _MAX_TOKENS,
+    ) -> None:
+        self._cache = cache
+        self._max_tokens = max_tokens
+        # Requests currently awaiting the API, so identical concurrent calls
+        # share one response instead of each being billed.
+        self._inflight: dict[str, asyncio.Task[str]] = {}
         if api_key:
             self._client: anthropic.AsyncAnthropic | None = anthropic.AsyncAnthropic(
-                api_key=api_key
+                api_key=api_key,
+                max_retries=max_retries,
+                http_client=_shared_http_client(),
             )
             logger.debug("AnalysisClient: Anthropic async client initialised.")
         else:
@@ -75,22 +125,38 @@ class AnalysisClient:
     # Public API
     # ------------------------------------------------------------------
 
-    async def analyze(self, prompt: str, system: str) -> str:
-        """Send *prompt* to Claude and return the plain-text response.
+    @property
+    def available(self) -> bool:
+        """``True`` when an API key is configured and calls can be attempted."""
+        return self._client is not None
+
+    async def analyze(
+        self,
+        prompt: str,
+        system: str,
+        output_schema: type[BaseModel] | None = None,
+    ) -> str:
+        """Send *prompt* to Claude and return the response text.
 
         Args:
             prompt: The user-turn message containing the scan data and
                     output instructions.
             system: The system-turn message that establishes the assistant
                     persona and behavioural guidelines.
+            output_schema: Optional model describing the required output.
+                    When given, the model must answer by calling a tool whose
+                    input schema is this model's JSON schema, so the structure
+                    is enforced by the API rather than requested in prose.
 
         Returns:
-            The raw text content of the first ``TextBlock`` in the response.
+            The text of the first ``TextBlock`` in the response or, with
+            *output_schema*, the tool input serialised as JSON (ready for
+            ``output_schema.model_validate_json``).
 
         Raises:
             AnalysisClientError: If the API key is absent, if the Anthropic
                 API returns an error, or if the response contains no usable
-                text content.
+                content.
         """
         if self._client is None:
             raise AnalysisClientError(
@@ -98,49 +164,390 @@ class AnalysisClient:
                 "in the environment or .env file."
             )
 
+        key = _request_key(system, prompt, output_schema)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.info("AnalysisClient.analyze: served from response cache.")
+                return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._create(key, prompt, system, output_schema))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish_inflight, key))
+        else:
+            logger.info("AnalysisClient.analyze: joining identical in-flight request.")
+        # Shielded so one caller's cancellation does not fail the others.
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: asyncio.Task[str]) -> None:
+        """Forget a completed in-flight request."""
+        self._inflight.pop(key, None)
+        # Mark any failure as retrieved; callers that were cancelled while
+        # waiting would otherwise leave it to be reported as unhandled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _create(
+        self,
+        key: str,
+        prompt: str,
+        system: str,
+        output_schema: type[BaseModel] | None,
+    ) -> str:
+        """Make the ``messages.create`` call behind :meth:`analyze`."""
+        assert self._client is not None
         logger.info(
             "AnalysisClient.analyze: calling %s (max_tokens=%d).",
             _MODEL,
-            _MAX_TOKENS,
+            self._max_tokens,
         )
 
         try:
             message = await self._client.messages.create(
-                model=_MODEL,
-                max_tokens=_MAX_TOKENS,
-                system=system,
-                messages=[{"role": "user", "content": prompt}],
+                **_message_params(prompt, system, output_schema, self._max_tokens)
+            )
+        except anthropic.APIError as exc:
+            raise _to_client_error("AnalysisClient.analyze", exc) from exc
+
+        logger.info(
+            "AnalysisClient.analyze: %d input / %d output tokens (stop_reason=%s).",
+            message.usage.input_tokens,
+            message.usage.output_tokens,
+            message.stop_reason,
+        )
+        if message.stop_reason == "max_tokens":
+            logger.warning(
+                "AnalysisClient.analyze: response truncated at max_tokens=%d.",
+                self._max_tokens,
             )
-        except anthropic.APIStatusError as exc:
-            logger.error(
-                "AnalysisClient.analyze: API status error %s — %s",
-                exc.status_code,
-                exc.message,
+
+        text = _response_text(message.content, output_schema)
+        if self._cache is not None and _is_cacheable(message.stop_reason, text, output_schema):
+            self._cache.set(key, text)
+        return text
+
+    async def analyze_stream(self, prompt: str, system: str) -> AsyncIterator[str]:
+        """Stream the response to *prompt* as text chunks while it is generated.
+
+        Unlike :meth:`analyze`, the caller can start consuming the response
+        before the model has finished writing it.  A cached response is
+        yielded as a single chunk; a stream that finishes without being
+        truncated is added to the cache.
+
+        Args:
+            prompt: The user-turn message.
+            system: The system-turn message.
+
+        Yields:
+            Successive chunks of the response text.
+
+        Raises:
+            AnalysisClientError: If the API key is absent or the Anthropic
+                API returns an error.
+        """
+        if self._client is None:
+            raise AnalysisClientError(
+                "Anthropic API key is not configured.  Set ANTHROPIC_API_KEY "
+                "in the environment or .env file."
+            )
+
+        key = _request_key(system, prompt, None)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.info("AnalysisClient.analyze_stream: served from response cache.")
+                yield cached
+                return
+
+        logger.info(
+            "AnalysisClient.analyze_stream: streaming from %s (max_tokens=%d).",
+            _MODEL,
+            self._max_tokens,
+        )
+        chunks: list[str] = []
+        try:
+            async with self._client.messages.stream(
+                **_message_params(prompt, system, None, self._max_tokens)
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    yield text
+                message = await stream.get_final_message()
+        except anthropic.APIError as exc:
+            raise _to_client_error("AnalysisClient.analyze_stream", exc) from exc
+
+        logger.info(
+            "AnalysisClient.analyze_stream: %d input / %d output tokens (stop_reason=%s).",
+            message.usage.input_tokens,
+            message.usage.output_tokens,
+            message.stop_reason,
+        )
+        if message.stop_reason == "max_tokens":
+            logger.warning(
+                "AnalysisClient.analyze_stream: response truncated at max_tokens=%d.",
+                self._max_tokens,
             )
+
+        text = "".join(chunks)
+        if self._cache is not None and _is_cacheable(message.stop_reason, text, None):
+            self._cache.set(key, text)
+
+    async def analyze_batch(
+        self,
+        prompts: list[str],
+        system: str,
+        output_schema: type[BaseModel] | None = None,
+    ) -> list[str | AnalysisClientError]:
+        """Submit *prompts* as one Message Batch and return the responses.
+
+        The batch status is polled with exponential backoff, from
+        :data:`_BATCH_POLL_INITIAL` up to :data:`_BATCH_POLL_MAX` seconds
+        between polls, until processing ends.  Batches are priced and
+        scheduled for throughput, not latency, so results may take minutes to
+        arrive.  Prompts already in the response cache are answered from it
+        and left out of the batch.
+
+        Args:
+            prompts: User-turn messages, one per request.
+            system:  The system-turn message shared by every request.
+            output_schema: Optional model describing the required output; see
+                     :meth:`analyze`.
+
+        Returns:
+            One entry per prompt, in order: the response text (JSON with
+            *output_schema*), or an :class:`AnalysisClientError` describing
+            why that request failed.
+
+        Raises:
+            AnalysisClientError: If the API key is absent or the batch itself
+                could not be created or polled.
+        """
+        if self._client is None:
             raise AnalysisClientError(
-                f"Anthropic API returned HTTP {exc.status_code}: {exc.message}"
-            ) from exc
-        except anthropic.APIConnectionError as exc:
-            logger.error("AnalysisClient.analyze: connection error — %s", exc)
-            raise AnalysisClientError(f"Failed to connect to Anthropic API: {exc}") from exc
+                "Anthropic API key is not configured.  Set ANTHROPIC_API_KEY "
+                "in the environment or .env file."
+            )
+
+        outcomes: list[str | AnalysisClientError] = [
+            AnalysisClientError("Batch response is missing this request.") for _ in prompts
+        ]
+        cache_keys: list[str] = []
+        pending: list[int] = list(range(len(prompts)))
+        if self._cache is not None:
+            cache_keys = [_request_key(system, prompt, output_schema) for prompt in prompts]
+            pending = []
+            for i, key in enumerate(cache_keys):
+                cached = self._cache.get(key)
+                if cached is None:
+                    pending.append(i)
+                else:
+                    outcomes[i] = cached
+            if not pending:
+                return outcomes
+
+        logger.info(
+            "AnalysisClient.analyze_batch: submitting %d requests to %s.",
+            len(pending),
+            _MODEL,
+        )
+
+        batches = self._client.messages.batches
+        try:
+            batch = await batches.create(
+                requests=[
+                    {
+                        "custom_id": str(i),
+                        "params": _message_params(
+                            prompts[i], system, output_schema, self._max_tokens
+                        ),
+                    }
+                    for i in pending
+                ]
+            )
+            delay = _BATCH_POLL_INITIAL
+            while batch.processing_status != "ended":
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _BATCH_POLL_MAX)
+                batch = await batches.retrieve(batch.id)
+
+            async for entry in await batches.results(batch.id):
+                result = entry.result
+                i = int(entry.custom_id)
+                if result.type == "succeeded":
+                    try:
+                        outcome: str | AnalysisClientError = _response_text(
+                            result.message.content, output_schema
+                        )
+                    except AnalysisClientError as exc:
+                        outcome = exc
+                    else:
+                        if self._cache is not None and _is_cacheable(
+                            result.message.stop_reason, outcome, output_schema
+                        ):
+                            self._cache.set(cache_keys[i], outcome)
+                elif result.type == "errored":
+                    outcome = AnalysisClientError(
+                        f"Anthropic API error: {result.error.error.message}"
+                    )
+                else:
+                    outcome = AnalysisClientError(f"Batch request {result.type}.")
+                outcomes[i] = outcome
         except anthropic.APIError as exc:
-            logger.error("AnalysisClient.analyze: unexpected API error — %s", exc)
-            raise AnalysisClientError(f"Anthropic API error: {exc}") from exc
+            raise _to_client_error("AnalysisClient.analyze_batch", exc) from exc
 
-        # Extract text from the first TextBlock in the response.
-        for block in message.content:
-            if hasattr(block, "text"):
-                logger.debug(
-                    "AnalysisClient.analyze: received %d characters.",
-                    len(block.text),
-                )
-                return block.text
+        return outcomes
 
-        raise AnalysisClientError("Anthropic API response contained no text content blocks.")
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use.
+
+    Clients re-created later (for example after key rotation) reuse the same
+    pool, so they skip fresh DNS lookups and TLS handshakes.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = anthropic.DefaultAsyncHttpxClient(limits=_HTTP_LIMITS)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client; called from the application shutdown hook.
+
+    The process-wide client and analyzer are bound to the pool being closed,
+    so they are dropped too and rebuilt on a fresh pool when next requested.
+    """
+    global _http_client
+    get_analysis_client.cache_clear()
+    # The analyzer module imports this one, so it is looked up rather than imported.
+    analyzer_module = sys.modules.get("backend.analysis.analyzer")
+    if analyzer_module is not None:
+        analyzer_module.get_analyzer.cache_clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@functools.lru_cache(maxsize=8)
+def _output_tool(output_schema: type[BaseModel]) -> dict[str, Any]:
+    """Return the forced-output tool definition for *output_schema*."""
+    return {
+        "name": _OUTPUT_TOOL_NAME,
+        "description": "Record the complete structured result of the analysis.",
+        "input_schema": output_schema.model_json_schema(),
+    }
+
+
+def _message_params(
+    prompt: str, system: str, output_schema: type[BaseModel] | None, max_tokens: int
+) -> dict[str, Any]:
+    """Build the ``messages.create`` keyword arguments for one request."""
+    params: dict[str, Any] = {
+        "model": _MODEL,
+        "max_tokens": max_tokens,
+        # Cache breakpoint: the tools and system prompt are identical across
+        # scans, so later requests reuse the cached prefix.
+        "system": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    if output_schema is not None:
+        params["tools"] = [_output_tool(output_schema)]
+        params["tool_choice"] = {"type": "tool", "name": _OUTPUT_TOOL_NAME}
+    return params
+
+
+def _request_key(system: str, prompt: str, output_schema: type[BaseModel] | None) -> str:
+    """Return the cache/in-flight key for one request."""
+    if output_schema is not None:
+        system = f"{system}\0{output_schema.__module__}.{output_schema.__qualname__}"
+    return ResponseCache.make_key(_MODEL, system, prompt)
+
+
+def _response_text(content: list[Any], output_schema: type[BaseModel] | None) -> str:
+    """Return a response's text, or its forced tool input as JSON."""
+    if output_schema is None:
+        return _first_text(content)
+
+    for block in content:
+        if getattr(block, "type", None) == "tool_use":
+            return to_json(block.input).decode()
+
+    raise AnalysisClientError("Anthropic API response contained no tool_use block.")
+
+
+def _is_cacheable(
+    stop_reason: str | None, text: str, output_schema: type[BaseModel] | None
+) -> bool:
+    """Return whether a response is complete and valid enough to cache.
+
+    A response cut off at ``max_tokens``, or one that does not validate
+    against *output_schema*, would otherwise be replayed from the cache for
+    the whole TTL instead of being retried.
+    """
+    if stop_reason == "max_tokens":
+        return False
+    if output_schema is None:
+        return True
+    try:
+        output_schema.model_validate_json(text)
+    except ValidationError:
+        return False
+    return True
+
+
+def _to_client_error(caller: str, exc: anthropic.APIError) -> AnalysisClientError:
+    """Log *exc* and translate it into an :class:`AnalysisClientError`."""
+    if isinstance(exc, anthropic.APIStatusError):
+        logger.error("%s: API status error %s — %s", caller, exc.status_code, exc.message)
+        return AnalysisClientError(f"Anthropic API returned HTTP {exc.status_code}: {exc.message}")
+    if isinstance(exc, anthropic.APIConnectionError):
+        logger.error("%s: connection error — %s", caller, exc)
+        return AnalysisClientError(f"Failed to connect to Anthropic API: {exc}")
+    logger.error("%s: unexpected API error — %s", caller, exc)
+    return AnalysisClientError(f"Anthropic API error: {exc}")
+
+
+def _first_text(content: list[Any]) -> str:
+    """Return the text of the first ``TextBlock`` in a message's *content*."""
+    for block in content:
+        if hasattr(block, "text"):
+            logger.debug("AnalysisClient: received %d characters.", len(block.text))
+            return block.text
+
+    raise AnalysisClientError("Anthropic API response contained no text content blocks.")
 
 
 # ---------------------------------------------------------------------------
 # Module-level singleton
 # ---------------------------------------------------------------------------
 
-analysis_client: AnalysisClient = AnalysisClient(api_key=settings.ANTHROPIC_API_KEY)
+
+@functools.cache
+def get_analysis_client() -> AnalysisClient:
+    """Return the process-wide :class:`AnalysisClient`, creating it on first use."""
+    return AnalysisClient(
+        api_key=settings.ANTHROPIC_API_KEY,
+        cache=(
+            ResponseCache(
+                maxsize=settings.ANALYSIS_CACHE_SIZE,
+                ttl=settings.ANALYSIS_CACHE_TTL,
+            )
+            if settings.ANALYSIS_CACHE_TTL > 0
+            else None
+        ),
+        max_retries=settings.ANALYSIS_MAX_RETRIES,
+        max_tokens=settings.ANALYSIS_MAX_TOKENS,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve the ``analysis_client`` alias lazily (PEP 562).
+    if name == "analysis_client":
+        return get_analysis_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,10 @@ from __future__ import annotations
 Two string constants are exported:
 
 * :data:`SYSTEM_PROMPT` — the system message that establishes the assistant
-  persona and behavioural constraints for the analysis session.
+  persona, behavioural constraints, and output guidance for the analysis
+  session.  It is identical for every scan and is sent as a prompt-cache
+  breakpoint, so keep all static instructions here rather than in the user
+  template.
 * :data:`USER_PROMPT_TEMPLATE` — a :meth:`str.format` template that is
   hydrated by :class:`~backend.analysis.analyzer.DevOpsAnalyzer` with
   scan-specific data before being sent to the model.
@@ -42,11 +45,14 @@ The placeholder keys used in :data:`USER_PROMPT_TEMPLATE` are:
 ``{benchmark_data}``
     A pre-formatted text block of all benchmark framework results, produced
     by
-    :meth:`~backend.analysis.analyzer.DevOpsAnalyzer._format_benchmark_data`.
-
-``{json_schema}``
-    The JSON schema of :class:`~backend.analysis.schemas.AnalysisResult`
-    injected at call time so the model can produce a conformant response.
+    :func:`~backend.analysis.analyzer._format_benchmark_data`.
+
+The response structure is not described in the prompts: the model is forced
+to answer through the ``record_analysis`` tool, whose input schema is the
+:class:`~backend.analysis.schemas.AnalysisResult` JSON schema (see
+:meth:`~backend.analysis.client.AnalysisClient.analyze`).  Per-field length
+and content guidance lives in that schema's ``Field`` descriptions, so it is
+stated once rather than repeated here.
 """
 
 # ---------------------------------------------------------------------------
@@ -54,59 +60,33 @@ The placeholder keys used in :data:`USER_PROMPT_TEMPLATE` are:
 # ---------------------------------------------------------------------------
 
 SYSTEM_PROMPT: str = """\
-You are a senior DevOps consultant and security architect with 15+ years of \
-experience helping organisations improve their software delivery practices. \
-You specialise in writing professional, board-level DevOps maturity assessment \
-reports that are both technically accurate and accessible to non-technical \
-stakeholders.
-
-## Your responsibilities in this session
-
-You will be given structured scan data from an automated DevOps assessment \
-tool that has evaluated an organisation's repositories across sixteen domains: \
-Platform Architecture, Identity & Access, Repository Governance, CI/CD, \
-Secrets Management, Dependencies, SAST, DAST, Container Security, \
-Code Quality, SDLC Process, Compliance, Collaboration, Disaster Recovery, \
-Monitoring & Observability, and Migration Readiness. Your task is to analyse \
-this data and produce a thorough, professional assessment report in structured \
-JSON format.
-
-## Tone and style
-
-- Write in a professional, consultative tone — authoritative but constructive.
-- Be specific and evidence-based; reference actual check IDs and findings \
-  where relevant.
-- Avoid vague language. Replace phrases such as "consider improving" with \
-  concrete, actionable guidance (e.g. "Enable required pull-request reviews \
-  on the default branch for all repositories via branch-protection rules").
-- Acknowledge genuine strengths before addressing gaps — a credible assessment \
-  is balanced.
-- Calibrate language to the audience: the executive summary should be \
-  understandable by a CTO or CISO; the recommendation descriptions may be \
-  more technical.
-
-## Analysis guidelines
-
-- **Prioritise actionable recommendations** — every recommendation must \
-  describe a concrete change the organisation can make, not just a goal.
-- **Use DORA, OpenSSF, SLSA, and CIS benchmarks** to contextualise findings \
-  against industry standards. Reference the specific framework level or \
-  category where applicable.
-- **Risk assessment must be data-driven** — only highlight risks that are \
-  evidenced by failed checks or low scores. Do not speculate.
-- **Effort and impact estimates** should reflect realistic implementation \
-  complexity: a "low" effort item should be achievable in hours to a day; \
-  "medium" in days to a week; "high" in weeks or requiring organisational \
-  change.
-- **Order recommendations by business impact** — items that reduce the most \
-  risk or unblock the most value should appear first (priority 1).
-
-## Output format
-
-You MUST return ONLY a valid JSON object that conforms exactly to the \
-AnalysisResult schema provided in the user message. Do not include any \
-prose, markdown fences, or commentary outside the JSON object. The JSON \
-must be parseable by `json.loads()` without modification.\
+You are a senior DevOps consultant and security architect writing a \
+board-level DevOps maturity assessment from automated scan data covering \
+sixteen domains. It must be technically accurate yet accessible to \
+non-technical stakeholders.
+
+## Style
+
+- Professional and consultative: authoritative but constructive.
+- Specific and evidence-based; cite check IDs and findings.
+- Concrete actions, never vague advice (say "Enable required pull-request \
+  reviews on the default branch via branch-protection rules", not "consider \
+  improving reviews").
+- Balanced: acknowledge genuine strengths before gaps.
+- Executive summary readable by a CTO or CISO; recommendations may be \
+  technical.
+
+## Analysis
+
+- Every recommendation is a concrete change, not a goal, and order them by \
+  business impact: most risk reduced or value unblocked first.
+- Contextualise findings with the DORA, OpenSSF, SLSA, and CIS results, \
+  citing the level or category.
+- Only raise risks evidenced by failed checks or low scores; do not speculate.
+- Follow the field descriptions in the tool schema for length and content.
+
+Submit the complete assessment by calling the `record_analysis` tool exactly \
+once, with no prose outside the tool call.\
 """
 
 # ---------------------------------------------------------------------------
@@ -152,11 +132,6 @@ where relevant:
 # ---------------------------------------------------------------------------
 
 USER_PROMPT_TEMPLATE: str = """\
-Please analyse the following DevOps assessment data for {org_name} and \
-produce a comprehensive assessment report.
-
----
-
 ## Assessment overview
 
 - **Organisation:** {org_name}
@@ -189,48 +164,5 @@ produce a comprehensive assessment report.
 
 ## Industry benchmark results
 
-{benchmark_data}
-
----
-
-## Output instructions
-
-Return a JSON object that conforms EXACTLY to the following schema. Do not \
-include any text outside the JSON object.
-
-```json
-{json_schema}
-```
-
-### Field-level guidance
-
-- `executive_summary`: Write 3–5 paragraphs suitable for a C-suite audience. \
-  Cover the overall posture (cite the score and DORA level), the two or three \
-  most critical risks, specific strengths worth acknowledging, and a clear \
-  recommended path forward. Reference industry benchmarks where they add \
-  context.
-
-- `category_narratives`: Provide one entry per assessed category. The \
-  `summary` field must be 2–3 sentences. `strengths` and `weaknesses` should \
-  each contain 2–5 bullet-style strings. `key_findings` should contain the \
-  3–5 most significant individual findings for that category.
-
-- `recommendations`: Provide 5–10 recommendations ordered by priority \
-  (1 = most urgent). Each recommendation must map to specific failed check \
-  IDs via the `check_ids` field. Effort and impact must be one of \
-  "low", "medium", or "high".
-
-- `benchmark_comparisons`: Include one entry each for DORA, OpenSSF, SLSA, \
-  and CIS. Use the benchmark data provided above. The `details` field should \
-  contain the raw breakdown data (e.g. OpenSSF category pass/fail, CIS domain \
-  percentages).
-
-- `overall_maturity_assessment`: Write 1–2 paragraphs characterising the \
-  organisation's overall DevOps maturity level and trajectory. Reference the \
-  DORA performance band and compare against typical organisations at a similar \
-  stage.
-
-- `risk_highlights`: Provide 3–5 concise, one-sentence risk statements \
-  focusing on the most critical security or operational threats evidenced by \
-  the scan data.\
+{benchmark_data}\
 """
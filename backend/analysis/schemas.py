@@ -6,15 +6,20 @@ analysis step.
 These schemas serve two purposes:
 
 1. They define the JSON structure that Claude is instructed to return so that
-   the response can be validated and deserialized without ambiguity.
+   the response can be validated and deserialized without ambiguity.  The
+   ``Field`` descriptions reach the model through the tool input schema and
+   carry the per-field writing guidance.
 2. They provide a stable, typed contract between the :mod:`analysis` package
    and the rest of the application (report generation, API responses, etc.).
 """
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+Rating = Literal["low", "medium", "high"]
+"""Rating scale shared by :attr:`Recommendation.effort` and :attr:`Recommendation.impact`."""
+
 
 class Recommendation(BaseModel):
     """A single prioritised, actionable recommendation for the organisation.
@@ -39,15 +44,23 @@ class Recommendation(BaseModel):
 
     priority: int = Field(..., ge=1, description="Ordinal priority; 1 is highest.")
     title: str = Field(..., min_length=1, description="Short imperative title.")
-    description: str = Field(..., min_length=1, description="Detailed remediation guidance.")
+    description: str = Field(
+        ...,
+        min_length=1,
+        description="A concrete change to make, its business impact, and remediation steps.",
+    )
     category: str = Field(..., min_length=1, description="DevOps category label.")
-    effort: str = Field(
-        ..., pattern=r"^(low|medium|high)$", description="Implementation effort level."
+    effort: Rating = Field(
+        ...,
+        description=(
+            "Implementation effort: low = hours to a day, medium = days to a week, "
+            "high = weeks or organisational change."
+        ),
     )
-    impact: str = Field(
-        ..., pattern=r"^(low|medium|high)$", description="Expected impact level if addressed."
+    impact: Rating = Field(..., description="Expected impact level if addressed.")
+    check_ids: list[str] = Field(
+        default_factory=list, description="The failed check IDs this addresses."
     )
-    check_ids: list[str] = Field(default_factory=list, description="Related scanner check IDs.")
 
 
 class CategoryNarrative(BaseModel):
@@ -70,9 +83,11 @@ class CategoryNarrative(BaseModel):
     category: str = Field(..., min_length=1, description="Category identifier.")
     score_percentage: float = Field(..., ge=0.0, le=100.0, description="Category score 0–100.")
     summary: str = Field(..., min_length=1, description="2–3 sentence prose summary.")
-    strengths: list[str] = Field(default_factory=list, description="Positive findings.")
-    weaknesses: list[str] = Field(default_factory=list, description="Gap areas.")
-    key_findings: list[str] = Field(default_factory=list, description="Most significant findings.")
+    strengths: list[str] = Field(default_factory=list, description="2–5 positive findings.")
+    weaknesses: list[str] = Field(default_factory=list, description="2–5 gap areas.")
+    key_findings: list[str] = Field(
+        default_factory=list, description="The 3–5 most significant findings."
+    )
 
 
 class BenchmarkComparison(BaseModel):
@@ -94,7 +109,10 @@ class BenchmarkComparison(BaseModel):
     framework: str = Field(..., description="Benchmark framework name.")
     level_or_status: str = Field(..., description="Achieved level or compliance status.")
     summary: str = Field(..., min_length=1, description="Contextual summary.")
-    details: dict[str, Any] = Field(default_factory=dict, description="Framework-specific details.")
+    details: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Raw breakdown, e.g. OpenSSF category pass/fail or CIS domain percentages.",
+    )
 
 
 class AnalysisResult(BaseModel):
@@ -127,26 +145,35 @@ class AnalysisResult(BaseModel):
     """
 
     executive_summary: str = Field(
-        ..., min_length=1, description="3–5 paragraph executive summary."
+        ...,
+        min_length=1,
+        description=(
+            "3–5 paragraphs for a C-suite audience: overall posture (cite the score "
+            "and DORA level), the 2–3 most critical risks, strengths worth "
+            "acknowledging, and a recommended path forward."
+        ),
     )
     category_narratives: list[CategoryNarrative] = Field(
         default_factory=list,
-        description="Per-category narratives.",
+        description="One narrative per assessed category.",
     )
     recommendations: list[Recommendation] = Field(
         default_factory=list,
-        description="Ordered recommendations (priority 1 first).",
+        description="5–10 recommendations ordered by priority (1 = most urgent).",
     )
     benchmark_comparisons: list[BenchmarkComparison] = Field(
         default_factory=list,
-        description="Industry benchmark alignment data.",
+        description="One entry each for DORA, OpenSSF, SLSA, and CIS, from the benchmark data.",
     )
     overall_maturity_assessment: str = Field(
         ...,
         min_length=1,
-        description="1–2 paragraph overall maturity statement.",
+        description=(
+            "1–2 paragraphs on maturity and trajectory, placing the organisation in "
+            "its DORA band against typical peers."
+        ),
     )
     risk_highlights: list[str] = Field(
         default_factory=list,
-        description="Top 3–5 critical risk items.",
+        description="3–5 one-sentence statements of the most critical risks the data evidences.",
     )
@@ -13,27 +13,51 @@ Use :func:`calculate_cis_compliance` to produce a structured compliance report
 suitable for inclusion in a generated assessment report.
 """
 
-CIS_CONTROLS: dict[str, dict[str, object]] = {
-    "source-code": {
-        "description": "Source Code Management",
-        "checks": ["REPO-001", "REPO-002", "REPO-006", "REPO-008"],
-    },
-    "build-pipelines": {
-        "description": "Build Pipelines",
-        "checks": ["CICD-001", "CICD-003", "CICD-005"],
-    },
-    "dependencies": {
-        "description": "Dependencies",
-        "checks": ["DEP-001", "DEP-002", "DEP-003"],
-    },
-    "artifacts": {
-        "description": "Artifacts",
-        "checks": ["DEP-009", "REPO-007"],
-    },
-    "deployment": {
-        "description": "Deployment",
-        "checks": ["CICD-006", "CICD-007"],
-    },
+from collections.abc import Iterable
+from typing import NamedTuple
+
+
+class CisControl(NamedTuple):
+    """Display name and required check IDs of one CIS control domain."""
+
+    description: str
+    checks: frozenset[str]
+
+
+CIS_CONTROLS: dict[str, CisControl] = {
+    "source-code": CisControl(
+        description="Source Code Management",
+        checks=frozenset({"REPO-001", "REPO-002", "REPO-006", "REPO-008"}),
+    ),
+    "build-pipelines": CisControl(
+        description="Build Pipelines",
+        checks=frozenset({"CICD-001", "CICD-003", "CICD-005"}),
+    ),
+    "dependencies": CisControl(
+        description="Dependencies",
+        checks=frozenset({"DEP-001", "DEP-002", "DEP-003"}),
+    ),
+    "artifacts": CisControl(
+        description="Artifacts",
+        checks=frozenset({"DEP-009", "REPO-007"}),
+    ),
+    "deployment": CisControl(
+        description="Deployment",
+        checks=frozenset({"CICD-006", "CICD-007"}),
+    ),
+}
+
+# One bit per CIS-mapped check, so a scan's passed checks pack into a single
+# int and a domain's passed count is a masked popcount.
+_CHECK_BITS: dict[str, int] = {
+    check_id: 1 << bit
+    for bit, check_id in enumerate(
+        sorted(frozenset().union(*(control.checks for control in CIS_CONTROLS.values())))
+    )
+}
+_CIS_MASKS: dict[str, int] = {
+    control_id: sum(_CHECK_BITS[check_id] for check_id in control.checks)
+    for control_id, control in CIS_CONTROLS.items()
 }
 
 
@@ -67,14 +91,47 @@ def calculate_cis_compliance(
     """
     result: dict[str, dict[str, object]] = {}
     for control_id, control in CIS_CONTROLS.items():
-        checks: list[str] = control["checks"]  # type: ignore[assignment]
-        passed = [c for c in checks if c in passed_check_ids]
-        total = len(checks)
+        total = len(control.checks)
+        passed = len(control.checks & passed_check_ids)
         result[control_id] = {
-            "description": control["description"],
+            "description": control.description,
             "total": total,
-            "passed": len(passed),
-            "percentage": (len(passed) / total * 100) if total else 0,
-            "compliant": len(passed) == total,
+            "passed": passed,
+            "percentage": (passed / total * 100) if total else 0,
+            "compliant": passed == total,
         }
     return result
+
+
+def calculate_cis_compliance_batch(
+    passed_check_ids_per_scan: Iterable[set[str]],
+) -> dict[str, list[int]]:
+    """Return the passed-check count of every CIS domain for many scans at once.
+
+    Intended for trend views over a series of scans, where building the full
+    :func:`calculate_cis_compliance` report per scan is wasted work.  Each
+    scan's passed checks are packed into a bitmap once; every domain count is
+    then a single masked popcount.
+
+    Args:
+        passed_check_ids_per_scan: One set of passed check IDs per scan.
+
+    Returns:
+        A dict keyed by CIS domain identifier whose values hold that domain's
+        passed-check count for each scan, in input order.  Divide by the
+        domain's ``total`` from :func:`calculate_cis_compliance` for a
+        percentage.
+
+    Examples:
+        >>> counts = calculate_cis_compliance_batch([{"REPO-001"}, {"REPO-001", "REPO-002"}])
+        >>> counts["source-code"]
+        [1, 2]
+    """
+    bitmaps = [
+        sum(_CHECK_BITS.get(check_id, 0) for check_id in passed_check_ids)
+        for passed_check_ids in passed_check_ids_per_scan
+    ]
+    return {
+        control_id: [(bitmap & mask).bit_count() for bitmap in bitmaps]
+        for control_id, mask in _CIS_MASKS.items()
+    }
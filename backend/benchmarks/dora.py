@@ -18,38 +18,60 @@ four DORA performance bands so that any :class:`~backend.models.scan.Scan`
 result can be classified without manual comparison.
 """
 
-DORA_LEVELS: dict[str, dict[str, object]] = {
-    "elite": {
-        "deployment_frequency": "On-demand (multiple deploys per day)",
-        "lead_time": "Less than one hour",
-        "change_failure_rate": "0-15%",
-        "mttr": "Less than one hour",
-        "score_threshold": 85,
-    },
-    "high": {
-        "deployment_frequency": "Between once per day and once per week",
-        "lead_time": "Between one day and one week",
-        "change_failure_rate": "16-30%",
-        "mttr": "Less than one day",
-        "score_threshold": 70,
-    },
-    "medium": {
-        "deployment_frequency": "Between once per week and once per month",
-        "lead_time": "Between one week and one month",
-        "change_failure_rate": "31-45%",
-        "mttr": "Between one day and one week",
-        "score_threshold": 50,
-    },
-    "low": {
-        "deployment_frequency": "Between once per month and once per six months",
-        "lead_time": "Between one month and six months",
-        "change_failure_rate": "46-60%",
-        "mttr": "More than one week",
-        "score_threshold": 0,
-    },
+from typing import NamedTuple
+
+
+class DoraLevel(NamedTuple):
+    """Reference metrics and internal score threshold for one DORA level."""
+
+    deployment_frequency: str
+    lead_time: str
+    change_failure_rate: str
+    mttr: str
+    score_threshold: int
+
+
+DORA_LEVELS: dict[str, DoraLevel] = {
+    "elite": DoraLevel(
+        deployment_frequency="On-demand (multiple deploys per day)",
+        lead_time="Less than one hour",
+        change_failure_rate="0-15%",
+        mttr="Less than one hour",
+        score_threshold=85,
+    ),
+    "high": DoraLevel(
+        deployment_frequency="Between once per day and once per week",
+        lead_time="Between one day and one week",
+        change_failure_rate="16-30%",
+        mttr="Less than one day",
+        score_threshold=70,
+    ),
+    "medium": DoraLevel(
+        deployment_frequency="Between once per week and once per month",
+        lead_time="Between one week and one month",
+        change_failure_rate="31-45%",
+        mttr="Between one day and one week",
+        score_threshold=50,
+    ),
+    "low": DoraLevel(
+        deployment_frequency="Between once per month and once per six months",
+        lead_time="Between one month and six months",
+        change_failure_rate="46-60%",
+        mttr="More than one week",
+        score_threshold=0,
+    ),
 }
 
 
+# (threshold, level) pairs resolved once at import, highest threshold first.
+_THRESHOLDS: tuple[tuple[float, str], ...] = tuple(
+    sorted(
+        ((float(data.score_threshold), level) for level, data in DORA_LEVELS.items()),
+        reverse=True,
+    )
+)
+
+
 def classify_dora_level(overall_score: float) -> str:
     """Return the DORA performance level for a given overall assessment score.
 
@@ -74,9 +96,8 @@ def classify_dora_level(overall_score: float) -> str:
         >>> classify_dora_level(30.0)
         'low'
     """
-    for level in ("elite", "high", "medium", "low"):
-        threshold = DORA_LEVELS[level]["score_threshold"]
-        if overall_score >= threshold:  # type: ignore[operator]
+    for threshold, level in _THRESHOLDS:
+        if overall_score >= threshold:
             return level
     # Unreachable: "low" has score_threshold=0, so every finite float matches above.
     raise AssertionError(f"classify_dora_level: no level matched score {overall_score!r}")
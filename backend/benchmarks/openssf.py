@@ -13,17 +13,17 @@ every mapped check ID appears in the caller's set of passed checks.
 Updated for the 16-domain scanner architecture.
 """
 
-OPENSSF_MAPPING: dict[str, list[str]] = {
-    "Branch-Protection": ["REPO-001", "REPO-002", "REPO-003", "REPO-005", "REPO-006"],
-    "Code-Review": ["SDLC-003", "REPO-002"],
-    "CI-Tests": ["CICD-001", "CICD-003"],
-    "Vulnerabilities": ["DEP-002", "DEP-003"],
-    "Dependency-Update-Tool": ["DEP-001"],
-    "Security-Policy": ["COMP-004"],
-    "Signed-Releases": ["REPO-007"],
-    "Token-Permissions": ["IAM-008"],
-    "SAST": ["CICD-005", "SAST-001"],
-    "License": ["COMP-001"],
+OPENSSF_MAPPING: dict[str, frozenset[str]] = {
+    "Branch-Protection": frozenset({"REPO-001", "REPO-002", "REPO-003", "REPO-005", "REPO-006"}),
+    "Code-Review": frozenset({"SDLC-003", "REPO-002"}),
+    "CI-Tests": frozenset({"CICD-001", "CICD-003"}),
+    "Vulnerabilities": frozenset({"DEP-002", "DEP-003"}),
+    "Dependency-Update-Tool": frozenset({"DEP-001"}),
+    "Security-Policy": frozenset({"COMP-004"}),
+    "Signed-Releases": frozenset({"REPO-007"}),
+    "Token-Permissions": frozenset({"IAM-008"}),
+    "SAST": frozenset({"CICD-005", "SAST-001"}),
+    "License": frozenset({"COMP-001"}),
 }
 
 
@@ -47,6 +47,6 @@ def calculate_openssf_alignment(passed_check_ids: set[str]) -> dict[str, bool]:
         {'Branch-Protection': False, ..., 'License': True}
     """
     return {
-        category: all(check_id in passed_check_ids for check_id in check_ids)
-        for category, check_ids in OPENSSF_MAPPING.items()
+        category: required.issubset(passed_check_ids)
+        for category, required in OPENSSF_MAPPING.items()
     }
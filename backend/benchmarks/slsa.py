@@ -17,30 +17,48 @@ reproducible builds that cannot be reliably inferred from repository metadata
 alone.
 """
 
-SLSA_LEVELS: dict[int, dict[str, object]] = {
-    1: {
-        "name": "Build L1",
-        "description": "Provenance exists",
-        "required_checks": ["CICD-001"],
-    },
-    2: {
-        "name": "Build L2",
-        "description": "Hosted build platform",
-        "required_checks": ["CICD-001", "CICD-002"],
-    },
-    3: {
-        "name": "Build L3",
-        "description": "Hardened builds",
-        "required_checks": ["CICD-001", "CICD-002", "CICD-012", "REPO-005"],
-    },
+from typing import NamedTuple
+
+
+class SlsaLevel(NamedTuple):
+    """Name, description, and required check IDs of one SLSA build level."""
+
+    name: str
+    description: str
+    required_checks: frozenset[str]
+
+
+SLSA_LEVELS: dict[int, SlsaLevel] = {
+    1: SlsaLevel(
+        name="Build L1",
+        description="Provenance exists",
+        required_checks=frozenset({"CICD-001"}),
+    ),
+    2: SlsaLevel(
+        name="Build L2",
+        description="Hosted build platform",
+        required_checks=frozenset({"CICD-001", "CICD-002"}),
+    ),
+    3: SlsaLevel(
+        name="Build L3",
+        description="Hardened builds",
+        required_checks=frozenset({"CICD-001", "CICD-002", "CICD-012", "REPO-005"}),
+    ),
 }
 
+# (level, required checks) pairs resolved once at import, highest level first,
+# so the first satisfied level is the answer.
+_LEVELS_DESCENDING: tuple[tuple[int, frozenset[str]], ...] = tuple(
+    sorted(((level, data.required_checks) for level, data in SLSA_LEVELS.items()), reverse=True)
+)
+
 
 def calculate_slsa_level(passed_check_ids: set[str]) -> int:
     """Return the highest SLSA build level achieved by *passed_check_ids*.
 
-    Levels are evaluated in ascending order.  A level is achieved only when
-    **all** of its ``required_checks`` are present in *passed_check_ids*.
+    Levels are evaluated from highest to lowest and the first achieved level
+    is returned.  A level is achieved only when **all** of its
+    ``required_checks`` are present in *passed_check_ids*.
 
     Args:
         passed_check_ids: The set of check IDs that produced a ``passed``
@@ -60,9 +78,7 @@ def calculate_slsa_level(passed_check_ids: set[str]) -> int:
         >>> calculate_slsa_level(set())
         0
     """
-    highest = 0
-    for level, data in SLSA_LEVELS.items():
-        required: list[str] = data["required_checks"]  # type: ignore[assignment]
-        if all(cid in passed_check_ids for cid in required):
-            highest = level
-    return highest
+    for level, required in _LEVELS_DESCENDING:
+        if required.issubset(passed_check_ids):
+            return level
+    return 0
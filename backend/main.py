@@ -1,31 +1,39 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-
-from backend.config import settings
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.config import get_settings
+from backend.database import engine
+from backend.routers.connections import router as connections_router
+from backend.routers.customers import router as customers_router
+from backend.routers.dashboard import router as dashboard_router
+from backend.routers.reports import router as reports_router
+from backend.routers.scan_profiles import router as scan_profiles_router
+from backend.routers.scans import router as scans_router
 
 logger = logging.getLogger(__name__)
 
+# Explicit CORS allow-lists: Starlette precomputes the preflight response
+# headers for these instead of echoing each request's headers back.
+_CORS_METHODS: tuple[str, ...] = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+_CORS_HEADERS: tuple[str, ...] = ("Content-Type",)
+
 
 def _register_routers(app: FastAPI) -> None:
     """Attach all domain routers under the /api prefix.
 
-    Each router module is imported individually so that a missing module
-    produces a clear ImportError rather than a silent skip.
+    The router modules are imported once at module scope, so a missing module
+    fails the application import with a clear ImportError.
     """
-    from backend.routers.connections import router as connections_router
-    from backend.routers.customers import router as customers_router
-    from backend.routers.dashboard import router as dashboard_router
-    from backend.routers.reports import router as reports_router
-    from backend.routers.scan_profiles import router as scan_profiles_router
-    from backend.routers.scans import router as scans_router
-
     app.include_router(customers_router, prefix="/api")
     app.include_router(connections_router, prefix="/api")
     app.include_router(scans_router, prefix="/api")
@@ -54,14 +62,61 @@ def _check_weasyprint() -> None:
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):  # type: ignore[type-arg]
-    """Application lifespan handler: set up resources on startup."""
-    reports_dir = Path(settings.REPORTS_DIR)
+async def _reports_dir() -> AsyncIterator[None]:
+    """Ensure the reports directory exists before serving requests."""
+    reports_dir = get_settings().reports_root
     reports_dir.mkdir(parents=True, exist_ok=True)
-    logger.info("Reports directory ensured at %s", reports_dir.resolve())
+    logger.info("Reports directory ensured at %s", reports_dir)
     _check_weasyprint()
     yield
-    # Teardown logic (if needed) goes here.
+
+
+@asynccontextmanager
+async def _database() -> AsyncIterator[None]:
+    """Open the first pooled connection at startup and dispose the pool on shutdown.
+
+    Warming the pool moves DNS, TCP, and authentication cost out of the first
+    request.  An unreachable database is logged rather than fatal so the API
+    still starts (and reports the failure per request) while it recovers.
+    """
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        logger.info("Database connection pool warmed.")
+    except (SQLAlchemyError, OSError) as exc:
+        logger.warning("Database not reachable at startup: %s", exc)
+    yield
+    await engine.dispose()
+
+
+@asynccontextmanager
+async def _analysis_client() -> AsyncIterator[None]:
+    """Close the analysis client's HTTP pool on shutdown."""
+    yield
+    # The analysis client is imported lazily; only close its pool if loaded.
+    analysis_client_module = sys.modules.get("backend.analysis.client")
+    if analysis_client_module is not None:
+        await analysis_client_module.close_http_client()
+
+
+@asynccontextmanager
+async def _provider_pools() -> AsyncIterator[None]:
+    """Close the platform providers' shared HTTP pool on shutdown."""
+    yield
+    # Providers are imported on first use; only close the pool if loaded.
+    azure_devops_module = sys.modules.get("backend.providers.azure_devops")
+    if azure_devops_module is not None:
+        await azure_devops_module.close_http_transport()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan handler composing each subsystem's setup and teardown.
+
+    Subsystems start in order and shut down in reverse.
+    """
+    async with _reports_dir(), _database(), _analysis_client(), _provider_pools():
+        yield
 
 
 def create_app() -> FastAPI:
@@ -74,10 +129,10 @@ def create_app() -> FastAPI:
 
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=get_settings().CORS_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=_CORS_METHODS,
+        allow_headers=_CORS_HEADERS,
     )
 
     _register_routers(app)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 import uuid
 from datetime import datetime
 
@@ -8,6 +10,19 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered version 7 UUID (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds and the rest is
+    random, so keys generated in sequence append to the right-hand edge of
+    a B-tree index instead of landing on a random leaf.
+    """
+    value = ((time.time_ns() // 1_000_000) << 80) | int.from_bytes(os.urandom(10))
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     """Declarative base for all SQLAlchemy models."""
 
@@ -20,7 +35,7 @@ class UUIDMixin:
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
 
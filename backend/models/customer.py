@@ -31,19 +31,19 @@ class Customer(UUIDMixin, TimestampMixin, Base):
         "PlatformConnection",
         back_populates="customer",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     scans: Mapped[list[Scan]] = relationship(
         "Scan",
         back_populates="customer",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     scan_profiles: Mapped[list[ScanProfile]] = relationship(
         "ScanProfile",
         back_populates="customer",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -62,7 +62,11 @@ class PlatformConnection(UUIDMixin, TimestampMixin, Base):
     display_name: Mapped[str] = mapped_column(String)
     base_url: Mapped[str | None] = mapped_column(String)
     auth_type: Mapped[AuthType] = mapped_column()
-    credentials_encrypted: Mapped[bytes] = mapped_column(LargeBinary)
+    # Only the provider factory reads the ciphertext; deferring it keeps the
+    # blob out of every list/detail query.  Loaders that need it must undefer.
+    credentials_encrypted: Mapped[bytes] = mapped_column(
+        LargeBinary, deferred=True, deferred_raiseload=True
+    )
     org_or_group: Mapped[str] = mapped_column(String)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     last_validated_at: Mapped[datetime | None] = mapped_column(
@@ -73,10 +77,11 @@ class PlatformConnection(UUIDMixin, TimestampMixin, Base):
     customer: Mapped[Customer] = relationship(
         "Customer",
         back_populates="platform_connections",
+        lazy="raise_on_sql",
     )
     scans: Mapped[list[Scan]] = relationship(
         "Scan",
         back_populates="connection",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
@@ -3,8 +3,8 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.base import Base, TimestampMixin, UUIDMixin
@@ -18,6 +18,21 @@ class Finding(UUIDMixin, TimestampMixin, Base):
     """An individual check result recorded during a scan."""
 
     __tablename__ = "findings"
+    __table_args__ = (
+        # Per-scan filtering and category/status aggregation.  INCLUDE lets
+        # a GROUP BY category, status over one scan stay an index-only scan.
+        Index("ix_findings_scan_category", "scan_id", "category", postgresql_include=["status"]),
+        Index("ix_findings_scan_status", "scan_id", "status"),
+        # Org-level findings have no repo; leaving them out keeps this small.
+        Index(
+            "ix_findings_scan_repo_cat",
+            "scan_repo_id",
+            "category",
+            postgresql_where=text("scan_repo_id IS NOT NULL"),
+        ),
+        # Containment / key-existence filters on evidence (@>, ?).
+        Index("ix_findings_evidence_gin", "evidence", postgresql_using="gin"),
+    )
 
     scan_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -37,7 +52,10 @@ class Finding(UUIDMixin, TimestampMixin, Base):
     severity: Mapped[Severity] = mapped_column()
     status: Mapped[CheckStatus] = mapped_column()
     detail: Mapped[str | None] = mapped_column(Text)
-    evidence: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    # Report generation selects evidence explicitly; entity loads skip it.
+    evidence: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB, deferred=True, deferred_raiseload=True
+    )
     weight: Mapped[float] = mapped_column(Float, default=1.0)
     score: Mapped[float] = mapped_column(Float, default=0.0)
 
@@ -45,10 +63,12 @@ class Finding(UUIDMixin, TimestampMixin, Base):
     scan: Mapped[Scan] = relationship(
         "Scan",
         back_populates="findings",
+        lazy="raise_on_sql",
     )
     scan_repo: Mapped[ScanRepo | None] = relationship(
         "ScanRepo",
         back_populates="findings",
+        lazy="raise_on_sql",
     )
 
 
@@ -75,4 +95,5 @@ class ScanScore(UUIDMixin, Base):
     scan: Mapped[Scan] = relationship(
         "Scan",
         back_populates="scores",
+        lazy="raise_on_sql",
     )
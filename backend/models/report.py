@@ -4,8 +4,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.base import Base, TimestampMixin, UUIDMixin
@@ -33,7 +33,7 @@ class ReportTemplate(UUIDMixin, TimestampMixin, Base):
     reports: Mapped[list[Report]] = relationship(
         "Report",
         back_populates="template",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -41,6 +41,10 @@ class Report(UUIDMixin, TimestampMixin, Base):
     """A generated assessment report for a customer scan."""
 
     __tablename__ = "reports"
+    __table_args__ = (
+        # Serves the per-customer report list newest-first without a sort.
+        Index("ix_reports_customer_created", "customer_id", "created_at"),
+    )
 
     scan_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -62,7 +66,7 @@ class Report(UUIDMixin, TimestampMixin, Base):
     title: Mapped[str] = mapped_column(String)
     generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     ai_summary: Mapped[str | None] = mapped_column(Text)
-    ai_recommendations: Mapped[list[dict[str, Any]] | None] = mapped_column(JSON)
+    ai_recommendations: Mapped[list[dict[str, Any]] | None] = mapped_column(JSONB)
     overall_score: Mapped[float | None] = mapped_column(Float)
     dora_level: Mapped[str | None] = mapped_column(String)
     pdf_path: Mapped[str | None] = mapped_column(String)
@@ -71,10 +75,10 @@ class Report(UUIDMixin, TimestampMixin, Base):
     status: Mapped[ReportStatus] = mapped_column(default=ReportStatus.pending)
 
     # Relationships
-    scan: Mapped[Scan] = relationship("Scan", lazy="selectin")
-    customer: Mapped[Customer] = relationship("Customer", lazy="selectin")
+    scan: Mapped[Scan] = relationship("Scan", lazy="raise_on_sql")
+    customer: Mapped[Customer] = relationship("Customer", lazy="raise_on_sql")
     template: Mapped[ReportTemplate | None] = relationship(
         "ReportTemplate",
         back_populates="reports",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
@@ -4,7 +4,7 @@ import uuid
 from typing import Any
 
 from sqlalchemy import Boolean, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.base import Base, TimestampMixin, UUIDMixin
@@ -35,7 +35,7 @@ class CustomRequirement(UUIDMixin, TimestampMixin, Base):
         "RequirementResult",
         back_populates="requirement",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -58,10 +58,13 @@ class RequirementResult(UUIDMixin, Base):
     )
     status: Mapped[CheckStatus] = mapped_column()
     detail: Mapped[str | None] = mapped_column(Text)
-    evidence: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    evidence: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB, deferred=True, deferred_raiseload=True
+    )
 
     # Relationships
     requirement: Mapped[CustomRequirement] = relationship(
         "CustomRequirement",
         back_populates="results",
+        lazy="raise_on_sql",
     )
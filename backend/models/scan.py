@@ -4,8 +4,8 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.base import Base, TimestampMixin, UUIDMixin
@@ -20,6 +20,10 @@ class Scan(UUIDMixin, TimestampMixin, Base):
     """A single assessment run against a customer's platform connection."""
 
     __tablename__ = "scans"
+    __table_args__ = (
+        # Serves the per-customer scan list newest-first without a sort.
+        Index("ix_scans_customer_created", "customer_id", "created_at"),
+    )
 
     customer_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -38,7 +42,7 @@ class Scan(UUIDMixin, TimestampMixin, Base):
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     total_repos: Mapped[int] = mapped_column(Integer, default=0)
     error_message: Mapped[str | None] = mapped_column(Text)
-    scan_config: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    scan_config: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
     profile_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("scan_profiles.id", ondelete="SET NULL"),
@@ -49,28 +53,30 @@ class Scan(UUIDMixin, TimestampMixin, Base):
     customer: Mapped[Customer] = relationship(
         "Customer",
         back_populates="scans",
+        lazy="raise_on_sql",
     )
     connection: Mapped[PlatformConnection] = relationship(
         "PlatformConnection",
         back_populates="scans",
+        lazy="raise_on_sql",
     )
     scan_repos: Mapped[list[ScanRepo]] = relationship(
         "ScanRepo",
         back_populates="scan",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     findings: Mapped[list[Finding]] = relationship(
         "Finding",
         back_populates="scan",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     scores: Mapped[list[ScanScore]] = relationship(
         "ScanScore",
         back_populates="scan",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -78,27 +84,36 @@ class ScanRepo(UUIDMixin, TimestampMixin, Base):
     """A repository discovered and evaluated during a scan."""
 
     __tablename__ = "scan_repos"
+    __table_args__ = (
+        # A repository is recorded once per scan.  The leading scan_id also
+        # serves every per-scan lookup, so scan_id needs no index of its own.
+        Index("ix_scan_repos_scan_external", "scan_id", "repo_external_id", unique=True),
+    )
 
     scan_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("scans.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     repo_external_id: Mapped[str] = mapped_column(String)
     repo_name: Mapped[str] = mapped_column(String)
     repo_url: Mapped[str] = mapped_column(String)
     default_branch: Mapped[str | None] = mapped_column(String)
-    raw_data: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    # The provider's full repo payload is kept for audit only; deferring it
+    # keeps multi-KB JSON out of every ScanRepo load.  Readers must undefer.
+    raw_data: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB, deferred=True, deferred_raiseload=True
+    )
 
     # Relationships
     scan: Mapped[Scan] = relationship(
         "Scan",
         back_populates="scan_repos",
+        lazy="raise_on_sql",
     )
     findings: Mapped[list[Finding]] = relationship(
         "Finding",
         back_populates="scan_repo",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
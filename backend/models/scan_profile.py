@@ -39,4 +39,5 @@ class ScanProfile(UUIDMixin, TimestampMixin, Base):
     customer: Mapped[Customer] = relationship(
         "Customer",
         back_populates="scan_profiles",
+        lazy="raise_on_sql",
     )
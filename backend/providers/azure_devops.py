@@ -3,14 +3,15 @@ from __future__ import annotations
 import base64
 import logging
 import re
+import urllib.request
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import quote, urlparse
 
 import httpx
-import yaml
 
 from backend.models.enums import Platform
+from backend.providers.base import load_yaml
 from backend.schemas.platform_data import (
     BranchProtection,
     CIWorkflow,
@@ -155,6 +156,60 @@ _ALLOWED_AZURE_HOSTS = re.compile(
     r"^(.*\.)?(dev\.azure\.com|visualstudio\.com|azure\.com)$"
 )
 
+# Connection pools shared by every provider instance, keyed by the proxy URL
+# they route through (``None`` for direct); see _shared_transport().
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_transports: dict[str | None, _SharedTransport] = {}
+
+
+class _SharedTransport(httpx.AsyncHTTPTransport):
+    """Transport whose connection pool outlives the clients built on it.
+
+    Closing a provider closes its ``AsyncClient``, which in turn closes the
+    client's transport.  That is a no-op here so the pooled connections stay
+    open for the next scan; :func:`close_http_transport` releases them.
+    """
+
+    async def aclose(self) -> None:
+        pass
+
+    async def close_pool(self) -> None:
+        await super().aclose()
+
+
+def _env_proxy(url: str) -> str | None:
+    """Return the proxy from ``HTTP(S)_PROXY`` for *url*, honouring ``NO_PROXY``.
+
+    httpx only reads these variables for clients it builds its own transport
+    for, so a client on the shared transport has to resolve them itself.
+    """
+    parsed = urlparse(url)
+    if urllib.request.proxy_bypass(parsed.hostname or ""):
+        return None
+    proxies = urllib.request.getproxies()
+    return proxies.get(parsed.scheme) or proxies.get("all")
+
+
+def _shared_transport(url: str) -> _SharedTransport:
+    """Return the process-wide transport for requests to *url*.
+
+    Each provider keeps its own client (and therefore its own auth header),
+    but later scans reuse the warm pool and skip fresh TLS handshakes.
+    """
+    proxy = _env_proxy(url)
+    transport = _transports.get(proxy)
+    if transport is None:
+        transport = _transports[proxy] = _SharedTransport(limits=_HTTP_LIMITS, proxy=proxy)
+    return transport
+
+
+async def close_http_transport() -> None:
+    """Close the shared connection pools; called from the application shutdown hook."""
+    transports = list(_transports.values())
+    _transports.clear()
+    for transport in transports:
+        await transport.close_pool()
+
 
 class AzureDevOpsProvider:
     """Azure DevOps implementation of the :class:`~backend.providers.base.PlatformProvider` protocol.
@@ -173,6 +228,7 @@ class AzureDevOpsProvider:
     """
 
     platform: Platform = Platform.azure_devops
+    __slots__ = ("_org_name", "_base_url", "_vssps_url", "_client")
 
     def __init__(
         self,
@@ -215,14 +271,21 @@ class AzureDevOpsProvider:
             self._base_url = f"https://dev.azure.com/{org_name}"
             self._vssps_url = f"https://vssps.dev.azure.com/{org_name}"
 
-        self._client = httpx.AsyncClient(headers=headers, timeout=30.0)
+        # Requests go to two hosts, which NO_PROXY may treat differently.
+        vssps_host = urlparse(self._vssps_url).hostname
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=30.0,
+            transport=_shared_transport(self._base_url),
+            mounts={f"all://{vssps_host}": _shared_transport(self._vssps_url)},
+        )
 
     # ------------------------------------------------------------------
     # Resource lifecycle
     # ------------------------------------------------------------------
 
     async def close(self) -> None:
-        """Close the underlying HTTP client and release connection pool resources."""
+        """Close the underlying HTTP client; its pooled connections stay shared."""
         await self._client.aclose()
 
     async def __aenter__(self) -> AzureDevOpsProvider:
@@ -695,7 +758,7 @@ class AzureDevOpsProvider:
             trigger_events: list[str] = []
             if yaml_content and len(yaml_content) <= _MAX_YAML_SIZE:
                 try:
-                    parsed = yaml.safe_load(yaml_content)
+                    parsed = load_yaml(yaml_content)
                     if isinstance(parsed, dict):
                         trigger = parsed.get("trigger")
                         if trigger is None:
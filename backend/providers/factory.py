@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
+from collections.abc import Callable
 
 from backend.models.customer import PlatformConnection
 from backend.models.enums import Platform
@@ -42,53 +44,50 @@ def create_provider(connection: PlatformConnection) -> PlatformProvider:
             "Expected a JSON object with at minimum a 'token' key."
         ) from exc
 
-    platform = connection.platform
-
-    if platform == Platform.github:
-        # Import here to avoid a hard top-level dependency cycle if modules
-        # are loaded in unusual orders during testing.
-        from backend.providers.github import GitHubProvider  # noqa: PLC0415
-
-        token = creds.get("token", "")
-        if not token:
-            raise ValueError(
-                f"GitHub credentials for connection {connection.id} are missing "
-                "the required 'token' key."
-            )
-        return GitHubProvider(
-            token=token,
-            org_name=connection.org_or_group,
-            base_url=connection.base_url,
-        )
+    builder = _provider_builders().get(connection.platform)
+    if builder is None:
+        raise NotImplementedError(f"No provider implemented for platform: {connection.platform!r}")
 
-    if platform == Platform.gitlab:
-        from backend.providers.gitlab import GitLabProvider  # noqa: PLC0415
-
-        token = creds.get("token", "")
-        if not token:
-            raise ValueError(
-                f"GitLab credentials for connection {connection.id} are missing "
-                "the required 'token' key."
-            )
-        return GitLabProvider(
-            token=token,
-            group=connection.org_or_group,
-            base_url=connection.base_url,
+    label, build = builder
+    token = creds.get("token", "")
+    if not token:
+        raise ValueError(
+            f"{label} credentials for connection {connection.id} are missing "
+            "the required 'token' key."
         )
+    return build(token, connection)
 
-    if platform == Platform.azure_devops:
-        from backend.providers.azure_devops import AzureDevOpsProvider  # noqa: PLC0415
-
-        token = creds.get("token", "")
-        if not token:
-            raise ValueError(
-                f"Azure DevOps credentials for connection {connection.id} are missing "
-                "the required 'token' key."
-            )
-        return AzureDevOpsProvider(
-            token=token,
-            org_name=connection.org_or_group,
-            base_url=connection.base_url,
-        )
 
-    raise NotImplementedError(f"No provider implemented for platform: {platform!r}")
+_ProviderBuilder = Callable[[str, PlatformConnection], PlatformProvider]
+
+
+@functools.cache
+def _provider_builders() -> dict[Platform, tuple[str, _ProviderBuilder]]:
+    """Return ``{platform: (display label, builder)}``, importing providers once.
+
+    Provider modules are imported here rather than at module level to avoid
+    a hard top-level dependency cycle if modules are loaded in unusual
+    orders during testing.
+    """
+    from backend.providers.azure_devops import AzureDevOpsProvider  # noqa: PLC0415
+    from backend.providers.github import GitHubProvider  # noqa: PLC0415
+    from backend.providers.gitlab import GitLabProvider  # noqa: PLC0415
+
+    return {
+        Platform.github: (
+            "GitHub",
+            lambda token, c: GitHubProvider(
+                token=token, org_name=c.org_or_group, base_url=c.base_url
+            ),
+        ),
+        Platform.gitlab: (
+            "GitLab",
+            lambda token, c: GitLabProvider(token=token, group=c.org_or_group, base_url=c.base_url),
+        ),
+        Platform.azure_devops: (
+            "Azure DevOps",
+            lambda token, c: AzureDevOpsProvider(
+                token=token, org_name=c.org_or_group, base_url=c.base_url
+            ),
+        ),
+    }
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
 from functools import partial
 from typing import Any
 
-import yaml
 from github import Auth, Github, GithubException
 from github.Repository import Repository as GithubRepo
 
 from backend.models.enums import Platform
+from backend.providers.base import load_yaml
 from backend.schemas.platform_data import (
     BranchProtection,
     CIWorkflow,
@@ -34,8 +39,9 @@ _SECURITY_KEYWORDS = frozenset(
 _DEPLOY_KEYWORDS = frozenset({"deploy", "release", "publish", "ship", "cd"})
 
 # Candidate file paths keyed by flag name.  Used by _fetch_file_flags to
-# detect repository conventions via the GitHub Contents API.  Shared as a
-# module constant so the dict is built once rather than on every call.
+# detect repository conventions; the paths are resolved in one batched
+# query by _existing_paths.  Shared as a module constant so the dict is
+# built once rather than on every call.
 _CANDIDATE_PATHS: dict[str, list[str]] = {
     "has_codeowners": ["CODEOWNERS", ".github/CODEOWNERS", "docs/CODEOWNERS"],
     "has_pr_template": [
@@ -147,6 +153,30 @@ _CANDIDATE_PATHS: dict[str, list[str]] = {
     ],
 }
 
+# Page size for every paginated REST listing (GitHub's maximum).
+_PER_PAGE = 100
+
+# Parsed workflows keyed by (blob SHA, path).  Blob SHAs are content hashes,
+# so an entry stays valid for as long as the file is unchanged; bounded LRU,
+# shared by the executor threads under a lock.
+_WORKFLOW_CACHE_SIZE = 4096
+_workflow_cache: OrderedDict[tuple[str, str], CIWorkflow] = OrderedDict()
+_workflow_cache_lock = threading.Lock()
+
+# Security policy and Dependabot config, probed alongside the file flags.
+_SECURITY_POLICY_PATHS = ("SECURITY.md", ".github/SECURITY.md", "docs/SECURITY.md")
+_DEPENDABOT_PATHS = (".github/dependabot.yml", ".github/dependabot.yaml")
+# Org-wide policy lives in the organisation's ``.github`` repository.
+_ORG_SECURITY_POLICY_PATHS = ("SECURITY.md", "profile/SECURITY.md")
+
+# Every path probed per repository, grouped so the REST fallback can stop at
+# the first hit in each group.
+_REPO_PROBE_GROUPS: tuple[Sequence[str], ...] = (
+    *_CANDIDATE_PATHS.values(),
+    _SECURITY_POLICY_PATHS,
+    _DEPENDABOT_PATHS,
+)
+
 
 class GitHubProvider:
     """GitHub implementation of the :class:`~backend.providers.base.PlatformProvider` protocol.
@@ -174,6 +204,7 @@ class GitHubProvider:
     """
 
     platform: Platform = Platform.github
+    __slots__ = ("_token", "_org_name", "_base_url", "_client")
 
     def __init__(
         self,
@@ -185,7 +216,11 @@ class GitHubProvider:
         self._org_name = org_name
         self._base_url = base_url
         auth = Auth.Token(token)
-        self._client = Github(base_url=base_url, auth=auth) if base_url else Github(auth=auth)
+        self._client = (
+            Github(base_url=base_url, auth=auth, per_page=_PER_PAGE)
+            if base_url
+            else Github(auth=auth, per_page=_PER_PAGE)
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -232,20 +267,25 @@ class GitHubProvider:
     async def list_repos(self) -> list[NormalizedRepo]:
         """Enumerate all repositories in the configured organisation.
 
+        The repository count (read from the ``Link: rel="last"`` header) and
+        the first page are fetched together; the remaining pages are then
+        requested concurrently instead of one after another.
+
         Returns:
             A list of :class:`~backend.schemas.platform_data.NormalizedRepo`
             instances for every repository visible to the token.
         """
-
-        def _fetch() -> list[NormalizedRepo]:
-            org = self._client.get_organization(self._org_name)
-            repos = org.get_repos()
-            results: list[NormalizedRepo] = []
-            for r in repos:
-                results.append(_normalize_repo(r))
-            return results
-
-        return await self._run(_fetch)
+        org = await self._run(self._client.get_organization, self._org_name)
+        paginated = org.get_repos()
+        total, first_page = await asyncio.gather(
+            self._run(lambda: paginated.totalCount),
+            self._run(paginated.get_page, 0),
+        )
+        page_count = -(-total // _PER_PAGE)
+        later_pages = await asyncio.gather(
+            *(self._run(paginated.get_page, page) for page in range(1, page_count))
+        )
+        return [_normalize_repo(r) for page in (first_page, *later_pages) for r in page]
 
     async def get_repo_assessment_data(
         self,
@@ -254,10 +294,11 @@ class GitHubProvider:
         """Collect the full set of assessment data for a single repository.
 
         Fetches branch protection, CI workflows, security features, file
-        presence checks, and recent PR metadata.  Individual sub-fetches are
-        wrapped in ``try/except`` blocks so that partial data is always
-        returned even when some API calls fail (e.g. due to token scope
-        limitations).
+        presence checks, and recent PR metadata.  The sub-fetches are
+        independent, so each runs as its own executor job and the call takes
+        as long as the slowest one rather than their sum.  Each is wrapped
+        in ``try/except`` blocks so that partial data is always returned
+        even when some API calls fail (e.g. due to token scope limitations).
 
         Args:
             repo: A normalised repo record previously returned by
@@ -268,24 +309,23 @@ class GitHubProvider:
             instance populated with all available data.
         """
 
-        def _fetch_all() -> RepoAssessmentData:
-            gh_repo = self._client.get_repo(f"{self._org_name}/{repo.name}")
-            branch_protection = _fetch_branch_protection(gh_repo, repo.default_branch)
-            ci_workflows = _fetch_ci_workflows(gh_repo)
-            security = _fetch_security_features(gh_repo)
-            file_flags = _fetch_file_flags(gh_repo)
-            recent_prs = _fetch_recent_prs(gh_repo)
-
-            return RepoAssessmentData(
-                repo=repo,
-                branch_protection=branch_protection,
-                ci_workflows=ci_workflows,
-                security=security,
-                recent_prs=recent_prs,
-                **file_flags,
-            )
+        gh_repo = await self._run(self._client.get_repo, f"{self._org_name}/{repo.name}")
+        present, branch_protection, ci_workflows, alert_scanning, recent_prs = await asyncio.gather(
+            self._run(_existing_paths, gh_repo, _REPO_PROBE_GROUPS),
+            self._run(_fetch_branch_protection, gh_repo, repo.default_branch),
+            self._run(_fetch_ci_workflows, gh_repo),
+            self._run(_fetch_alert_scanning, gh_repo),
+            self._run(_fetch_recent_prs, gh_repo),
+        )
 
-        return await self._run(_fetch_all)
+        return RepoAssessmentData(
+            repo=repo,
+            branch_protection=branch_protection,
+            ci_workflows=ci_workflows,
+            security=_security_features(present, *alert_scanning),
+            recent_prs=recent_prs,
+            **_fetch_file_flags(present),
+        )
 
     async def get_org_assessment_data(self) -> OrgAssessmentData:
         """Collect organisation-level assessment data from GitHub."""
@@ -330,13 +370,9 @@ class GitHubProvider:
             has_security_policy = False
             try:
                 dot_github = self._client.get_repo(f"{self._org_name}/.github")
-                for path in ("SECURITY.md", "profile/SECURITY.md"):
-                    try:
-                        dot_github.get_contents(path)
-                        has_security_policy = True
-                        break
-                    except GithubException:
-                        continue
+                has_security_policy = bool(
+                    _existing_paths(dot_github, [_ORG_SECURITY_POLICY_PATHS])
+                )
             except GithubException:
                 pass
             except Exception:  # noqa: BLE001
@@ -366,7 +402,11 @@ class GitHubProvider:
 
 
 def _normalize_repo(r: GithubRepo) -> NormalizedRepo:
-    """Convert a PyGithub ``Repository`` object to a ``NormalizedRepo``."""
+    """Convert a PyGithub ``Repository`` object to a ``NormalizedRepo``.
+
+    Reads only fields included in the repository listing payload, so no
+    further API call is made per repository.
+    """
     return NormalizedRepo(
         external_id=str(r.id),
         name=r.name,
@@ -377,7 +417,7 @@ def _normalize_repo(r: GithubRepo) -> NormalizedRepo:
         language=r.language,
         created_at=_to_utc(r.created_at),
         updated_at=_to_utc(r.updated_at),
-        topics=list(r.get_topics()),
+        topics=list(r.topics or []),
     )
 
 
@@ -390,6 +430,57 @@ def _to_utc(dt: datetime | None) -> datetime | None:
     return dt
 
 
+@functools.cache
+def _probe_query(paths: tuple[str, ...]) -> str:
+    """Return a GraphQL query with one aliased ``object`` lookup per path.
+
+    ``p<i>`` resolves to a blob or tree when ``paths[i]`` exists on the
+    default branch and to ``null`` otherwise.
+    """
+    fields = " ".join(
+        f"p{i}: object(expression: {json.dumps('HEAD:' + path.rstrip('/'))}) {{ __typename }}"
+        for i, path in enumerate(paths)
+    )
+    return (
+        "query($owner: String!, $name: String!) { "
+        f"repository(owner: $owner, name: $name) {{ {fields} }} }}"
+    )
+
+
+def _existing_paths(repo: GithubRepo, groups: Iterable[Sequence[str]]) -> set[str]:
+    """Return which candidate paths exist on the default branch of *repo*.
+
+    All paths are resolved in a single GraphQL request instead of one
+    Contents API call each.  If GraphQL is unavailable (for example an older
+    Enterprise Server or a token without GraphQL access), falls back to
+    per-path REST probes that stop at the first hit in each group.
+    """
+    groups = list(groups)
+    paths = tuple(dict.fromkeys(path for group in groups for path in group))
+    owner, name = repo.full_name.split("/", 1)
+    try:
+        _headers, data = repo.requester.graphql_query(
+            _probe_query(paths), {"owner": owner, "name": name}
+        )
+        found = (data.get("data") or {}).get("repository") or {}
+        return {path for i, path in enumerate(paths) if found.get(f"p{i}")}
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(
+            "GraphQL path probe failed for %s, falling back to REST: %s", repo.full_name, exc
+        )
+
+    present: set[str] = set()
+    for group in groups:
+        for path in group:
+            try:
+                repo.get_contents(path)
+                present.add(path)
+                break
+            except Exception:  # noqa: BLE001
+                continue
+    return present
+
+
 def _fetch_branch_protection(
     repo: GithubRepo,
     default_branch: str,
@@ -498,10 +589,33 @@ def _fetch_ci_workflows(repo: GithubRepo) -> list[CIWorkflow]:
 
 
 def _parse_workflow_file(content_file: Any) -> CIWorkflow | None:
-    """Parse a single workflow YAML file and classify its intent."""
+    """Parse a single workflow YAML file and classify its intent.
+
+    The directory listing already carries each file's blob SHA, so a
+    workflow seen before is returned from the cache without downloading or
+    parsing its content again.
+    """
+    key = (content_file.sha, content_file.path)
+    with _workflow_cache_lock:
+        cached = _workflow_cache.get(key)
+        if cached is not None:
+            _workflow_cache.move_to_end(key)
+            return cached
+
+    workflow = _classify_workflow_file(content_file)
+    if workflow is not None:
+        with _workflow_cache_lock:
+            _workflow_cache[key] = workflow
+            if len(_workflow_cache) > _WORKFLOW_CACHE_SIZE:
+                _workflow_cache.popitem(last=False)
+    return workflow
+
+
+def _classify_workflow_file(content_file: Any) -> CIWorkflow | None:
+    """Download, parse and classify one workflow file."""
     try:
         raw_yaml = content_file.decoded_content.decode("utf-8")
-        workflow_data: dict[str, Any] = yaml.safe_load(raw_yaml) or {}
+        workflow_data: dict[str, Any] = load_yaml(raw_yaml) or {}
     except Exception as exc:  # noqa: BLE001
         logger.debug("Could not parse workflow file %s: %s", content_file.path, exc)
         return None
@@ -540,34 +654,10 @@ def _parse_workflow_file(content_file: Any) -> CIWorkflow | None:
     )
 
 
-def _fetch_security_features(repo: GithubRepo) -> SecurityFeatures:
-    """Probe security feature states for the repository."""
-    dependabot = False
+def _fetch_alert_scanning(repo: GithubRepo) -> tuple[bool, bool]:
+    """Return ``(secret_scanning_enabled, code_scanning_enabled)`` for the repository."""
     secret_scanning = False
     code_scanning = False
-    has_security_policy = False
-
-    # Check for SECURITY.md presence as a proxy for a security policy.
-    for path in ("SECURITY.md", ".github/SECURITY.md", "docs/SECURITY.md"):
-        try:
-            repo.get_contents(path)
-            has_security_policy = True
-            break
-        except GithubException:
-            pass
-        except Exception:  # noqa: BLE001
-            pass
-
-    # Dependabot — check for .github/dependabot.yml presence.
-    for path in (".github/dependabot.yml", ".github/dependabot.yaml"):
-        try:
-            repo.get_contents(path)
-            dependabot = True
-            break
-        except GithubException:
-            pass
-        except Exception:  # noqa: BLE001
-            pass
 
     # Secret scanning and code scanning require elevated token scopes.
     # We attempt to query them but gracefully degrade on 403/404.
@@ -603,18 +693,31 @@ def _fetch_security_features(repo: GithubRepo) -> SecurityFeatures:
     except Exception:  # noqa: BLE001
         pass
 
+    return secret_scanning, code_scanning
+
+
+def _security_features(
+    present: set[str], secret_scanning: bool, code_scanning: bool
+) -> SecurityFeatures:
+    """Combine alert-scanning states with file-based security signals.
+
+    *present* is the set of existing paths from :func:`_existing_paths`.
+    SECURITY.md presence is a proxy for a security policy; Dependabot is
+    detected via its config file.
+    """
     return SecurityFeatures(
-        dependabot_enabled=dependabot,
+        dependabot_enabled=not present.isdisjoint(_DEPENDABOT_PATHS),
         secret_scanning_enabled=secret_scanning,
         code_scanning_enabled=code_scanning,
         vulnerability_alerts=[],
-        has_security_policy=has_security_policy,
+        has_security_policy=not present.isdisjoint(_SECURITY_POLICY_PATHS),
     )
 
 
-def _fetch_file_flags(repo: GithubRepo) -> dict[str, bool]:
+def _fetch_file_flags(present: set[str]) -> dict[str, bool]:
     """Check for the presence of key repository files.
 
+    *present* is the set of existing paths from :func:`_existing_paths`.
     Returns a mapping of flag names to boolean values covering all 16
     scanner domains.
     """
@@ -658,15 +761,7 @@ def _fetch_file_flags(repo: GithubRepo) -> dict[str, bool]:
     }
 
     for flag, paths in _CANDIDATE_PATHS.items():
-        for path in paths:
-            try:
-                repo.get_contents(path)
-                flags[flag] = True
-                break
-            except GithubException:
-                continue
-            except Exception:  # noqa: BLE001
-                continue
+        flags[flag] = not present.isdisjoint(paths)
 
     return flags
 
@@ -7,10 +7,10 @@ from functools import partial
 from typing import Any
 
 import gitlab
-import yaml
 from gitlab.exceptions import GitlabError
 
 from backend.models.enums import Platform
+from backend.providers.base import load_yaml
 from backend.schemas.platform_data import (
     BranchProtection,
     CIWorkflow,
@@ -49,6 +49,7 @@ class GitLabProvider:
     """
 
     platform: Platform = Platform.gitlab
+    __slots__ = ("_token", "_group", "_base_url", "_client")
 
     def __init__(
         self,
@@ -377,7 +378,7 @@ def _fetch_ci_config(project: Any) -> list[CIWorkflow]:
     try:
         ci_file = project.files.get(file_path=".gitlab-ci.yml", ref=_default_branch(project))
         raw_yaml = ci_file.decode().decode("utf-8")
-        ci_data: dict[str, Any] = yaml.safe_load(raw_yaml) or {}
+        ci_data: dict[str, Any] = load_yaml(raw_yaml) or {}
     except GitlabError:
         return workflows
     except Exception as exc:  # noqa: BLE001
@@ -153,7 +153,7 @@ class ReportGenerator:
         self._excel_renderer = ExcelRenderer()
         self._markdown_renderer = MarkdownRenderer()
         self._zip_bundler = ZipBundler()
-        self._reports_dir = Path(settings.REPORTS_DIR).resolve()
+        self._reports_dir = settings.reports_root
         self._reports_dir.mkdir(parents=True, exist_ok=True)
         logger.debug("ReportGenerator initialised; output dir=%s", self._reports_dir)
 
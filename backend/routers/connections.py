@@ -183,11 +183,14 @@ async def validate_connection(
     """
     # Fetch the raw ORM instance so the factory can decrypt credentials.
     from sqlalchemy import select
+    from sqlalchemy.orm import undefer
 
     from backend.models.customer import PlatformConnection
 
     result = await db.execute(
-        select(PlatformConnection).where(PlatformConnection.id == connection_id)
+        select(PlatformConnection)
+        .where(PlatformConnection.id == connection_id)
+        .options(undefer(PlatformConnection.credentials_encrypted))
     )
     connection = result.scalar_one_or_none()
     if connection is None:
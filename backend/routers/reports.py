@@ -9,7 +9,7 @@ from fastapi.responses import FileResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.config import settings
+from backend.config import Settings, get_settings
 from backend.database import get_db
 from backend.models.report import Report, ReportTemplate
 from backend.models.scan import Scan
@@ -112,10 +112,10 @@ async def create_report(
     Raises:
         HTTPException: 404 if the scan or referenced template does not exist.
     """
-    # Verify the scan exists.
-    scan_result = await db.execute(select(Scan).where(Scan.id == scan_id))
-    scan = scan_result.scalar_one_or_none()
-    if scan is None:
+    # Verify the scan exists; only its customer is needed.
+    scan_result = await db.execute(select(Scan.customer_id).where(Scan.id == scan_id))
+    customer_id = scan_result.scalar_one_or_none()
+    if customer_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Scan {scan_id} not found.",
@@ -129,7 +129,7 @@ async def create_report(
 
     report = Report(
         scan_id=scan_id,
-        customer_id=scan.customer_id,
+        customer_id=customer_id,
         template_id=payload.template_id,
         title=title,
         generated_at=datetime.now(tz=UTC),
@@ -174,12 +174,14 @@ async def get_report(
 async def download_report(
     report_id: UUID,
     db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ) -> FileResponse:
     """Stream the generated PDF for a completed report.
 
     Args:
         report_id: UUID of the target report.
         db: Injected async database session.
+        settings: Injected application settings (for ``REPORTS_DIR``).
 
     Returns:
         The PDF file as a streaming ``FileResponse``.
@@ -201,7 +203,7 @@ async def download_report(
     if stored.is_absolute():
         pdf_path = stored
     else:
-        pdf_path = Path(settings.REPORTS_DIR).resolve() / stored
+        pdf_path = settings.reports_root / stored
 
     if not pdf_path.is_file():
         raise HTTPException(
@@ -226,6 +228,7 @@ async def download_report(
 async def download_report_excel(
     report_id: UUID,
     db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ) -> FileResponse:
     """Stream the generated Excel workbook for a completed report."""
     report = await _get_report_or_404(db, report_id)
@@ -239,7 +242,7 @@ async def download_report_excel(
     if stored.is_absolute():
         excel_path = stored
     else:
-        excel_path = Path(settings.REPORTS_DIR).resolve() / stored
+        excel_path = settings.reports_root / stored
 
     if not excel_path.is_file():
         raise HTTPException(
@@ -265,6 +268,7 @@ async def download_report_excel(
 async def download_report_zip(
     report_id: UUID,
     db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ) -> FileResponse:
     """Stream the generated zip bundle (Excel + Markdown) for a completed report."""
     report = await _get_report_or_404(db, report_id)
@@ -278,7 +282,7 @@ async def download_report_zip(
     if stored.is_absolute():
         zip_path = stored
     else:
-        zip_path = Path(settings.REPORTS_DIR).resolve() / stored
+        zip_path = settings.reports_root / stored
 
     if not zip_path.is_file():
         raise HTTPException(
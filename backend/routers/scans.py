@@ -48,6 +48,23 @@ async def _get_scan_or_404(db: AsyncSession, scan_id: UUID) -> Scan:
     return scan
 
 
+async def _ensure_scan_exists(db: AsyncSession, scan_id: UUID) -> None:
+    """Raise 404 unless a scan with *scan_id* exists.
+
+    Selects only the key, so endpoints that merely scope a child query to
+    the scan never load its ``scan_config`` or ``error_message``.
+
+    Raises:
+        HTTPException: 404 if no scan with the given ID exists.
+    """
+    result = await db.execute(select(Scan.id).where(Scan.id == scan_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scan {scan_id} not found.",
+        )
+
+
 # ---------------------------------------------------------------------------
 # Scan endpoints
 # ---------------------------------------------------------------------------
@@ -235,9 +252,10 @@ async def list_scan_findings(
     Raises:
         HTTPException: 404 if no scan with the given ID exists.
     """
-    await _get_scan_or_404(db, scan_id)
+    await _ensure_scan_exists(db, scan_id)
 
-    query = select(Finding).where(Finding.scan_id == scan_id)
+    # Plain rows rather than ORM instances: the response only reads columns.
+    query = select(*Finding.__table__.columns).where(Finding.scan_id == scan_id)
 
     if category is not None:
         query = query.where(Finding.category == category)
@@ -247,8 +265,7 @@ async def list_scan_findings(
         query = query.where(Finding.status == check_status)
 
     result = await db.execute(query.order_by(Finding.severity, Finding.check_name))
-    findings = list(result.scalars().all())
-    return [FindingResponse.model_validate(f) for f in findings]
+    return [FindingResponse.model_validate(row) for row in result.all()]
 
 
 @router.get(
@@ -272,7 +289,7 @@ async def list_scan_scores(
     Raises:
         HTTPException: 404 if no scan with the given ID exists.
     """
-    await _get_scan_or_404(db, scan_id)
+    await _ensure_scan_exists(db, scan_id)
 
     result = await db.execute(
         select(ScanScore)
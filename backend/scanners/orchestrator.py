@@ -23,6 +23,16 @@ from backend.scanners.sdlc_process import SDLCProcessScanner
 from backend.scanners.secrets_mgmt import SecretsMgmtScanner
 from backend.schemas.platform_data import OrgAssessmentData, RepoAssessmentData
 
+# Per-status (counts toward max_score, pass tally, fail tally), so the
+# aggregation loop adds flags instead of branching on each result's status.
+_STATUS_TALLY: dict[CheckStatus, tuple[int, int, int]] = {
+    CheckStatus.passed: (1, 1, 0),
+    CheckStatus.warning: (1, 0, 0),
+    CheckStatus.failed: (1, 0, 1),
+    CheckStatus.error: (1, 0, 1),
+    CheckStatus.not_applicable: (0, 0, 0),
+}
+
 
 @dataclass
 class CategoryScore:
@@ -222,38 +232,30 @@ class ScanOrchestrator:
         for repo_s in self._repo_scanners:
             scanner_weights[repo_s.category] = repo_s.weight
 
-        # Initialise accumulators for every known category
-        scores: dict[Category, float] = {cat: 0.0 for cat in Category}
-        max_scores: dict[Category, float] = {cat: 0.0 for cat in Category}
-        finding_counts: dict[Category, int] = {cat: 0 for cat in Category}
-        pass_counts: dict[Category, int] = {cat: 0 for cat in Category}
-        fail_counts: dict[Category, int] = {cat: 0 for cat in Category}
+        # [score, max_score, finding_count, pass_count, fail_count] per category
+        totals: dict[Category, list[float]] = {cat: [0.0, 0.0, 0, 0, 0] for cat in Category}
 
         for result in results:
-            cat = result.check.category
-            finding_counts[cat] += 1
-
-            if result.status is CheckStatus.not_applicable:
-                continue
-
-            max_scores[cat] += result.check.weight
-            scores[cat] += result.score
-
-            if result.status is CheckStatus.passed:
-                pass_counts[cat] += 1
-            elif result.status in (CheckStatus.failed, CheckStatus.error):
-                fail_counts[cat] += 1
+            check = result.check
+            scored, passed, failed = _STATUS_TALLY[result.status]
+            acc = totals[check.category]
+            # A not_applicable result has score 0.0, so only max_score needs the flag.
+            acc[0] += result.score
+            acc[1] += check.weight * scored
+            acc[2] += 1
+            acc[3] += passed
+            acc[4] += failed
 
         category_scores: dict[Category, CategoryScore] = {}
-        for cat in Category:
+        for cat, (score, max_score, finding_count, pass_count, fail_count) in totals.items():
             category_scores[cat] = CategoryScore(
                 category=cat,
-                score=scores[cat],
-                max_score=max_scores[cat],
+                score=score,
+                max_score=max_score,
                 weight=scanner_weights.get(cat, 0.0),
-                finding_count=finding_counts[cat],
-                pass_count=pass_counts[cat],
-                fail_count=fail_counts[cat],
+                finding_count=int(finding_count),
+                pass_count=int(pass_count),
+                fail_count=int(fail_count),
             )
 
         return category_scores
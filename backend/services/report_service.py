@@ -21,15 +21,18 @@ Typical usage from the router::
 
 import asyncio
 import logging
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from backend.benchmarks.dora import classify_dora_level
 from backend.config import settings
+from backend.models.customer import Customer, PlatformConnection
 from backend.models.enums import Category, ReportStatus
 from backend.models.finding import Finding, ScanScore
 from backend.models.report import Report
@@ -45,7 +48,21 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-def _reconstruct_check_results(findings: list[Finding]) -> list[CheckResult]:
+# Only the columns CheckResult needs.  Selecting them as plain rows skips
+# building a tracked ORM instance per finding.
+_CHECK_RESULT_COLUMNS = (
+    Finding.check_id,
+    Finding.check_name,
+    Finding.category,
+    Finding.severity,
+    Finding.weight,
+    Finding.status,
+    Finding.detail,
+    Finding.evidence,
+)
+
+
+def _reconstruct_check_results(findings: Sequence[Row[Any]]) -> list[CheckResult]:
     """Rebuild :class:`~backend.scanners.base.CheckResult` objects from DB rows.
 
     The scanner pipeline produces ``CheckResult`` dataclasses in memory; after
@@ -54,7 +71,8 @@ def _reconstruct_check_results(findings: list[Finding]) -> list[CheckResult]:
     objects it expects.
 
     Args:
-        findings: All ``Finding`` ORM rows for the scan.
+        findings: All finding rows for the scan, selected with
+            :data:`_CHECK_RESULT_COLUMNS`.
 
     Returns:
         A list of ``CheckResult`` instances with ``score`` auto-computed by
@@ -157,8 +175,8 @@ async def generate_report_for_scan(
     2. Load the :class:`~backend.models.report.Report` together with its
        related :class:`~backend.models.scan.Scan`,
        :class:`~backend.models.customer.Customer`, and the scan's
-       :class:`~backend.models.customer.PlatformConnection` (via
-       ``selectinload``).
+       :class:`~backend.models.customer.PlatformConnection` in one
+       joined query.
     3. Transition the report's ``status`` to ``"generating"`` and commit.
     4. Load all :class:`~backend.models.finding.Finding` rows for the scan.
     5. Load all :class:`~backend.models.finding.ScanScore` rows for the scan.
@@ -192,8 +210,16 @@ async def generate_report_for_scan(
                 select(Report)
                 .where(Report.id == report_id)
                 .options(
-                    selectinload(Report.scan).selectinload(Scan.connection),
-                    selectinload(Report.customer),
+                    # Only the columns the pipeline reads; anything else raises.
+                    joinedload(Report.scan)
+                    .load_only(Scan.id, raiseload=True)
+                    .joinedload(Scan.connection)
+                    .load_only(
+                        PlatformConnection.platform,
+                        PlatformConnection.org_or_group,
+                        raiseload=True,
+                    ),
+                    joinedload(Report.customer).load_only(Customer.name, raiseload=True),
                 )
             )
             result = await db.execute(stmt)
@@ -228,8 +254,10 @@ async def generate_report_for_scan(
             # ------------------------------------------------------------------
             # Step 4 & 5: Load findings and scores.
             # ------------------------------------------------------------------
-            findings_result = await db.execute(select(Finding).where(Finding.scan_id == scan.id))
-            findings: list[Finding] = list(findings_result.scalars().all())
+            findings_result = await db.execute(
+                select(*_CHECK_RESULT_COLUMNS).where(Finding.scan_id == scan.id)
+            )
+            findings = findings_result.all()
 
             scores_result = await db.execute(select(ScanScore).where(ScanScore.scan_id == scan.id))
             scan_scores: list[ScanScore] = list(scores_result.scalars().all())
@@ -249,10 +277,10 @@ async def generate_report_for_scan(
             # Step 9: Run AI analysis.
             # ------------------------------------------------------------------
             from backend.analysis.analyzer import (
-                analyzer,  # lazy: avoids anthropic import at module level
+                get_analyzer,  # lazy: avoids anthropic import at module level
             )
 
-            analysis_result = await analyzer.analyze_scan(
+            analysis_result = await get_analyzer().analyze_scan(
                 org_name=connection.org_or_group,
                 scan_results=check_results,
                 category_scores=category_scores,
@@ -281,7 +309,7 @@ async def generate_report_for_scan(
 
             # Store the path relative to the configured reports directory so
             # the record remains portable across deployments.
-            reports_root = Path(settings.REPORTS_DIR).resolve()
+            reports_root = settings.reports_root
 
             def _relative(abs_path: Path) -> str:
                 try:
@@ -3,12 +3,14 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, undefer
 
+from backend.models.base import uuid7
 from backend.models.customer import PlatformConnection
 from backend.models.enums import ScanStatus
 from backend.models.finding import Finding, ScanScore
@@ -16,8 +18,71 @@ from backend.models.scan import Scan, ScanRepo
 from backend.providers.factory import create_provider
 from backend.scanners.orchestrator import ScanOrchestrator
 
+if TYPE_CHECKING:
+    from backend.scanners.base import CheckResult
+    from backend.schemas.platform_data import NormalizedRepo
+
 logger = logging.getLogger(__name__)
 
+# Repositories whose ScanRepo and Finding rows are buffered before being
+# written as one executemany per table.
+_INSERT_BATCH_REPOS = 50
+
+
+def _scan_repo_row(scan_id: UUID, repo: NormalizedRepo) -> dict[str, Any]:
+    """Return a ``scan_repos`` row for *repo* with a client-side primary key.
+
+    Generating the ID here lets the repo's findings reference it before the
+    row is written, so neither table needs a flush or ``RETURNING``.
+    """
+    return {
+        "id": uuid7(),
+        "scan_id": scan_id,
+        "repo_external_id": repo.external_id,
+        "repo_name": repo.name,
+        "repo_url": repo.url,
+        "default_branch": repo.default_branch,
+        "raw_data": repo.model_dump(mode="json"),
+    }
+
+
+def _finding_rows(
+    scan_id: UUID, scan_repo_id: UUID | None, results: list[CheckResult]
+) -> list[dict[str, Any]]:
+    """Return one ``findings`` row per check result, ready for a bulk insert.
+
+    Findings are written and never read back during a scan, so they skip
+    the ORM unit of work and go out as a single executemany per batch.
+    """
+    return [
+        {
+            "scan_id": scan_id,
+            "scan_repo_id": scan_repo_id,
+            "category": check_result.check.category,
+            "check_id": check_result.check.check_id,
+            "check_name": check_result.check.check_name,
+            "severity": check_result.check.severity,
+            "status": check_result.status,
+            "detail": check_result.detail or None,
+            "evidence": check_result.evidence,
+            "weight": check_result.check.weight,
+            "score": check_result.score,
+        }
+        for check_result in results
+    ]
+
+
+async def _insert_repo_batch(
+    session: AsyncSession, repo_rows: list[dict[str, Any]], finding_rows: list[dict[str, Any]]
+) -> None:
+    """Bulk-insert buffered repo rows, then their findings, and clear both buffers."""
+    if repo_rows:
+        await session.execute(insert(ScanRepo), repo_rows)
+    if finding_rows:
+        await session.execute(insert(Finding), finding_rows)
+    repo_rows.clear()
+    finding_rows.clear()
+
 
 async def run_scan(scan_id: UUID, db_factory: async_sessionmaker) -> None:
     """Execute a full repository scan and persist all results.
@@ -37,11 +102,12 @@ async def run_scan(scan_id: UUID, db_factory: async_sessionmaker) -> None:
     6. For every repository:
 
        a. Fetch assessment data from the provider.
-       b. Persist a :class:`~backend.models.scan.ScanRepo` row.
+       b. Buffer a :class:`~backend.models.scan.ScanRepo` row.
        c. Run the :class:`~backend.scanners.orchestrator.ScanOrchestrator`
           against the assessment data.
-       d. Persist a :class:`~backend.models.finding.Finding` row for every
-          :class:`~backend.scanners.base.CheckResult`.
+       d. Buffer a :class:`~backend.models.finding.Finding` row for every
+          :class:`~backend.scanners.base.CheckResult`, bulk-inserting the
+          buffered repos and findings every ``_INSERT_BATCH_REPOS`` repos.
 
     7. Compute per-category scores via the orchestrator and persist
        :class:`~backend.models.finding.ScanScore` rows.
@@ -73,7 +139,11 @@ async def _execute_scan(scan_id: UUID, session: AsyncSession) -> None:
     # Step 1: Load the Scan record together with its PlatformConnection.
     # ------------------------------------------------------------------
     result = await session.execute(
-        select(Scan).where(Scan.id == scan_id).options(selectinload(Scan.connection))
+        select(Scan)
+        .where(Scan.id == scan_id)
+        .options(
+            joinedload(Scan.connection).options(undefer(PlatformConnection.credentials_encrypted))
+        )
     )
     scan: Scan | None = result.scalar_one_or_none()
 
@@ -99,8 +169,6 @@ async def _execute_scan(scan_id: UUID, session: AsyncSession) -> None:
         orchestrator = ScanOrchestrator(scan_config=scan.scan_config)
 
         # Accumulate all CheckResult objects across org + repos for scoring.
-        from backend.scanners.base import CheckResult  # noqa: PLC0415
-
         all_results: list[CheckResult] = []
 
         # ------------------------------------------------------------------
@@ -112,23 +180,9 @@ async def _execute_scan(scan_id: UUID, session: AsyncSession) -> None:
             all_results.extend(org_results)
 
             # Persist org-level findings with scan_repo_id=None
-            for check_result in org_results:
-                finding = Finding(
-                    scan_id=scan.id,
-                    scan_repo_id=None,
-                    category=check_result.check.category,
-                    check_id=check_result.check.check_id,
-                    check_name=check_result.check.check_name,
-                    severity=check_result.check.severity,
-                    status=check_result.status,
-                    detail=check_result.detail or None,
-                    evidence=check_result.evidence,
-                    weight=check_result.check.weight,
-                    score=check_result.score,
-                )
-                session.add(finding)
-
-            await session.flush()
+            if org_results:
+                await session.execute(insert(Finding), _finding_rows(scan.id, None, org_results))
+
             logger.info(
                 "run_scan: scan %s — %d org-level findings.",
                 scan_id,
@@ -143,52 +197,34 @@ async def _execute_scan(scan_id: UUID, session: AsyncSession) -> None:
         # ------------------------------------------------------------------
         # Step 5: List all repositories.
         # ------------------------------------------------------------------
-        repos = await provider.list_repos()
+        # Overlapping pages can repeat a repository; scan_repos is unique on
+        # (scan_id, repo_external_id), so assess each one once.
+        repos = list({repo.external_id: repo for repo in await provider.list_repos()}.values())
         logger.info("run_scan: scan %s — discovered %d repositories.", scan_id, len(repos))
 
         # ------------------------------------------------------------------
         # Step 6: Per-repository assessment.
         # ------------------------------------------------------------------
+        repo_rows: list[dict[str, Any]] = []
+        finding_rows: list[dict[str, Any]] = []
         for repo in repos:
             # a. Fetch assessment data.
             assessment = await provider.get_repo_assessment_data(repo)
 
-            # b. Persist the ScanRepo record.
-            scan_repo = ScanRepo(
-                scan_id=scan.id,
-                repo_external_id=repo.external_id,
-                repo_name=repo.name,
-                repo_url=repo.url,
-                default_branch=repo.default_branch,
-                raw_data=repo.model_dump(mode="json"),
-            )
-            session.add(scan_repo)
-            # Flush so scan_repo.id is available for Finding foreign keys.
-            await session.flush()
+            # b. Buffer the ScanRepo row.
+            repo_row = _scan_repo_row(scan.id, repo)
+            repo_rows.append(repo_row)
 
             # c. Run all repo-level scanners against the assessment data.
             results = orchestrator.scan_repo(assessment)
             all_results.extend(results)
 
-            # d. Persist one Finding per CheckResult.
-            for check_result in results:
-                finding = Finding(
-                    scan_id=scan.id,
-                    scan_repo_id=scan_repo.id,
-                    category=check_result.check.category,
-                    check_id=check_result.check.check_id,
-                    check_name=check_result.check.check_name,
-                    severity=check_result.check.severity,
-                    status=check_result.status,
-                    detail=check_result.detail or None,
-                    evidence=check_result.evidence,
-                    weight=check_result.check.weight,
-                    score=check_result.score,
-                )
-                session.add(finding)
-
-        # Flush all findings before computing scores.
-        await session.flush()
+            # d. Buffer one Finding per CheckResult; write the batch when full.
+            finding_rows.extend(_finding_rows(scan.id, repo_row["id"], results))
+            if len(repo_rows) >= _INSERT_BATCH_REPOS:
+                await _insert_repo_batch(session, repo_rows, finding_rows)
+
+        await _insert_repo_batch(session, repo_rows, finding_rows)
 
         # ------------------------------------------------------------------
         # Step 7: Compute category scores and persist ScanScore rows.
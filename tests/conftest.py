@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
 
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.ext.compiler import compiles
 
 # Override DATABASE_URL before any backend module is imported so that
 # backend.config.settings picks up the in-memory SQLite URL.
@@ -23,7 +27,9 @@ os.environ.setdefault("CREDENTIALS_ENCRYPTION_KEY", "")
 import backend.models  # noqa: E402, F401
 from backend.database import get_db  # noqa: E402
 from backend.main import app  # noqa: E402
+from backend.models import Customer, PlatformConnection, Scan  # noqa: E402
 from backend.models.base import Base  # noqa: E402
+from backend.models.enums import AuthType, Platform, ScanStatus  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # SQLite / aiosqlite compatibility shim
@@ -40,6 +46,13 @@ from backend.models.base import Base  # noqa: E402
 _TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+# JSONB has no SQLite spelling; its value processing is inherited from JSON,
+# so rendering the DDL as SQLite's JSON is all that is needed.
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_: JSONB, compiler: Any, **kw: Any) -> str:
+    return "JSON"
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -116,3 +129,53 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 
     # Restore the real dependency so other test modules start clean.
     app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def query_log(engine) -> AsyncGenerator[list[str], None]:
+    """Collect the SQL statements executed on *engine* while the test runs.
+
+    Tests use this to assert that an endpoint issues a bounded number of
+    queries instead of lazily loading relationships row by row.
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def make_scan(
+    db_session: AsyncSession,
+) -> Callable[..., Awaitable[Scan]]:
+    """Return a factory that persists scans for one "Acme" GitHub connection.
+
+    The customer and connection are flushed once per test; each call adds a
+    scan with the given *status*.  Tests add their own findings, reports and
+    other rows on top and commit when done.
+    """
+    customer = Customer(name="Acme", slug="acme")
+    db_session.add(customer)
+    await db_session.flush()
+    connection = PlatformConnection(
+        customer_id=customer.id,
+        platform=Platform.github,
+        display_name="Acme GitHub",
+        auth_type=AuthType.token,
+        credentials_encrypted=b"unused",
+        org_or_group="acme",
+    )
+    db_session.add(connection)
+    await db_session.flush()
+
+    async def _make_scan(status: ScanStatus = ScanStatus.completed) -> Scan:
+        scan = Scan(customer_id=customer.id, connection_id=connection.id, status=status)
+        db_session.add(scan)
+        await db_session.flush()
+        return scan
+
+    return _make_scan
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+"""Unit tests for :mod:`backend.analysis.cache`."""
+
+from backend.analysis.cache import ResponseCache, SemanticCache
+
+
+class _Clock:
+    """Manually advanced stand-in for :func:`time.monotonic`."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """Tests for hit, expiry, and eviction behaviour."""
+
+    def test_hit_after_set(self) -> None:
+        cache = ResponseCache(maxsize=2, ttl=60)
+        key = ResponseCache.make_key("model", "system", "prompt")
+
+        assert cache.get(key) is None
+        cache.set(key, "answer")
+
+        assert cache.get(key) == "answer"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_covers_every_component(self) -> None:
+        keys = {
+            ResponseCache.make_key("m", "s", "p"),
+            ResponseCache.make_key("m2", "s", "p"),
+            ResponseCache.make_key("m", "s2", "p"),
+            ResponseCache.make_key("m", "s", "p2"),
+        }
+        assert len(keys) == 4
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = _Clock()
+        cache = ResponseCache(maxsize=2, ttl=60, clock=clock)
+        cache.set("k", "answer")
+
+        clock.now = 59.0
+        assert cache.get("k") == "answer"
+        clock.now = 60.0
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+
+class TestSemanticCache:
+    """Tests for similarity matching and scoping."""
+
+    _TEXT = "overall score 71.25, 12 failed checks, 40 passed checks, SLSA level 2"
+
+    def test_near_identical_text_hits(self) -> None:
+        cache = SemanticCache(threshold=0.8, maxsize=4, ttl=60)
+        cache.set("acme", self._TEXT, "analysis")
+
+        hit = cache.get("acme", self._TEXT.replace("71.25", "71.50"))
+
+        assert hit == "analysis"
+        assert cache.hits == 1
+
+    def test_dissimilar_text_misses(self) -> None:
+        cache = SemanticCache(threshold=0.8, maxsize=4, ttl=60)
+        cache.set("acme", self._TEXT, "analysis")
+
+        assert cache.get("acme", "no repositories were scanned") is None
+        assert cache.misses == 1
+
+    def test_match_is_scoped(self) -> None:
+        cache = SemanticCache(threshold=0.8, maxsize=4, ttl=60)
+        cache.set("acme", self._TEXT, "analysis")
+
+        assert cache.get("globex", self._TEXT) is None
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = _Clock()
+        cache = SemanticCache(threshold=0.8, maxsize=4, ttl=60, clock=clock)
+        cache.set("acme", self._TEXT, "analysis")
+
+        clock.now = 60.0
+        assert cache.get("acme", self._TEXT) is None
+        assert len(cache) == 0
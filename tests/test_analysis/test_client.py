@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+"""Unit tests for :class:`~backend.analysis.client.AnalysisClient`."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from backend.analysis.analyzer import get_analyzer
+from backend.analysis.cache import ResponseCache
+from backend.analysis.client import (
+    AnalysisClient,
+    AnalysisClientError,
+    close_http_client,
+    get_analysis_client,
+)
+from backend.analysis.schemas import AnalysisResult
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeMessages:
+    """Stand-in for ``AsyncAnthropic.messages`` that blocks until released."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error = error
+
+    async def create(self, **kwargs: Any) -> SimpleNamespace:
+        self.calls += 1
+        self.kwargs = kwargs
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        if "tools" in kwargs:
+            tool_input = {"executive_summary": "Summary.", "overall_maturity_assessment": "OK."}
+            return _message([SimpleNamespace(type="tool_use", input=tool_input)])
+        prompt = kwargs["messages"][0]["content"]
+        return _message([SimpleNamespace(type="text", text=f"answer to {prompt}")])
+
+
+class _TruncatedThenCompleteMessages:
+    """Stand-in for ``AsyncAnthropic.messages`` cut off at ``max_tokens`` once."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def create(self, **kwargs: Any) -> SimpleNamespace:
+        self.calls += 1
+        if self.calls == 1:
+            tool_input = {"executive_summary": "Summ"}
+            return _message(
+                [SimpleNamespace(type="tool_use", input=tool_input)], stop_reason="max_tokens"
+            )
+        tool_input = {"executive_summary": "Summary.", "overall_maturity_assessment": "OK."}
+        return _message([SimpleNamespace(type="tool_use", input=tool_input)])
+
+
+def _message(content: list[SimpleNamespace], stop_reason: str = "end_turn") -> SimpleNamespace:
+    return SimpleNamespace(
+        content=content,
+        stop_reason=stop_reason,
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+    )
+
+
+class _FakeStreamingMessages:
+    """Stand-in for ``AsyncAnthropic.messages`` whose ``stream`` yields *chunks*."""
+
+    def __init__(self, chunks: list[str], stop_reason: str = "end_turn") -> None:
+        self.chunks = chunks
+        self.stop_reason = stop_reason
+        self.calls = 0
+
+    @contextlib.asynccontextmanager
+    async def stream(self, **kwargs: Any) -> AsyncIterator[SimpleNamespace]:
+        self.calls += 1
+
+        async def text_stream() -> AsyncIterator[str]:
+            for chunk in self.chunks:
+                yield chunk
+
+        async def get_final_message() -> SimpleNamespace:
+            text = "".join(self.chunks)
+            return _message([SimpleNamespace(type="text", text=text)], self.stop_reason)
+
+        yield SimpleNamespace(text_stream=text_stream(), get_final_message=get_final_message)
+
+
+def _client(messages: Any, cache: ResponseCache | None = None) -> AnalysisClient:
+    client = AnalysisClient(api_key="", cache=cache)
+    client._client = SimpleNamespace(messages=messages)  # type: ignore[assignment]
+    return client
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestInflightDeduplication:
+    """Tests for coalescing identical concurrent :meth:`AnalysisClient.analyze` calls."""
+
+    async def test_identical_concurrent_calls_share_one_request(self) -> None:
+        messages = _FakeMessages()
+        client = _client(messages)
+
+        calls = [asyncio.ensure_future(client.analyze("p", "s")) for _ in range(3)]
+        await asyncio.sleep(0)
+        messages.release.set()
+
+        assert await asyncio.gather(*calls) == ["answer to p"] * 3
+        assert messages.calls == 1
+        assert client._inflight == {}
+
+    async def test_distinct_prompts_are_not_coalesced(self) -> None:
+        messages = _FakeMessages()
+        messages.release.set()
+        client = _client(messages)
+
+        results = await asyncio.gather(client.analyze("a", "s"), client.analyze("b", "s"))
+
+        assert results == ["answer to a", "answer to b"]
+        assert messages.calls == 2
+
+    async def test_failure_reaches_every_waiter(self) -> None:
+        messages = _FakeMessages(error=AnalysisClientError("boom"))
+        client = _client(messages)
+
+        calls = [asyncio.ensure_future(client.analyze("p", "s")) for _ in range(2)]
+        await asyncio.sleep(0)
+        messages.release.set()
+
+        for outcome in await asyncio.gather(*calls, return_exceptions=True):
+            assert isinstance(outcome, AnalysisClientError)
+        assert messages.calls == 1
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        messages = _FakeMessages()
+        client = _client(messages)
+
+        first = asyncio.ensure_future(client.analyze("p", "s"))
+        second = asyncio.ensure_future(client.analyze("p", "s"))
+        await asyncio.sleep(0)
+        first.cancel()
+        messages.release.set()
+
+        assert await second == "answer to p"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestStructuredOutput:
+    """Tests for forcing a schema-shaped response through tool use."""
+
+    async def test_tool_input_is_returned_as_json(self) -> None:
+        messages = _FakeMessages()
+        messages.release.set()
+        client = _client(messages)
+
+        raw = await client.analyze("p", "s", output_schema=AnalysisResult)
+
+        tool = messages.kwargs["tools"][0]
+        assert messages.kwargs["tool_choice"] == {"type": "tool", "name": tool["name"]}
+        assert tool["input_schema"] == AnalysisResult.model_json_schema()
+        assert AnalysisResult.model_validate_json(raw).executive_summary == "Summary."
+
+    async def test_static_prefix_is_marked_for_prompt_caching(self) -> None:
+        messages = _FakeMessages()
+        messages.release.set()
+        client = _client(messages)
+
+        await client.analyze("p", "s", output_schema=AnalysisResult)
+
+        (system_block,) = messages.kwargs["system"]
+        assert system_block["text"] == "s"
+        assert system_block["cache_control"] == {"type": "ephemeral"}
+
+    async def test_structured_and_plain_requests_are_not_coalesced(self) -> None:
+        messages = _FakeMessages()
+        messages.release.set()
+        client = _client(messages)
+
+        await asyncio.gather(
+            client.analyze("p", "s"), client.analyze("p", "s", output_schema=AnalysisResult)
+        )
+
+        assert messages.calls == 2
+
+
+class TestResponseCaching:
+    """Tests for which :meth:`AnalysisClient.analyze` responses are cached."""
+
+    async def test_truncated_response_is_not_replayed_from_cache(self) -> None:
+        messages = _TruncatedThenCompleteMessages()
+        cache = ResponseCache(maxsize=4, ttl=60)
+        client = _client(messages, cache)
+
+        truncated = await client.analyze("p", "s", output_schema=AnalysisResult)
+        complete = await client.analyze("p", "s", output_schema=AnalysisResult)
+        cached = await client.analyze("p", "s", output_schema=AnalysisResult)
+
+        assert truncated == '{"executive_summary":"Summ"}'
+        assert AnalysisResult.model_validate_json(complete).executive_summary == "Summary."
+        assert cached == complete
+        assert messages.calls == 2
+
+    async def test_truncated_stream_is_not_replayed_from_cache(self) -> None:
+        messages = _FakeStreamingMessages(['{"partial": '], stop_reason="max_tokens")
+        cache = ResponseCache(maxsize=4, ttl=60)
+        client = _client(messages, cache)
+
+        first = [chunk async for chunk in client.analyze_stream("p", "s")]
+        second = [chunk async for chunk in client.analyze_stream("p", "s")]
+
+        assert first == second == ['{"partial": ']
+        assert messages.calls == 2
+
+
+class TestStreaming:
+    """Tests for :meth:`AnalysisClient.analyze_stream`."""
+
+    async def test_yields_chunks_and_caches_the_full_response(self) -> None:
+        messages = _FakeStreamingMessages(["Hel", "lo"])
+        cache = ResponseCache(maxsize=4, ttl=60)
+        client = _client(messages, cache)
+
+        chunks = [chunk async for chunk in client.analyze_stream("p", "s")]
+        cached = [chunk async for chunk in client.analyze_stream("p", "s")]
+
+        assert chunks == ["Hel", "lo"]
+        assert cached == ["Hello"]
+        assert messages.calls == 1
+
+
+class TestRetries:
+    """Tests for retry configuration of the underlying SDK client."""
+
+    def test_max_retries_is_passed_to_the_sdk(self) -> None:
+        client = AnalysisClient(api_key="sk-ant-test", max_retries=4)
+
+        assert client._client is not None
+        assert client._client.max_retries == 4
+
+
+class TestMaxTokens:
+    """Tests for the configurable output-token cap."""
+
+    async def test_max_tokens_is_sent_with_each_request(self) -> None:
+        messages = _FakeMessages()
+        messages.release.set()
+        client = AnalysisClient(api_key="", max_tokens=2048)
+        client._client = SimpleNamespace(messages=messages)  # type: ignore[assignment]
+
+        await client.analyze("p", "s")
+
+        assert messages.kwargs["max_tokens"] == 2048
+
+
+class TestSharedPool:
+    """Tests for the process-wide HTTP pool and the singletons built on it."""
+
+    async def test_closing_the_pool_rebuilds_the_singletons(self) -> None:
+        client = get_analysis_client()
+        analyzer = get_analyzer()
+
+        await close_http_client()
+
+        assert get_analysis_client() is not client
+        assert get_analyzer() is not analyzer
+        assert get_analyzer()._client is get_analysis_client()
+        await close_http_client()
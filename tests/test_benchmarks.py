@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+"""Tests for the benchmark calculators in :mod:`backend.benchmarks`."""
+
+import random
+
+from backend.benchmarks.cis import (
+    CIS_CONTROLS,
+    calculate_cis_compliance,
+    calculate_cis_compliance_batch,
+)
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_cis_batch_counts_match_per_scan_compliance() -> None:
+    rng = random.Random(0)
+    mapped = sorted(frozenset().union(*(control.checks for control in CIS_CONTROLS.values())))
+    candidates = [*mapped, "SEC-001", "IAM-008", "NOT-A-CHECK"]
+    scans = [set(rng.sample(candidates, rng.randint(0, len(candidates)))) for _ in range(200)]
+
+    counts = calculate_cis_compliance_batch(scans)
+
+    assert counts.keys() == CIS_CONTROLS.keys()
+    for i, passed in enumerate(scans):
+        report = calculate_cis_compliance(passed)
+        for domain_id, per_scan in counts.items():
+            assert per_scan[i] == report[domain_id]["passed"]
+
+
+def test_cis_batch_of_no_scans_is_empty_per_domain() -> None:
+    assert calculate_cis_compliance_batch([]) == {domain_id: [] for domain_id in CIS_CONTROLS}
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+"""Tests for the shared model helpers in :mod:`backend.models.base`."""
+
+import time
+import uuid
+
+from backend.models.base import uuid7
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_uuid7_layout() -> None:
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert abs((value.int >> 80) - time.time_ns() // 1_000_000) < 1_000
+
+
+def test_uuid7_orders_by_creation_time() -> None:
+    earlier = uuid7()
+    time.sleep(0.002)
+
+    assert earlier < uuid7()
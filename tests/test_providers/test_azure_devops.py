@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch
 
+import httpcore
 import httpx
 import pytest
 
 from backend.models.enums import Platform
+from backend.providers import azure_devops
 from backend.providers.azure_devops import AzureDevOpsProvider
 from backend.schemas.platform_data import NormalizedRepo
 
@@ -115,6 +117,45 @@ async def test_async_context_manager() -> None:
     mock_aclose.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_providers_share_connection_pool() -> None:
+    """Closing a provider keeps the shared pool open for the next one."""
+    first = AzureDevOpsProvider(token="tok-a", org_name="org-a")
+    pool = first._client._transport
+    await first.close()
+    second = AzureDevOpsProvider(token="tok-b", org_name="org-b")
+
+    assert second._client._transport is pool
+    assert first._client.headers["Authorization"] != second._client.headers["Authorization"]
+
+    await second.close()
+    await azure_devops.close_http_transport()
+    third = AzureDevOpsProvider(token="tok-c", org_name="org-c")
+    assert third._client._transport is not pool
+    await third.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_pool_routes_through_env_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """HTTPS_PROXY is honoured by the shared pool, except for NO_PROXY hosts."""
+    for name in ("https_proxy", "HTTPS_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "vssps.dev.azure.com")
+    await azure_devops.close_http_transport()
+
+    provider = AzureDevOpsProvider(token="tok", org_name="org")
+    api = provider._client._transport_for_url(httpx.URL("https://dev.azure.com/org/_apis"))
+    vssps = provider._client._transport_for_url(httpx.URL("https://vssps.dev.azure.com/org/_apis"))
+
+    assert isinstance(api._pool, httpcore.AsyncHTTPProxy)
+    assert api._pool._proxy_url.host == b"proxy.internal"
+    assert not isinstance(vssps._pool, httpcore.AsyncHTTPProxy)
+
+    await provider.close()
+    await azure_devops.close_http_transport()
+
+
 # ---------------------------------------------------------------------------
 # parse_external_id tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+"""Unit tests for the shared helpers in :mod:`backend.providers.base`."""
+
+import pytest
+import yaml
+
+from backend.providers.base import load_yaml
+
+
+def test_load_yaml_matches_safe_load() -> None:
+    text = (
+        "name: CI\non:\n  push:\n    branches: [main]\njobs:\n  test:\n    steps: [{run: pytest}]\n"
+    )
+
+    assert load_yaml(text) == yaml.safe_load(text)
+
+
+def test_load_yaml_rejects_python_tags() -> None:
+    with pytest.raises(yaml.YAMLError):
+        load_yaml("!!python/object/apply:os.system ['true']")
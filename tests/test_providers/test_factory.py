@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+"""Unit tests for :func:`backend.providers.factory.create_provider`."""
+
+import json
+import uuid
+
+import pytest
+
+from backend.models.customer import PlatformConnection
+from backend.models.enums import AuthType, Platform
+from backend.providers.azure_devops import AzureDevOpsProvider
+from backend.providers.factory import create_provider
+from backend.providers.github import GitHubProvider
+from backend.providers.gitlab import GitLabProvider
+from backend.services.secrets_service import secrets_service
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _connection(platform: Platform, creds: dict[str, str]) -> PlatformConnection:
+    """Return a transient connection whose credentials encrypt *creds*."""
+    return PlatformConnection(
+        id=uuid.uuid4(),
+        platform=platform,
+        display_name="Test",
+        auth_type=AuthType.token,
+        credentials_encrypted=secrets_service.encrypt(json.dumps(creds)),
+        org_or_group="test-org",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("platform", "provider_cls"),
+    [
+        (Platform.github, GitHubProvider),
+        (Platform.gitlab, GitLabProvider),
+        (Platform.azure_devops, AzureDevOpsProvider),
+    ],
+)
+def test_dispatches_to_platform_provider(platform: Platform, provider_cls: type) -> None:
+    provider = create_provider(_connection(platform, {"token": "secret"}))
+
+    assert isinstance(provider, provider_cls)
+
+
+@pytest.mark.parametrize("platform", list(Platform))
+def test_missing_token_names_the_platform(platform: Platform) -> None:
+    with pytest.raises(ValueError, match="missing the required 'token' key"):
+        create_provider(_connection(platform, {}))
+
+
+def test_invalid_json_raises_value_error() -> None:
+    connection = _connection(Platform.github, {})
+    connection.credentials_encrypted = secrets_service.encrypt("not json")
+
+    with pytest.raises(ValueError, match="not valid JSON"):
+        create_provider(connection)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import re
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 from github import GithubException
 
-from backend.providers.github import GitHubProvider
+from backend.providers.github import (
+    GitHubProvider,
+    _existing_paths,
+    _parse_workflow_file,
+    _probe_query,
+)
 from backend.schemas.platform_data import NormalizedRepo
 
 # ---------------------------------------------------------------------------
@@ -48,10 +54,18 @@ def _make_mock_repo(
     repo.language = language
     repo.created_at = created_at or datetime(2023, 1, 1, tzinfo=UTC)
     repo.updated_at = updated_at or datetime(2024, 6, 1, tzinfo=UTC)
-    repo.get_topics.return_value = topics or []
+    repo.topics = topics or []
     return repo
 
 
+def _paginated(repos: list[MagicMock], per_page: int = 100) -> MagicMock:
+    """Build a MagicMock that mimics a PyGithub ``PaginatedList`` of *repos*."""
+    paginated = MagicMock()
+    paginated.totalCount = len(repos)
+    paginated.get_page.side_effect = lambda page: repos[page * per_page : (page + 1) * per_page]
+    return paginated
+
+
 # ---------------------------------------------------------------------------
 # validate_connection tests
 # ---------------------------------------------------------------------------
@@ -119,7 +133,7 @@ async def test_list_repos_returns_normalized_repos(provider: GitHubProvider) ->
     mock_repo_b = _make_mock_repo(repo_id=2, name="repo-beta", language="Go")
 
     mock_org = MagicMock()
-    mock_org.get_repos.return_value = [mock_repo_a, mock_repo_b]
+    mock_org.get_repos.return_value = _paginated([mock_repo_a, mock_repo_b])
 
     with patch.object(provider._client, "get_organization", return_value=mock_org):
         repos = await provider.list_repos()
@@ -135,7 +149,7 @@ async def test_list_repos_returns_normalized_repos(provider: GitHubProvider) ->
 async def test_list_repos_empty_org(provider: GitHubProvider) -> None:
     """list_repos returns an empty list when the organisation has no repos."""
     mock_org = MagicMock()
-    mock_org.get_repos.return_value = []
+    mock_org.get_repos.return_value = _paginated([])
 
     with patch.object(provider._client, "get_organization", return_value=mock_org):
         repos = await provider.list_repos()
@@ -157,7 +171,7 @@ async def test_list_repos_field_mapping(provider: GitHubProvider) -> None:
         topics=["kubernetes", "microservices"],
     )
     mock_org = MagicMock()
-    mock_org.get_repos.return_value = [mock_repo]
+    mock_org.get_repos.return_value = _paginated([mock_repo])
 
     with patch.object(provider._client, "get_organization", return_value=mock_org):
         repos = await provider.list_repos()
@@ -175,6 +189,21 @@ async def test_list_repos_field_mapping(provider: GitHubProvider) -> None:
     assert set(repo.topics) == {"kubernetes", "microservices"}
 
 
+@pytest.mark.asyncio
+async def test_list_repos_fetches_every_page_in_order(provider: GitHubProvider) -> None:
+    """Repos spread over several pages are all returned, in listing order."""
+    mock_repos = [_make_mock_repo(repo_id=i, name=f"repo-{i}") for i in range(250)]
+    mock_org = MagicMock()
+    mock_org.get_repos.return_value = _paginated(mock_repos)
+
+    with patch.object(provider._client, "get_organization", return_value=mock_org):
+        repos = await provider.list_repos()
+
+    assert [r.name for r in repos] == [f"repo-{i}" for i in range(250)]
+    pages = sorted(c.args[0] for c in mock_org.get_repos.return_value.get_page.call_args_list)
+    assert pages == [0, 1, 2]
+
+
 @pytest.mark.asyncio
 async def test_list_repos_none_default_branch_falls_back_to_main(
     provider: GitHubProvider,
@@ -184,7 +213,7 @@ async def test_list_repos_none_default_branch_falls_back_to_main(
     mock_repo.default_branch = None  # Simulate missing default_branch
 
     mock_org = MagicMock()
-    mock_org.get_repos.return_value = [mock_repo]
+    mock_org.get_repos.return_value = _paginated([mock_repo])
 
     with patch.object(provider._client, "get_organization", return_value=mock_org):
         repos = await provider.list_repos()
@@ -192,6 +221,81 @@ async def test_list_repos_none_default_branch_falls_back_to_main(
     assert repos[0].default_branch == "main"
 
 
+# ---------------------------------------------------------------------------
+# get_repo_assessment_data tests
+# ---------------------------------------------------------------------------
+
+
+_PRESENT = frozenset({"LICENSE", "SECURITY.md"})
+
+
+@pytest.mark.asyncio
+async def test_repo_assessment_combines_concurrent_sub_fetches(provider: GitHubProvider) -> None:
+    """Results of the independent sub-fetches are merged into one record."""
+    gh_repo = MagicMock(full_name="test-org/test-repo")
+
+    def _graphql(query: str, _variables: dict[str, str]) -> tuple[dict, dict]:
+        aliases = re.findall(r'(p\d+): object\(expression: "HEAD:([^"]+)"\)', query)
+        found = {alias: {"__typename": "Blob"} for alias, path in aliases if path in _PRESENT}
+        return {}, {"data": {"repository": found}}
+
+    gh_repo.requester.graphql_query.side_effect = _graphql
+    gh_repo.get_branch.side_effect = GithubException(404, {}, {})
+    gh_repo.get_contents.side_effect = GithubException(404, {}, {})
+    gh_repo.get_codescan_alerts.side_effect = GithubException(404, {}, {})
+    gh_repo.get_pulls.return_value = []
+    repo = NormalizedRepo(
+        external_id="1",
+        name="test-repo",
+        url="https://github.com/test-org/test-repo",
+        default_branch="main",
+        is_private=False,
+    )
+
+    with patch.object(provider._client, "get_repo", return_value=gh_repo):
+        data = await provider.get_repo_assessment_data(repo)
+
+    assert data.has_license is True
+    assert data.has_readme is False
+    assert data.security.has_security_policy is True
+    assert data.security.dependabot_enabled is False
+    assert data.security.secret_scanning_enabled is True
+    assert data.security.code_scanning_enabled is False
+    assert data.branch_protection is None
+    assert data.ci_workflows == []
+    assert data.recent_prs == []
+
+
+# ---------------------------------------------------------------------------
+# Workflow parsing tests
+# ---------------------------------------------------------------------------
+
+
+def _workflow_file(sha: str, content: bytes) -> MagicMock:
+    """Build a MagicMock that mimics a workflow ``ContentFile`` listing entry."""
+    content_file = MagicMock(sha=sha, path=".github/workflows/ci.yml")
+    content_file.name = "ci.yml"
+    type(content_file).decoded_content = PropertyMock(return_value=content)
+    return content_file
+
+
+def test_unchanged_workflow_is_not_downloaded_again() -> None:
+    """A workflow whose blob SHA was seen before is served from the cache."""
+    first = _workflow_file("sha-ci-1", b"name: CI\non: [push]\njobs:\n  t:\n    run: pytest\n")
+    workflow = _parse_workflow_file(first)
+    assert workflow is not None
+    assert workflow.has_tests is True
+
+    again = _workflow_file("sha-ci-1", b"")
+    download = PropertyMock(return_value=b"")
+    type(again).decoded_content = download
+    assert _parse_workflow_file(again) is workflow
+    download.assert_not_called()
+
+    changed = _workflow_file("sha-ci-2", b"name: Lint\non: push\njobs:\n  l:\n    run: ruff\n")
+    assert _parse_workflow_file(changed).has_lint is True
+
+
 # ---------------------------------------------------------------------------
 # Provider construction tests
 # ---------------------------------------------------------------------------
@@ -222,3 +326,44 @@ def test_provider_platform_attribute() -> None:
 
     prov = GitHubProvider(token="tok", org_name="org")
     assert prov.platform == Platform.github
+
+
+# ---------------------------------------------------------------------------
+# Path probe tests
+# ---------------------------------------------------------------------------
+
+
+def test_existing_paths_uses_one_graphql_query() -> None:
+    """All candidate paths resolve in a single GraphQL request."""
+    repo = MagicMock(full_name="test-org/test-repo")
+    repo.requester.graphql_query.return_value = (
+        {},
+        {"data": {"repository": {"p0": None, "p1": {"__typename": "Blob"}, "p2": None}}},
+    )
+
+    present = _existing_paths(repo, [("README", "README.md"), ("docs/adr/",)])
+
+    assert present == {"README.md"}
+    query, variables = repo.requester.graphql_query.call_args.args
+    assert query == _probe_query(("README", "README.md", "docs/adr/"))
+    assert 'p2: object(expression: "HEAD:docs/adr")' in query
+    assert variables == {"owner": "test-org", "name": "test-repo"}
+    repo.get_contents.assert_not_called()
+
+
+def test_existing_paths_falls_back_to_rest() -> None:
+    """Without GraphQL, each group is probed via the Contents API until a hit."""
+    repo = MagicMock(full_name="test-org/test-repo")
+    repo.requester.graphql_query.side_effect = GithubException(403, {}, {})
+
+    def _get_contents(path: str) -> MagicMock:
+        if path != "README.md":
+            raise GithubException(404, {}, {})
+        return MagicMock()
+
+    repo.get_contents.side_effect = _get_contents
+
+    present = _existing_paths(repo, [("README.md", "README"), ("LICENSE",)])
+
+    assert present == {"README.md"}
+    assert [c.args[0] for c in repo.get_contents.call_args_list] == ["README.md", "LICENSE"]
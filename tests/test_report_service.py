@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+"""Tests for the report pipeline in :mod:`backend.services.report_service`."""
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+import backend.reports.generator as generator_module
+from backend.analysis.analyzer import DevOpsAnalyzer
+from backend.analysis.client import AnalysisClient
+from backend.models import Finding, Report, Scan
+from backend.models.enums import Category, CheckStatus, ReportStatus, Severity
+from backend.services import report_service
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _StubGenerator:
+    """Report generator that records its keyword arguments and writes nothing."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.calls: list[dict[str, Any]] = []
+
+    def _record(self, suffix: str, kwargs: dict[str, Any]) -> Path:
+        self.calls.append(kwargs)
+        return self.root / f"report.{suffix}"
+
+    async def generate_report(self, **kwargs: Any) -> Path:
+        return self._record("pdf", kwargs)
+
+    async def generate_excel_report(self, **kwargs: Any) -> Path:
+        return self._record("xlsx", kwargs)
+
+    async def generate_zip_bundle(self, **kwargs: Any) -> Path:
+        return self._record("zip", kwargs)
+
+
+async def _pending_report(db_session: AsyncSession, scan: Scan) -> Report:
+    """Persist one finding and a pending report for the completed *scan*."""
+    db_session.add(
+        Finding(
+            scan_id=scan.id,
+            category=Category.cicd,
+            check_id="CICD-001",
+            check_name="CI pipeline present",
+            severity=Severity.high,
+            status=CheckStatus.passed,
+            weight=1.0,
+            score=1.0,
+        )
+    )
+    report = Report(
+        scan_id=scan.id,
+        customer_id=scan.customer_id,
+        title="Assessment",
+        generated_at=datetime.now(tz=UTC),
+        status=ReportStatus.pending,
+    )
+    db_session.add(report)
+    await db_session.commit()
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_generate_report_uses_narrowed_scan_load(
+    engine: AsyncEngine,
+    db_session: AsyncSession,
+    make_scan: Callable[..., Awaitable[Scan]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The pipeline completes reading only the loaded scan/connection/customer columns."""
+    report = await _pending_report(db_session, await make_scan())
+    stub = _StubGenerator(report_service.settings.reports_root)
+    monkeypatch.setattr(generator_module, "report_generator", stub)
+    # No API key: the analyzer returns its fallback without any network call.
+    offline = DevOpsAnalyzer(client=AnalysisClient(api_key=""))
+    monkeypatch.setattr("backend.analysis.analyzer.get_analyzer", lambda: offline)
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    await report_service.generate_report_for_scan(report.id, factory)
+
+    await db_session.refresh(report)
+    assert report.status == ReportStatus.completed
+    assert (report.pdf_path, report.excel_path, report.zip_path) == (
+        "report.pdf",
+        "report.xlsx",
+        "report.zip",
+    )
+    assert {(c["customer_name"], c["org_name"]) for c in stub.calls} == {("Acme", "acme")}
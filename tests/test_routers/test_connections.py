@@ -145,6 +145,54 @@ async def test_list_connections_isolation(client: AsyncClient) -> None:
     assert resp_b.json() == []
 
 
+@pytest.mark.asyncio
+async def test_list_endpoints_do_not_load_relationships(
+    client: AsyncClient, query_log: list[str]
+) -> None:
+    """Listing customers and connections never loads related rows."""
+    customer = await _create_customer(client)
+    await _add_connection(client, customer["id"], org_or_group="org-a")
+    await _add_connection(client, customer["id"], org_or_group="org-b")
+
+    query_log.clear()
+    resp = await client.get("/api/customers/")
+    assert resp.status_code == 200
+    assert len(query_log) == 1
+
+    query_log.clear()
+    resp = await client.get(f"/api/customers/{customer['id']}/connections")
+    assert resp.status_code == 200
+    assert len(query_log) <= 2
+
+
+@pytest.mark.asyncio
+async def test_list_connections_does_not_select_credentials(
+    client: AsyncClient, query_log: list[str]
+) -> None:
+    """The encrypted credentials blob is deferred out of list queries."""
+    customer = await _create_customer(client)
+    await _add_connection(client, customer["id"])
+
+    query_log.clear()
+    resp = await client.get(f"/api/customers/{customer['id']}/connections")
+    assert resp.status_code == 200
+    assert not any("credentials_encrypted" in sql for sql in query_log)
+
+
+@pytest.mark.asyncio
+async def test_update_connection_credentials(client: AsyncClient) -> None:
+    """PUT /connections/{id} re-encrypts credentials without loading the old ones."""
+    customer = await _create_customer(client)
+    connection = await _add_connection(client, customer["id"])
+
+    resp = await client.put(
+        f"/api/connections/{connection['id']}",
+        json={"credentials": "rotated-token"},
+    )
+    assert resp.status_code == 200
+    assert "credentials" not in resp.json()
+
+
 @pytest.mark.asyncio
 async def test_delete_connection(client: AsyncClient) -> None:
     """DELETE /connections/{id} removes the connection record."""
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+"""Per-endpoint SQL query budgets for the read API.
+
+Every relationship is ``lazy="raise_on_sql"``, so an N+1 normally fails
+loudly.  These budgets additionally catch regressions that stay legal, such
+as a per-row query added to a loop.  The seeded data has several rows of
+each kind so that any per-row query pushes an endpoint over its budget.
+"""
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import Finding, Report, Scan, ScanScore
+from backend.models.enums import Category, CheckStatus, ReportStatus, Severity
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_SCANS = 3
+_FINDINGS_PER_SCAN = 4
+
+
+@pytest_asyncio.fixture()
+async def seeded(
+    db_session: AsyncSession, make_scan: Callable[..., Awaitable[Scan]]
+) -> dict[str, str]:
+    """Persist one customer with several scans, findings, scores and reports.
+
+    Returns the IDs used to build endpoint paths.
+    """
+    scans: list[Scan] = []
+    reports: list[Report] = []
+    for _ in range(_SCANS):
+        scan = await make_scan()
+        scans.append(scan)
+        for i in range(_FINDINGS_PER_SCAN):
+            db_session.add(
+                Finding(
+                    scan_id=scan.id,
+                    category=Category.cicd,
+                    check_id=f"CICD-00{i}",
+                    check_name=f"Check {i}",
+                    severity=Severity.medium,
+                    status=CheckStatus.passed,
+                    weight=1.0,
+                    score=1.0,
+                )
+            )
+        db_session.add(
+            ScanScore(
+                scan_id=scan.id,
+                category=Category.cicd,
+                score=4.0,
+                max_score=4.0,
+                weight=0.1,
+                finding_count=_FINDINGS_PER_SCAN,
+                pass_count=_FINDINGS_PER_SCAN,
+                fail_count=0,
+            )
+        )
+        report = Report(
+            scan_id=scan.id,
+            customer_id=scan.customer_id,
+            title="Assessment",
+            generated_at=datetime.now(tz=UTC),
+            status=ReportStatus.completed,
+        )
+        db_session.add(report)
+        reports.append(report)
+
+    await db_session.commit()
+    return {
+        "customer_id": str(scans[0].customer_id),
+        "scan_id": str(scans[0].id),
+        "report_id": str(reports[0].id),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("path", "budget"),
+    [
+        ("/api/customers/", 1),
+        ("/api/customers/{customer_id}", 1),
+        ("/api/customers/{customer_id}/connections", 2),
+        ("/api/customers/{customer_id}/scans", 2),
+        ("/api/customers/{customer_id}/reports", 2),
+        ("/api/scans/{scan_id}", 1),
+        ("/api/scans/{scan_id}/findings", 2),
+        ("/api/scans/{scan_id}/scores", 2),
+        ("/api/reports/{report_id}", 1),
+        ("/api/dashboard/recent-scans", 1),
+        ("/api/dashboard/stats", 4),
+    ],
+)
+async def test_endpoint_query_budget(
+    client: AsyncClient,
+    seeded: dict[str, str],
+    query_log: list[str],
+    path: str,
+    budget: int,
+) -> None:
+    """Each read endpoint stays within its query budget."""
+    query_log.clear()
+    resp = await client.get(path.format(**seeded))
+
+    assert resp.status_code == 200, resp.text
+    assert len(query_log) <= budget, "\n\n".join(query_log)
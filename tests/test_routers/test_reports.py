@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+"""Tests for the report download endpoints."""
+
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import Settings, get_settings
+from backend.main import app
+from backend.models import Report, Scan
+from backend.models.enums import ReportStatus
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def reports_settings(tmp_path: Path) -> Iterator[Settings]:
+    """Serve downloads from a temporary ``REPORTS_DIR``."""
+    test_settings = Settings(REPORTS_DIR=str(tmp_path))
+    app.dependency_overrides[get_settings] = lambda: test_settings
+    yield test_settings
+    app.dependency_overrides.pop(get_settings, None)
+
+
+async def _report(db_session: AsyncSession, scan: Scan, pdf_path: str) -> Report:
+    """Persist a completed report for *scan* whose PDF is stored at *pdf_path*."""
+    report = Report(
+        scan_id=scan.id,
+        customer_id=scan.customer_id,
+        title="Assessment",
+        generated_at=datetime.now(tz=UTC),
+        status=ReportStatus.completed,
+        pdf_path=pdf_path,
+    )
+    db_session.add(report)
+    await db_session.commit()
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_download_resolves_relative_path_under_reports_root(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    make_scan: Callable[..., Awaitable[Scan]],
+    reports_settings: Settings,
+) -> None:
+    """A stored relative pdf_path is served from the configured reports root."""
+    (reports_settings.reports_root / "acme.pdf").write_bytes(b"%PDF-1.7 test")
+    report = await _report(db_session, await make_scan(), "acme.pdf")
+
+    resp = await client.get(f"/api/reports/{report.id}/download")
+
+    assert resp.status_code == 200
+    assert resp.content == b"%PDF-1.7 test"
+
+
+@pytest.mark.asyncio
+async def test_download_missing_file_is_404(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    make_scan: Callable[..., Awaitable[Scan]],
+    reports_settings: Settings,
+) -> None:
+    """A recorded path with no file on disk returns 404."""
+    report = await _report(db_session, await make_scan(), "missing.pdf")
+
+    resp = await client.get(f"/api/reports/{report.id}/download")
+
+    assert resp.status_code == 404
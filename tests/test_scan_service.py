@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+"""Tests for the scan pipeline in :mod:`backend.services.scan_service`."""
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import Finding, Scan, ScanRepo
+from backend.models.enums import ScanStatus
+from backend.schemas.platform_data import NormalizedRepo, OrgAssessmentData, RepoAssessmentData
+from backend.services import scan_service
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _repo(name: str) -> NormalizedRepo:
+    """Return a minimal :class:`NormalizedRepo` named *name*."""
+    return NormalizedRepo(
+        external_id=name,
+        name=name,
+        url=f"https://github.com/acme/{name}",
+        default_branch="main",
+        is_private=False,
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+        updated_at=datetime(2024, 6, 1, tzinfo=UTC),
+    )
+
+
+class _StubProvider:
+    """Provider returning an unconfigured org and repositories."""
+
+    def __init__(self, repo_names: list[str]) -> None:
+        self._repos = [_repo(name) for name in repo_names]
+
+    async def get_org_assessment_data(self) -> OrgAssessmentData:
+        return OrgAssessmentData(org_name="acme")
+
+    async def list_repos(self) -> list[NormalizedRepo]:
+        return self._repos
+
+    async def get_repo_assessment_data(self, repo: NormalizedRepo) -> RepoAssessmentData:
+        return RepoAssessmentData(repo=repo)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_execute_scan_bulk_inserts_findings(
+    db_session: AsyncSession,
+    make_scan: Callable[..., Awaitable[Scan]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Org- and repo-level findings are all persisted against the right rows."""
+    scan = await make_scan(ScanStatus.pending)
+    await db_session.commit()
+    monkeypatch.setattr(
+        scan_service, "create_provider", lambda _conn: _StubProvider(["api", "web"])
+    )
+
+    await scan_service._execute_scan(scan.id, db_session)
+    await db_session.commit()
+
+    assert scan.status == ScanStatus.completed
+    repo_ids = (
+        await db_session.scalars(select(ScanRepo.id).where(ScanRepo.scan_id == scan.id))
+    ).all()
+    assert len(repo_ids) == 2
+
+    counts = dict(
+        (
+            await db_session.execute(
+                select(Finding.scan_repo_id, func.count())
+                .where(Finding.scan_id == scan.id)
+                .group_by(Finding.scan_repo_id)
+            )
+        ).all()
+    )
+    assert set(counts) == {None, *repo_ids}
+    assert counts[repo_ids[0]] == counts[repo_ids[1]] > 0
+
+
+@pytest.mark.asyncio
+async def test_findings_endpoint_serves_bulk_inserted_rows(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    make_scan: Callable[..., Awaitable[Scan]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """GET /scans/{id}/findings filters and serialises finding rows."""
+    scan = await make_scan(ScanStatus.pending)
+    await db_session.commit()
+    monkeypatch.setattr(scan_service, "create_provider", lambda _conn: _StubProvider(["api"]))
+    await scan_service._execute_scan(scan.id, db_session)
+    await db_session.commit()
+    total = await db_session.scalar(
+        select(func.count()).select_from(Finding).where(Finding.scan_id == scan.id)
+    )
+
+    resp = await client.get(f"/api/scans/{scan.id}/findings", params={"status": "failed"})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert 0 < len(body) < total
+    assert {f["status"] for f in body} == {"failed"}
+    assert all(f["scan_id"] == str(scan.id) for f in body)
+
+
+@pytest.mark.asyncio
+async def test_execute_scan_flushes_repo_batches(
+    db_session: AsyncSession,
+    make_scan: Callable[..., Awaitable[Scan]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repos spanning several insert batches keep their findings attached."""
+    scan = await make_scan(ScanStatus.pending)
+    await db_session.commit()
+    names = ["api", "web", "cli"]
+    monkeypatch.setattr(scan_service, "_INSERT_BATCH_REPOS", 2)
+    monkeypatch.setattr(scan_service, "create_provider", lambda _conn: _StubProvider(names))
+
+    await scan_service._execute_scan(scan.id, db_session)
+    await db_session.commit()
+
+    rows = (
+        await db_session.execute(
+            select(ScanRepo.repo_name, func.count(Finding.id))
+            .join(Finding, Finding.scan_repo_id == ScanRepo.id)
+            .where(ScanRepo.scan_id == scan.id)
+            .group_by(ScanRepo.repo_name)
+        )
+    ).all()
+    assert scan.total_repos == len(names)
+    assert {name for name, _ in rows} == set(names)
+    assert len({count for _, count in rows}) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_scan_records_repeated_repo_once(
+    db_session: AsyncSession,
+    make_scan: Callable[..., Awaitable[Scan]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A repository listed twice by the provider yields a single ScanRepo."""
+    scan = await make_scan(ScanStatus.pending)
+    await db_session.commit()
+    monkeypatch.setattr(
+        scan_service, "create_provider", lambda _conn: _StubProvider(["api", "web", "api"])
+    )
+
+    await scan_service._execute_scan(scan.id, db_session)
+    await db_session.commit()
+
+    names = (
+        await db_session.scalars(select(ScanRepo.repo_name).where(ScanRepo.scan_id == scan.id))
+    ).all()
+    assert scan.status == ScanStatus.completed
+    assert sorted(names) == ["api", "web"]
+    assert scan.total_repos == 2